@@ -1,8 +1,5 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
 import sys
@@ -12,13 +9,40 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # 사용자 정의 모듈 import
+# (plotly, API 클라이언트, 예보 아카이브(pyarrow.dataset)는 사용하는 페이지/그래프에서만 import)
 from src.data_processing import (
-    load_all_csv_files, 
-    preprocess_weather_data,
+    load_processed_data,
     get_yearly_summary,
     get_monthly_summary
 )
-from src.api_client import get_guam_forecast
+from src.aggregates import get_aggregate_cube, select_cube, cube_summary, set_data_version
+from src.stations import STATION_COLUMN
+from src.accumulators import RunningStats, get_weather_accumulator
+from src.climatology import ROLLING_WINDOWS, get_climatology
+from src.weather_store import DailyWeatherStore
+from src.sql_store import get_sql_store
+from src.figure_cache import FigureCache, cached_plotly_json
+from src.instrumentation import (
+    instrument,
+    span,
+    enable,
+    disable,
+    is_enabled,
+    reset as reset_metrics,
+    export_json,
+    export_prometheus,
+    stage_table
+)
+from src.anomalies import ANOMALY_METHODS, detect_anomalies
+from src.trends import get_trend_table, trend_for
+from src.downsampling import (
+    DOWNSAMPLE_THRESHOLD,
+    downsample_line,
+    histogram_bins,
+    box_statistics,
+    estimate_payload_bytes,
+    payload_bytes
+)
 
 # 페이지 설정
 st.set_page_config(
@@ -55,12 +79,13 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 @st.cache_data
+@instrument(stage="app.load_data")
 def load_data():
     """데이터 로딩 및 전처리"""
     try:
-        # CSV 파일들 로드 (tuple에서 DataFrame만 추출)
-        df, _ = load_all_csv_files('data')
-        df = preprocess_weather_data(df)
+        # CSV 파일들 로드 및 전처리 (변경이 없으면 Parquet 캐시 사용)
+        # 세션마다 데이터를 보관하므로 float32/int8 압축 형태로 로드
+        df = load_processed_data('data', compact=True)
         
         # Streamlit 앱에서 기대하는 컬럼명으로 매핑
         df = df.rename(columns={
@@ -75,11 +100,70 @@ def load_data():
         st.error(f"데이터 로딩 중 오류 발생: {e}")
         return pd.DataFrame()
 
-@st.cache_data
+@st.cache_resource
+def load_store(station=None):
+    """날짜 인덱스 저장소 생성 (모든 세션이 같은 객체를 공유하므로 페이지에서 수정하지 않음)
+    
+    여러 관측소 데이터면 station 하나의 일별 시계열만 담는다 (전체 저장소에서 잘라내므로 데이터는 한 번만 로딩).
+    """
+    if station is None:
+        df = load_data()
+        return DailyWeatherStore(df) if not df.empty else None
+    
+    full_store = load_store()
+    if full_store is None or STATION_COLUMN not in full_store.df.columns:
+        return full_store
+    version = full_store.df.attrs.get("data_version")
+    df = full_store.df[full_store.df[STATION_COLUMN] == station]
+    # 관측소별 집계/누적 캐시가 서로 섞이지 않도록 데이터 버전에 관측소 포함
+    set_data_version(df, f"{version}:{station}" if version else None)
+    return DailyWeatherStore(df)
+
+@st.cache_resource
+def get_station_names(data_version):
+    """데이터에 있는 관측소 목록 (데이터 버전별로 한 번만 계산)"""
+    df = load_store().df
+    return sorted(df[STATION_COLUMN].unique()) if STATION_COLUMN in df.columns else []
+
+@st.cache_resource
+def load_sql_store(data_version):
+    """일별 데이터 SQLite 저장소 (데이터 버전별로 한 번만 동기화, DataFrame을 캐시 인자로 해시하지 않음)"""
+    return get_sql_store(load_store().df)
+
+@st.cache_resource
+def get_figure_cache():
+    """Plotly 그래프 캐시 (모든 세션이 공유, 디스크에 저장해서 재시작 후에도 재사용)"""
+    return FigureCache(os.path.join(".cache", "figures", "plotly"), max_bytes=32 * 1024 * 1024)
+
+def show_cached_chart(name, data, build, **params):
+    """입력 데이터와 옵션이 같으면 캐시된 그림(JSON)을 다시 쓰고, 아니면 build()로 새로 그림
+    
+    build가 data 밖의 값(제목에 들어가는 월 등)을 쓰면 params로 함께 넘겨 캐시 키에 포함한다.
+    """
+    with span(f"app.chart.{name}"):
+        figure_json = cached_plotly_json(get_figure_cache(), name, data, build, **params)
+        import plotly.io as pio
+        st.plotly_chart(pio.from_json(figure_json), use_container_width=True)
+    return payload_bytes(figure_json)
+
+def show_payload_caption(original_data, shown_data, shown_points, sent_bytes):
+    """다운샘플링 전과 후(실제 전송한 그림 JSON)의 점 개수/크기 표시
+    
+    원본 그림 크기는 직렬화하지 않고 전송한 그림에서 값 배열 크기만 바꿔 끼운 추정치다.
+    """
+    original_bytes = sent_bytes - estimate_payload_bytes(shown_data) + estimate_payload_bytes(original_data)
+    st.caption(f"📦 {len(original_data):,}개 점 → {shown_points:,}개 · "
+               f"전송 데이터 약 {original_bytes / 1024:,.0f}KB → {sent_bytes / 1024:,.0f}KB")
+
+@st.cache_data(ttl=300)
 def get_api_data():
-    """API 데이터 가져오기"""
+    """API 데이터 가져오기 (예보 응답 자체는 api_client의 캐시가 갱신 시각 기준으로 관리)"""
+    from src.api_client import get_guam_forecast
+    from src.forecast_archive import ForecastArchive
+    
     try:
-        forecast_data = get_guam_forecast()
+        # 조회한 예보는 발표 시각별 스냅샷으로 누적 (같은 발표분은 한 번만 저장)
+        forecast_data = get_guam_forecast(archive=ForecastArchive())
         if forecast_data is not None:
             # 컬럼명을 표준화
             forecast_data = forecast_data.rename(columns={
@@ -96,19 +180,30 @@ def main():
     st.markdown('<div class="main-header">🌴 괌 날씨 분석 대시보드</div>', unsafe_allow_html=True)
     st.markdown("---")
     
-    # 데이터 로딩
+    # 데이터 로딩 (모든 세션이 공유하는 저장소, 다시 실행할 때 데이터를 복사하지 않음)
     with st.spinner('📊 데이터를 로딩 중입니다...'):
-        df = load_data()
-        
-    if df.empty:
+        full_store = load_store()
+    
+    if full_store is None or len(full_store) == 0:
         st.error("데이터를 로드할 수 없습니다. data 폴더에 CSV 파일이 있는지 확인해주세요.")
         return
+    all_df = full_store.df
+    data_version = all_df.attrs.get("data_version")
     
     # 사이드바 설정
     st.sidebar.header("🎛️ 대시보드 설정")
     
+    # 관측소 선택 (data/station=<관측소>/ 구조로 여러 관측소가 있을 때만)
+    stations = get_station_names(data_version)
+    selected_station = None
+    if len(stations) > 1:
+        selected_station = st.sidebar.selectbox("📍 관측소 선택", options=stations, index=0)
+    
+    store = load_store(selected_station)
+    df = store.df
+    
     # 연도 선택
-    available_years = sorted(df['Year'].unique())
+    available_years = store.years
     selected_year = st.sidebar.selectbox(
         "📅 분석할 연도 선택", 
         options=['전체'] + available_years,
@@ -129,62 +224,107 @@ def main():
         ["전체 개요", "기온 분석", "강수량 분석", "실시간 예보", "기후 변화"]
     )
     
-    # 데이터 필터링
-    filtered_df = df.copy()
-    if selected_year != '전체':
-        filtered_df = filtered_df[filtered_df['Year'] == selected_year]
-    if selected_month != '전체':
-        filtered_df = filtered_df[filtered_df['Month'] == selected_month]
+    # 성능 계측 (켜면 사이드바에 단계별 실행 시간 패널 표시, 끄면 계측 비용 없음)
+    profiling = st.sidebar.checkbox("🐞 성능 계측", value=is_enabled(),
+                                    help="데이터 처리/API/그래프 단계별 실행 시간, 행 수, 읽은 바이트, 메모리 변화량 기록")
+    if profiling != is_enabled():
+        enable() if profiling else disable()
+    
+    # 데이터 필터링 (정렬된 날짜 인덱스에서 구간 슬라이스로 선택, 복사 없음)
+    year_filter = None if selected_year == '전체' else selected_year
+    month_filter = None if selected_month == '전체' else selected_month
+    filtered_df = store.select(year=year_filter, month=month_filter)
+    
+    # (Year, Month) 집계 큐브 (데이터 버전별로 한 번만 계산)
+    cube = get_aggregate_cube(df)
+    filtered_cube = select_cube(cube, year=year_filter, month=month_filter)
+    
+    # (Year, Month)별 누적 통계 (평균/표준편차/극값을 일별 행 재계산 없이 셀 병합으로 얻음)
+    stats = get_weather_accumulator(df)
+    filtered_stats = stats.select(year=year_filter, month=month_filter)
+    
+    # 이동 구간/평년값 엔진 (전체 기간 누적합, 필터 구간 앞쪽도 이전 데이터로 계산)
+    climatology = get_climatology(df, ['AvgTemp_C', 'Precipitation_mm'])
+    
+    # 일별 데이터 SQLite 저장소 (데이터가 바뀔 때만 다시 적재, 집계는 SQL로 실행해서 결과 행만 읽음)
+    sql_store = load_sql_store(data_version)
+    query_filters = {'station': selected_station, 'year': year_filter, 'month': month_filter}
     
     # 메인 콘텐츠
     if analysis_type == "전체 개요":
-        show_overview(filtered_df, df)
+        # 관측소가 여러 개면 전체 관측소 큐브로 관측소별 비교 (관측소마다 반복하지 않고 한 번에 집계)
+        station_cube = get_aggregate_cube(all_df) if len(stations) > 1 else None
+        show_overview(filtered_cube, cube, filtered_stats, stats, station_cube)
     elif analysis_type == "기온 분석":
-        show_temperature_analysis(filtered_df)
+        show_temperature_analysis(filtered_df, climatology)
     elif analysis_type == "강수량 분석":
-        show_precipitation_analysis(filtered_df)
+        show_precipitation_analysis(filtered_df, filtered_cube, climatology, sql_store, query_filters)
     elif analysis_type == "실시간 예보":
-        show_forecast_analysis(df)
+        show_forecast_analysis(stats)
     elif analysis_type == "기후 변화":
-        show_climate_change_analysis(df)
+        show_climate_change_analysis(df, cube)
+    
+    if profiling:
+        show_debug_panel()
+
+def show_debug_panel():
+    """사이드바 성능 계측 패널 (서버 프로세스 전체 누적값, JSON/Prometheus 내려받기)"""
+    with st.sidebar.expander("🐞 단계별 실행 시간", expanded=True):
+        table = stage_table()
+        if table.empty:
+            st.caption("아직 기록된 단계가 없습니다. 페이지를 다시 실행하면 기록됩니다.")
+        else:
+            shown = table[['calls', 'seconds_total', 'seconds_last', 'rows_total', 'bytes_read_total', 'memory_delta_max']]
+            shown.columns = ['호출', '전체(초)', '최근(초)', '행', '읽은 바이트', '메모리 증가']
+            st.dataframe(shown.round(4), use_container_width=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("JSON", export_json(), file_name="guam_weather_metrics.json", mime="application/json")
+        with col2:
+            st.download_button("Prometheus", export_prometheus(), file_name="guam_weather_metrics.prom",
+                               mime="text/plain")
+        st.button("기록 초기화", on_click=reset_metrics)
 
-def show_overview(filtered_df, full_df):
-    """전체 개요 페이지"""
+@instrument(stage="app.show_overview", rows=None)
+def show_overview(filtered_cube, full_cube, filtered_stats, full_stats, station_cube=None):
+    """전체 개요 페이지 (지표는 누적 통계, 그래프는 (Year, Month) 집계 큐브 사용)"""
     st.header("📊 괌 날씨 전체 개요")
     
     # 주요 통계
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        avg_temp = filtered_df['AvgTemp_C'].mean()
+        avg_temp = filtered_stats.total('AvgTemp_C').mean
         st.metric(
             label="🌡️ 평균 기온",
             value=f"{avg_temp:.1f}°C",
-            delta=f"{avg_temp - full_df['AvgTemp_C'].mean():.1f}°C"
+            delta=f"{avg_temp - full_stats.total('AvgTemp_C').mean:.1f}°C"
         )
     
     with col2:
-        total_precip = filtered_df['Precipitation_mm'].sum()
+        total_precip = filtered_stats.total('Precipitation_mm').sum
+        monthly_precip_mean = full_stats.group_stats('Precipitation_mm')['sum'].mean()
         st.metric(
             label="🌧️ 총 강수량",
             value=f"{total_precip:.0f}mm",
-            delta=f"{total_precip - full_df.groupby(['Year', 'Month'])['Precipitation_mm'].sum().mean():.0f}mm"
+            delta=f"{total_precip - monthly_precip_mean:.0f}mm"
         )
     
     with col3:
-        max_temp = filtered_df['MaxTemp_C'].max()
+        max_temp = filtered_stats.total('MaxTemp_C').max
         st.metric(
             label="🔥 최고 기온",
             value=f"{max_temp:.1f}°C",
-            delta=f"{max_temp - full_df['MaxTemp_C'].max():.1f}°C"
+            delta=f"{max_temp - full_stats.total('MaxTemp_C').max:.1f}°C"
         )
     
     with col4:
-        min_temp = filtered_df['MinTemp_C'].min()
+        min_temp = filtered_stats.total('MinTemp_C').min
         st.metric(
             label="❄️ 최저 기온",
             value=f"{min_temp:.1f}°C",
-            delta=f"{min_temp - full_df['MinTemp_C'].min():.1f}°C"
+            delta=f"{min_temp - full_stats.total('MinTemp_C').min:.1f}°C"
         )
     
     st.markdown("---")
@@ -194,53 +334,98 @@ def show_overview(filtered_df, full_df):
     
     with col1:
         st.subheader("📈 월별 기온 변화")
-        monthly_temp = filtered_df.groupby('Month')[['AvgTemp_C', 'MaxTemp_C', 'MinTemp_C']].mean().reset_index()
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=monthly_temp['Month'], y=monthly_temp['MaxTemp_C'], 
-                                mode='lines+markers', name='최고기온', line=dict(color='red')))
-        fig.add_trace(go.Scatter(x=monthly_temp['Month'], y=monthly_temp['AvgTemp_C'], 
-                                mode='lines+markers', name='평균기온', line=dict(color='blue')))
-        fig.add_trace(go.Scatter(x=monthly_temp['Month'], y=monthly_temp['MinTemp_C'], 
-                                mode='lines+markers', name='최저기온', line=dict(color='lightblue')))
-        
-        fig.update_layout(title="월별 기온 변화", xaxis_title="월", yaxis_title="기온 (°C)", height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        monthly_temp = cube_summary(filtered_cube, {
+            'AvgTemp_C': 'mean',
+            'MaxTemp_C': 'mean',
+            'MinTemp_C': 'mean'
+        }, by=['Month'])
+        
+        def build():
+            import plotly.graph_objects as go
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=monthly_temp['Month'], y=monthly_temp['MaxTemp_C'], 
+                                    mode='lines+markers', name='최고기온', line=dict(color='red')))
+            fig.add_trace(go.Scatter(x=monthly_temp['Month'], y=monthly_temp['AvgTemp_C'], 
+                                    mode='lines+markers', name='평균기온', line=dict(color='blue')))
+            fig.add_trace(go.Scatter(x=monthly_temp['Month'], y=monthly_temp['MinTemp_C'], 
+                                    mode='lines+markers', name='최저기온', line=dict(color='lightblue')))
+            
+            fig.update_layout(title="월별 기온 변화", xaxis_title="월", yaxis_title="기온 (°C)", height=400)
+            return fig
+        show_cached_chart("overview_monthly_temperature", monthly_temp, build)
     
     with col2:
         st.subheader("💧 월별 강수량")
-        monthly_precip = filtered_df.groupby('Month')['Precipitation_mm'].sum().reset_index()
+        monthly_precip = cube_summary(filtered_cube, {'Precipitation_mm': 'sum'}, by=['Month'])
         
-        fig = px.bar(monthly_precip, x='Month', y='Precipitation_mm', 
-                    title="월별 총 강수량", color='Precipitation_mm',
-                    color_continuous_scale='Blues')
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        def build():
+            import plotly.express as px
+            fig = px.bar(monthly_precip, x='Month', y='Precipitation_mm', 
+                        title="월별 총 강수량", color='Precipitation_mm',
+                        color_continuous_scale='Blues')
+            fig.update_layout(height=400)
+            return fig
+        show_cached_chart("overview_monthly_precipitation", monthly_precip, build)
     
     # 연도별 비교 (전체 데이터가 있을 때만)
-    if len(full_df['Year'].unique()) > 1:
+    if full_cube.index.get_level_values('Year').nunique() > 1:
         st.subheader("📅 연도별 기후 비교")
-        yearly_summary = full_df.groupby('Year').agg({
+        yearly_summary = cube_summary(full_cube, {
             'AvgTemp_C': 'mean',
             'Precipitation_mm': 'sum'
-        }).reset_index()
+        }, by=['Year'])
         
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = px.line(yearly_summary, x='Year', y='AvgTemp_C', 
-                         title="연도별 평균 기온 변화", markers=True)
-            fig.update_layout(yaxis_title="평균 기온 (°C)")
-            st.plotly_chart(fig, use_container_width=True)
+            def build():
+                import plotly.express as px
+                fig = px.line(yearly_summary, x='Year', y='AvgTemp_C', 
+                             title="연도별 평균 기온 변화", markers=True)
+                fig.update_layout(yaxis_title="평균 기온 (°C)")
+                return fig
+            show_cached_chart("overview_yearly_temperature", yearly_summary, build)
         
         with col2:
-            fig = px.bar(yearly_summary, x='Year', y='Precipitation_mm', 
-                        title="연도별 총 강수량", color='Precipitation_mm',
-                        color_continuous_scale='Blues')
-            fig.update_layout(yaxis_title="총 강수량 (mm)")
-            st.plotly_chart(fig, use_container_width=True)
+            def build():
+                import plotly.express as px
+                fig = px.bar(yearly_summary, x='Year', y='Precipitation_mm', 
+                            title="연도별 총 강수량", color='Precipitation_mm',
+                            color_continuous_scale='Blues')
+                fig.update_layout(yaxis_title="총 강수량 (mm)")
+                return fig
+            show_cached_chart("overview_yearly_precipitation", yearly_summary, build)
+    
+    # 관측소별 비교 (여러 관측소 데이터일 때만)
+    if station_cube is not None:
+        st.subheader("📍 관측소별 비교")
+        station_summary = cube_summary(station_cube, {
+            'AvgTemp_C': 'mean',
+            'Precipitation_mm': 'sum'
+        }, by=[STATION_COLUMN, 'Year'])
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            def build():
+                import plotly.express as px
+                fig = px.line(station_summary, x='Year', y='AvgTemp_C', color=STATION_COLUMN,
+                             title="관측소별 연평균 기온", markers=True)
+                fig.update_layout(yaxis_title="평균 기온 (°C)")
+                return fig
+            show_cached_chart("overview_station_temperature", station_summary, build)
+        
+        with col2:
+            def build():
+                import plotly.express as px
+                fig = px.bar(station_summary, x='Year', y='Precipitation_mm', color=STATION_COLUMN,
+                            barmode='group', title="관측소별 연간 강수량")
+                fig.update_layout(yaxis_title="총 강수량 (mm)")
+                return fig
+            show_cached_chart("overview_station_precipitation", station_summary, build)
 
-def show_temperature_analysis(df):
+@instrument(stage="app.show_temperature_analysis", rows=None)
+def show_temperature_analysis(df, climatology):
     """기온 분석 페이지"""
     st.header("🌡️ 기온 상세 분석")
     
@@ -248,52 +433,140 @@ def show_temperature_analysis(df):
     st.subheader("📊 기온 분포")
     col1, col2 = st.columns(2)
     
+    # 점이 많으면 구간 개수/사분위수만 미리 계산해서 전송
+    downsample = len(df) > DOWNSAMPLE_THRESHOLD
+    
     with col1:
-        fig = px.histogram(df, x='AvgTemp_C', nbins=30, title="평균 기온 분포",
-                          color_discrete_sequence=['skyblue'])
-        fig.update_layout(xaxis_title="평균 기온 (°C)", yaxis_title="빈도")
-        st.plotly_chart(fig, use_container_width=True)
+        def build_full():
+            import plotly.express as px
+            fig = px.histogram(df, x='AvgTemp_C', nbins=30, title="평균 기온 분포",
+                              color_discrete_sequence=['skyblue'])
+            fig.update_layout(xaxis_title="평균 기온 (°C)", yaxis_title="빈도")
+            return fig
+        
+        if downsample:
+            counts, edges = histogram_bins(df['AvgTemp_C'], nbins=30)
+            bins = pd.DataFrame({'start': edges[:-1], 'end': edges[1:], 'count': counts})
+            
+            def build():
+                import plotly.graph_objects as go
+                fig = go.Figure(go.Bar(x=(bins['start'] + bins['end']) / 2, y=bins['count'],
+                                       width=bins['end'] - bins['start'], marker_color='skyblue'))
+                fig.update_layout(title="평균 기온 분포", xaxis_title="평균 기온 (°C)", yaxis_title="빈도", bargap=0)
+                return fig
+            sent_bytes = show_cached_chart("temperature_histogram_binned", bins, build)
+            show_payload_caption(df['AvgTemp_C'], bins, len(bins), sent_bytes)
+        else:
+            show_cached_chart("temperature_histogram", df['AvgTemp_C'], build_full)
     
     with col2:
-        fig = px.box(df, y='AvgTemp_C', title="평균 기온 박스플롯")
-        st.plotly_chart(fig, use_container_width=True)
+        def build_full():
+            import plotly.express as px
+            return px.box(df, y='AvgTemp_C', title="평균 기온 박스플롯")
+        
+        if downsample:
+            box = box_statistics(df['AvgTemp_C'])
+            
+            def build():
+                import plotly.graph_objects as go
+                fig = go.Figure(go.Box(
+                    name='AvgTemp_C', q1=[box['q1']], median=[box['median']], q3=[box['q3']],
+                    mean=[box['mean']], lowerfence=[box['lowerfence']], upperfence=[box['upperfence']]
+                ))
+                # 이상치만 점으로 추가
+                fig.add_trace(go.Scatter(x=['AvgTemp_C'] * len(box['outliers']), y=box['outliers'],
+                                         mode='markers', marker=dict(color='#636EFA'), showlegend=False))
+                fig.update_layout(title="평균 기온 박스플롯", showlegend=False)
+                return fig
+            sent_bytes = show_cached_chart("temperature_box_quartiles", list(box.values()), build)
+            show_payload_caption(df['AvgTemp_C'], list(box.values()), 6 + len(box['outliers']), sent_bytes)
+        else:
+            show_cached_chart("temperature_box", df['AvgTemp_C'], build_full)
+    
+    # 일별 기온 추이 (점이 많으면 LTTB로 모양을 유지하며 축소)
+    st.subheader("📉 일별 평균 기온 추이")
+    dates, temps = downsample_line(df['Date'].to_numpy(), df['AvgTemp_C'].to_numpy())
+    trend = pd.DataFrame({'Date': dates, 'AvgTemp_C': temps})
+    
+    def build():
+        import plotly.graph_objects as go
+        fig = go.Figure(go.Scatter(x=trend['Date'], y=trend['AvgTemp_C'], mode='lines',
+                                   line=dict(color='orange', width=1), name='평균기온'))
+        fig.update_layout(xaxis_title="날짜", yaxis_title="평균 기온 (°C)", height=350)
+        return fig
+    sent_bytes = show_cached_chart("temperature_daily_trend", trend, build)
+    if len(trend) < len(df):
+        show_payload_caption(df[['Date', 'AvgTemp_C']], trend, len(trend), sent_bytes)
+    
+    # 이동 평균과 평년값 (누적합 차이로 날짜당 O(1) 계산)
+    st.subheader("📊 이동 평균과 평년값")
+    start, end = df['Date'].min(), df['Date'].max()
+    rolling_temp = climatology.rolling_frame('AvgTemp_C', ROLLING_WINDOWS, 'mean', start, end)
+    rolling_temp['평년값'] = climatology.normal('AvgTemp_C', rolling_temp['Date'])
+    
+    def build():
+        import plotly.graph_objects as go
+        fig = go.Figure()
+        colors = {'7일': 'orange', '30일': 'red', '90일': 'darkred', '평년값': 'gray'}
+        for column, color in colors.items():
+            fig.add_trace(go.Scatter(x=rolling_temp['Date'], y=rolling_temp[column], mode='lines',
+                                     name=column if column == '평년값' else f"{column} 이동 평균",
+                                     line=dict(color=color, dash='dash' if column == '평년값' else 'solid')))
+        fig.update_layout(xaxis_title="날짜", yaxis_title="평균 기온 (°C)", height=400)
+        return fig
+    show_cached_chart("temperature_rolling_normals", rolling_temp, build)
+    
+    latest = climatology.window('AvgTemp_C', end, 30)
+    latest_normal = climatology.normal_range('AvgTemp_C', end - pd.Timedelta(days=29), end)
+    st.caption(f"최근 30일 평균 {latest:.1f}°C · 같은 기간 평년값 {latest_normal:.1f}°C "
+               f"({latest - latest_normal:+.1f}°C)")
     
     # 기온 범위 분석
     st.subheader("📏 기온 범위 분석")
-    df['TempRange'] = df['MaxTemp_C'] - df['MinTemp_C']
+    # (공유 데이터를 수정하지 않도록 컬럼 대신 별도 Series로 계산)
+    temp_range = (df['MaxTemp_C'] - df['MinTemp_C']).rename('TempRange')
     
     col1, col2 = st.columns(2)
     
     with col1:
-        monthly_range = df.groupby('Month')['TempRange'].mean().reset_index()
-        fig = px.bar(monthly_range, x='Month', y='TempRange', 
-                    title="월별 평균 일교차", color='TempRange',
-                    color_continuous_scale='Reds')
-        fig.update_layout(xaxis_title="월", yaxis_title="일교차 (°C)")
-        st.plotly_chart(fig, use_container_width=True)
+        monthly_range = temp_range.groupby(df['Month']).mean().reset_index()
+        def build():
+            import plotly.express as px
+            fig = px.bar(monthly_range, x='Month', y='TempRange', 
+                        title="월별 평균 일교차", color='TempRange',
+                        color_continuous_scale='Reds')
+            fig.update_layout(xaxis_title="월", yaxis_title="일교차 (°C)")
+            return fig
+        show_cached_chart("temperature_monthly_range", monthly_range, build)
     
     with col2:
         # 기온 극값 분석
         temp_extremes = pd.DataFrame({
             '구분': ['최고 기온', '최저 기온', '최대 일교차'],
-            '값': [df['MaxTemp_C'].max(), df['MinTemp_C'].min(), df['TempRange'].max()],
+            '값': [df['MaxTemp_C'].max(), df['MinTemp_C'].min(), temp_range.max()],
             '단위': ['°C', '°C', '°C']
         })
         
-        fig = px.bar(temp_extremes, x='구분', y='값', text='값',
-                    title="기온 극값", color='구분')
-        fig.update_traces(texttemplate='%{text:.1f}°C', textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        def build():
+            import plotly.express as px
+            fig = px.bar(temp_extremes, x='구분', y='값', text='값',
+                        title="기온 극값", color='구분')
+            fig.update_traces(texttemplate='%{text:.1f}°C', textposition='outside')
+            return fig
+        show_cached_chart("temperature_extremes", temp_extremes, build)
 
-def show_precipitation_analysis(df):
-    """강수량 분석 페이지"""
+@instrument(stage="app.show_precipitation_analysis", rows=None)
+def show_precipitation_analysis(df, cube, climatology, sql_store, query_filters):
+    """강수량 분석 페이지 (강수일/범주별 일수는 SQLite 저장소에서 집계)"""
     st.header("🌧️ 강수량 상세 분석")
     
     # 강수 패턴
     st.subheader("💧 강수 패턴 분석")
     
-    # 강수일 vs 무강수일
-    rainy_days = (df['Precipitation_mm'] > 0).sum()
+    # 강수일 vs 무강수일 (강수일 개수와 평균을 한 번의 쿼리로 계산)
+    rainy = sql_store.aggregate({'Precipitation_mm': ['count', 'mean']}, by=[],
+                                conditions=[('Precipitation_mm', '>', 0)], **query_filters)
+    rainy_days = int(rainy[('Precipitation_mm', 'count')])
     total_days = len(df)
     dry_days = total_days - rainy_days
     
@@ -306,7 +579,7 @@ def show_precipitation_analysis(df):
         st.metric("☀️ 무강수일", f"{dry_days}일", f"{(dry_days/total_days)*100:.1f}%")
     
     with col3:
-        avg_precip = df[df['Precipitation_mm'] > 0]['Precipitation_mm'].mean()
+        avg_precip = rainy[('Precipitation_mm', 'mean')]
         st.metric("💧 평균 강수량", f"{avg_precip:.1f}mm", "(강수일 기준)")
     
     # 강수량 분포
@@ -314,34 +587,54 @@ def show_precipitation_analysis(df):
     
     with col1:
         # 강수량 범주별 분류
-        df['PrecipCategory'] = pd.cut(df['Precipitation_mm'], 
-                                     bins=[0, 1, 10, 50, float('inf')],
-                                     labels=['무강수', '약한비', '보통비', '강한비'])
-        precip_counts = df['PrecipCategory'].value_counts()
+        precip_counts = sql_store.bucket_counts('Precipitation_mm', [0, 1, 10, 50, float('inf')],
+                                                ['무강수', '약한비', '보통비', '강한비'], **query_filters)
+        precip_counts = precip_counts.sort_values(ascending=False, kind='stable')
         
-        fig = px.pie(values=precip_counts.values, names=precip_counts.index,
-                    title="강수량 범주별 분포")
-        st.plotly_chart(fig, use_container_width=True)
+        def build():
+            import plotly.express as px
+            return px.pie(values=precip_counts.values, names=precip_counts.index,
+                          title="강수량 범주별 분포")
+        show_cached_chart("precipitation_categories", precip_counts, build)
     
     with col2:
         # 월별 강수 패턴
-        monthly_precip = df.groupby('Month')['Precipitation_mm'].agg(['sum', 'mean', 'count']).reset_index()
+        monthly_precip = cube_summary(cube, {'Precipitation_mm': ['sum', 'mean', 'count']}, by=['Month'])
         monthly_precip.columns = ['Month', 'Total', 'Average', 'Count']
         
-        fig = make_subplots(specs=[[{"secondary_y": True}]])
-        fig.add_trace(go.Bar(x=monthly_precip['Month'], y=monthly_precip['Total'], 
-                            name='총 강수량', marker_color='lightblue'), secondary_y=False)
-        fig.add_trace(go.Scatter(x=monthly_precip['Month'], y=monthly_precip['Average'], 
-                                mode='lines+markers', name='평균 강수량', line=dict(color='red')), secondary_y=True)
-        
-        fig.update_xaxes(title_text="월")
-        fig.update_yaxes(title_text="총 강수량 (mm)", secondary_y=False)
-        fig.update_yaxes(title_text="평균 강수량 (mm)", secondary_y=True)
-        fig.update_layout(title_text="월별 강수량 패턴")
-        
-        st.plotly_chart(fig, use_container_width=True)
+        def build():
+            import plotly.graph_objects as go
+            from plotly.subplots import make_subplots
+            fig = make_subplots(specs=[[{"secondary_y": True}]])
+            fig.add_trace(go.Bar(x=monthly_precip['Month'], y=monthly_precip['Total'], 
+                                name='총 강수량', marker_color='lightblue'), secondary_y=False)
+            fig.add_trace(go.Scatter(x=monthly_precip['Month'], y=monthly_precip['Average'], 
+                                    mode='lines+markers', name='평균 강수량', line=dict(color='red')), secondary_y=True)
+            
+            fig.update_xaxes(title_text="월")
+            fig.update_yaxes(title_text="총 강수량 (mm)", secondary_y=False)
+            fig.update_yaxes(title_text="평균 강수량 (mm)", secondary_y=True)
+            fig.update_layout(title_text="월별 강수량 패턴")
+            return fig
+        show_cached_chart("precipitation_monthly_pattern", monthly_precip, build)
+    
+    # 이동 합계 강수량 (누적합 차이로 날짜당 O(1) 계산)
+    st.subheader("📈 이동 합계 강수량")
+    rolling_precip = climatology.rolling_frame('Precipitation_mm', ROLLING_WINDOWS, 'sum',
+                                               df['Date'].min(), df['Date'].max())
+    
+    def build():
+        import plotly.graph_objects as go
+        fig = go.Figure()
+        for column, color in zip(rolling_precip.columns[1:], ['lightblue', 'royalblue', 'navy']):
+            fig.add_trace(go.Scatter(x=rolling_precip['Date'], y=rolling_precip[column], mode='lines',
+                                     name=f"{column} 합계", line=dict(color=color)))
+        fig.update_layout(xaxis_title="날짜", yaxis_title="강수량 (mm)", height=400)
+        return fig
+    show_cached_chart("precipitation_rolling_sums", rolling_precip, build)
 
-def show_forecast_analysis(df):
+@instrument(stage="app.show_forecast_analysis", rows=None)
+def show_forecast_analysis(stats):
     """실시간 예보 분석 페이지"""
     st.header("🔮 실시간 날씨 예보")
     
@@ -355,17 +648,19 @@ def show_forecast_analysis(df):
         # 예보 요약
         st.subheader("📋 7일 예보 요약")
         col1, col2, col3, col4 = st.columns(4)
+        forecast_high = RunningStats.from_values(forecast_df['MaxTemp_C'])
+        forecast_low = RunningStats.from_values(forecast_df['MinTemp_C'])
         
         with col1:
-            avg_high = forecast_df['MaxTemp_C'].mean()
+            avg_high = forecast_high.mean
             st.metric("🔥 평균 최고기온", f"{avg_high:.1f}°C")
         
         with col2:
-            avg_low = forecast_df['MinTemp_C'].mean()
+            avg_low = forecast_low.mean
             st.metric("❄️ 평균 최저기온", f"{avg_low:.1f}°C")
         
         with col3:
-            temp_range = forecast_df['MaxTemp_C'].mean() - forecast_df['MinTemp_C'].mean()
+            temp_range = forecast_high.mean - forecast_low.mean
             st.metric("📏 평균 일교차", f"{temp_range:.1f}°C")
         
         with col4:
@@ -378,27 +673,30 @@ def show_forecast_analysis(df):
         # 예보 차트
         st.subheader("📈 7일 기온 예보")
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['MaxTemp_C'],
-                                mode='lines+markers', name='최고기온', line=dict(color='red')))
-        fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['MinTemp_C'],
-                                mode='lines+markers', name='최저기온', line=dict(color='blue')))
-        
-        fig.update_layout(title="7일 기온 예보", xaxis_title="날짜", yaxis_title="기온 (°C)")
-        st.plotly_chart(fig, use_container_width=True)
+        def build():
+            import plotly.graph_objects as go
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['MaxTemp_C'],
+                                    mode='lines+markers', name='최고기온', line=dict(color='red')))
+            fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['MinTemp_C'],
+                                    mode='lines+markers', name='최저기온', line=dict(color='blue')))
+            
+            fig.update_layout(title="7일 기온 예보", xaxis_title="날짜", yaxis_title="기온 (°C)")
+            return fig
+        show_cached_chart("forecast_temperature", forecast_df[['Date', 'MaxTemp_C', 'MinTemp_C']], build)
         
         # 과거 데이터와 비교
         st.subheader("🔍 과거 데이터와 비교")
         
         # 현재 월의 과거 평균 계산
         current_month = datetime.now().month
-        historical_data = df[df['Month'] == current_month]
+        historical_stats = stats.select(month=current_month)
         
-        if not historical_data.empty:
-            hist_avg_max = historical_data['MaxTemp_C'].mean()
-            hist_avg_min = historical_data['MinTemp_C'].mean()
-            forecast_avg_max = forecast_df['MaxTemp_C'].mean()
-            forecast_avg_min = forecast_df['MinTemp_C'].mean()
+        if len(historical_stats):
+            hist_avg_max = historical_stats.total('MaxTemp_C').mean
+            hist_avg_min = historical_stats.total('MinTemp_C').mean
+            forecast_avg_max = forecast_high.mean
+            forecast_avg_min = forecast_low.mean
             
             comparison_data = pd.DataFrame({
                 '구분': ['과거 평균 최고기온', '예보 평균 최고기온', '과거 평균 최저기온', '예보 평균 최저기온'],
@@ -406,11 +704,14 @@ def show_forecast_analysis(df):
                 '타입': ['과거', '예보', '과거', '예보']
             })
             
-            fig = px.bar(comparison_data, x='구분', y='기온', color='타입',
-                        title=f"{current_month}월 과거 평균 vs 현재 예보", 
-                        text='기온')
-            fig.update_traces(texttemplate='%{text:.1f}°C', textposition='outside')
-            st.plotly_chart(fig, use_container_width=True)
+            def build():
+                import plotly.express as px
+                fig = px.bar(comparison_data, x='구분', y='기온', color='타입',
+                            title=f"{current_month}월 과거 평균 vs 현재 예보", 
+                            text='기온')
+                fig.update_traces(texttemplate='%{text:.1f}°C', textposition='outside')
+                return fig
+            show_cached_chart("forecast_comparison", comparison_data, build, month=current_month)
         
         # 예보 상세 테이블
         st.subheader("📅 상세 예보 정보")
@@ -422,72 +723,80 @@ def show_forecast_analysis(df):
         
         # 통계적 예측 (과거 데이터 기반)
         current_month = datetime.now().month
-        historical_data = df[df['Month'] == current_month]
+        historical_stats = stats.select(month=current_month)
         
-        if not historical_data.empty:
+        if len(historical_stats):
+            avg_stats = historical_stats.total('AvgTemp_C')
+            max_stats = historical_stats.total('MaxTemp_C')
+            min_stats = historical_stats.total('MinTemp_C')
+            
             st.subheader(f"📊 {current_month}월 통계 기반 예측")
             
             col1, col2, col3 = st.columns(3)
             
             with col1:
                 st.metric("🌡️ 예상 평균기온", 
-                         f"{historical_data['AvgTemp_C'].mean():.1f}°C",
-                         f"±{historical_data['AvgTemp_C'].std():.1f}")
+                         f"{avg_stats.mean:.1f}°C",
+                         f"±{avg_stats.std():.1f}")
             
             with col2:
                 st.metric("🔥 예상 최고기온", 
-                         f"{historical_data['MaxTemp_C'].mean():.1f}°C",
-                         f"±{historical_data['MaxTemp_C'].std():.1f}")
+                         f"{max_stats.mean:.1f}°C",
+                         f"±{max_stats.std():.1f}")
             
             with col3:
                 st.metric("❄️ 예상 최저기온", 
-                         f"{historical_data['MinTemp_C'].mean():.1f}°C",
-                         f"±{historical_data['MinTemp_C'].std():.1f}")
+                         f"{min_stats.mean:.1f}°C",
+                         f"±{min_stats.std():.1f}")
 
-def show_climate_change_analysis(df):
+@instrument(stage="app.show_climate_change_analysis", rows=None)
+def show_climate_change_analysis(df, cube):
     """기후 변화 분석 페이지"""
     st.header("🌍 기후 변화 트렌드")
     
     # 연도별 트렌드
-    yearly_data = df.groupby('Year').agg({
+    trend_aggregations = {
         'AvgTemp_C': 'mean',
         'MaxTemp_C': 'mean',
         'MinTemp_C': 'mean',
         'Precipitation_mm': 'sum'
-    }).reset_index()
+    }
+    yearly_data = cube_summary(cube, trend_aggregations, by=['Year'])
     
     # 기온 트렌드
     st.subheader("📈 기온 변화 트렌드")
     
-    fig = make_subplots(rows=2, cols=2,
-                       subplot_titles=("평균 기온", "최고 기온", "최저 기온", "연간 강수량"))
-    
-    # 평균 기온
-    fig.add_trace(go.Scatter(x=yearly_data['Year'], y=yearly_data['AvgTemp_C'],
-                            mode='lines+markers', name='평균기온'), row=1, col=1)
-    
-    # 최고 기온
-    fig.add_trace(go.Scatter(x=yearly_data['Year'], y=yearly_data['MaxTemp_C'],
-                            mode='lines+markers', name='최고기온', line=dict(color='red')), row=1, col=2)
-    
-    # 최저 기온
-    fig.add_trace(go.Scatter(x=yearly_data['Year'], y=yearly_data['MinTemp_C'],
-                            mode='lines+markers', name='최저기온', line=dict(color='blue')), row=2, col=1)
-    
-    # 강수량
-    fig.add_trace(go.Bar(x=yearly_data['Year'], y=yearly_data['Precipitation_mm'],
-                        name='연간강수량', marker=dict(color='lightblue')), row=2, col=2)
-    
-    fig.update_layout(height=600, showlegend=False, title_text="연도별 기후 변화")
-    st.plotly_chart(fig, use_container_width=True)
+    def build():
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        fig = make_subplots(rows=2, cols=2,
+                           subplot_titles=("평균 기온", "최고 기온", "최저 기온", "연간 강수량"))
+        
+        # 평균 기온
+        fig.add_trace(go.Scatter(x=yearly_data['Year'], y=yearly_data['AvgTemp_C'],
+                                mode='lines+markers', name='평균기온'), row=1, col=1)
+        
+        # 최고 기온
+        fig.add_trace(go.Scatter(x=yearly_data['Year'], y=yearly_data['MaxTemp_C'],
+                                mode='lines+markers', name='최고기온', line=dict(color='red')), row=1, col=2)
+        
+        # 최저 기온
+        fig.add_trace(go.Scatter(x=yearly_data['Year'], y=yearly_data['MinTemp_C'],
+                                mode='lines+markers', name='최저기온', line=dict(color='blue')), row=2, col=1)
+        
+        # 강수량
+        fig.add_trace(go.Bar(x=yearly_data['Year'], y=yearly_data['Precipitation_mm'],
+                            name='연간강수량', marker=dict(color='lightblue')), row=2, col=2)
+        
+        fig.update_layout(height=600, showlegend=False, title_text="연도별 기후 변화")
+        return fig
+    show_cached_chart("climate_yearly_trends", yearly_data, build)
     
     # 트렌드 분석
     st.subheader("📊 트렌드 분석 결과")
     
-    # 선형 회귀로 트렌드 계산
-    years = yearly_data['Year'].values.reshape(-1, 1)
-    
-    from sklearn.linear_model import LinearRegression
+    # 측정값 × (연간 + 월별) 추세를 한 번에 계산 (최소제곱, Theil–Sen, Mann–Kendall, 데이터 버전별 캐시)
+    trends = get_trend_table(df, trend_aggregations)
     
     col1, col2 = st.columns(2)
     
@@ -495,13 +804,14 @@ def show_climate_change_analysis(df):
         st.markdown("#### 🌡️ 기온 트렌드")
         
         # 평균 기온 트렌드
-        lr_temp = LinearRegression().fit(years, yearly_data['AvgTemp_C'])
-        temp_slope = lr_temp.coef_[0]
+        temp_trend = trend_for(trends, 'AvgTemp_C')
+        temp_slope = temp_trend['slope']
         
         if temp_slope > 0:
             st.success(f"📈 평균 기온 상승 추세: **+{temp_slope:.3f}°C/년**")
         else:
             st.info(f"📉 평균 기온 하락 추세: **{temp_slope:.3f}°C/년**")
+        st.caption(f"Theil–Sen {temp_trend['theil_sen']:+.3f}°C/년 · Mann–Kendall p={temp_trend['p_value']:.2f}")
         
         # 기온 변동성
         temp_std = yearly_data['AvgTemp_C'].std()
@@ -511,54 +821,67 @@ def show_climate_change_analysis(df):
         st.markdown("#### 💧 강수량 트렌드")
         
         # 강수량 트렌드
-        lr_precip = LinearRegression().fit(years, yearly_data['Precipitation_mm'])
-        precip_slope = lr_precip.coef_[0]
+        precip_trend = trend_for(trends, 'Precipitation_mm')
+        precip_slope = precip_trend['slope']
         
         if precip_slope > 0:
             st.success(f"📈 강수량 증가 추세: **+{precip_slope:.1f}mm/년**")
         else:
             st.info(f"📉 강수량 감소 추세: **{precip_slope:.1f}mm/년**")
+        st.caption(f"Theil–Sen {precip_trend['theil_sen']:+.1f}mm/년 · Mann–Kendall p={precip_trend['p_value']:.2f}")
         
         # 강수량 변동성
         precip_std = yearly_data['Precipitation_mm'].std()
         st.info(f"🔄 연간 강수량 변동성: **±{precip_std:.0f}mm**")
     
+    # 월별 트렌드 (같은 달끼리 연도별 기울기)
+    st.subheader("🗓️ 월별 트렌드")
+    monthly_trends = trends[trends['Month'] > 0].pivot(index='Month', columns='Measure', values='slope')
+    monthly_trends = monthly_trends[list(trend_aggregations)].rename(columns={
+        'AvgTemp_C': '평균 기온 (°C/년)',
+        'MaxTemp_C': '최고 기온 (°C/년)',
+        'MinTemp_C': '최저 기온 (°C/년)',
+        'Precipitation_mm': '강수량 (mm/년)'
+    })
+    monthly_trends.index = [f"{month}월" for month in monthly_trends.index]
+    st.dataframe(monthly_trends.round(3), use_container_width=True)
+    
     # 이상 기후 탐지
     st.subheader("⚠️ 이상 기후 탐지")
     
-    # Z-score 기반 이상치 탐지
-    from scipy import stats
+    method = st.radio("탐지 방법", list(ANOMALY_METHODS), format_func=ANOMALY_METHODS.get, horizontal=True)
     
-    df['TempZScore'] = np.abs(stats.zscore(df['AvgTemp_C']))
-    df['PrecipZScore'] = np.abs(stats.zscore(df['Precipitation_mm']))
-    
-    # 이상치 (Z-score > 2)
-    temp_outliers = df[df['TempZScore'] > 2]
-    precip_outliers = df[df['PrecipZScore'] > 2]
+    # 이상치 (|점수| > 2), 점수가 큰 순서의 표 하나로 표시
+    temp_outliers = detect_anomalies(df, 'AvgTemp_C', method=method)
+    precip_outliers = detect_anomalies(df, 'Precipitation_mm', method=method)
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("#### 🌡️ 이상 기온 기록")
         if not temp_outliers.empty:
-            for _, row in temp_outliers.iterrows():
-                if row['AvgTemp_C'] > df['AvgTemp_C'].mean():
-                    st.error(f"🔥 {row['Year']}-{row['Month']:02d}: {row['AvgTemp_C']:.1f}°C (평균 대비 +{row['AvgTemp_C'] - df['AvgTemp_C'].mean():.1f}°C)")
-                else:
-                    st.info(f"❄️ {row['Year']}-{row['Month']:02d}: {row['AvgTemp_C']:.1f}°C (평균 대비 {row['AvgTemp_C'] - df['AvgTemp_C'].mean():.1f}°C)")
+            st.dataframe(format_anomaly_table(temp_outliers, '°C', '🔥', '❄️'),
+                         hide_index=True, use_container_width=True)
         else:
             st.success("✅ 이상 기온 기록 없음")
     
     with col2:
         st.markdown("#### 💧 이상 강수량 기록")
         if not precip_outliers.empty:
-            for _, row in precip_outliers.iterrows():
-                if row['Precipitation_mm'] > df['Precipitation_mm'].mean():
-                    st.warning(f"🌧️ {row['Year']}-{row['Month']:02d}: {row['Precipitation_mm']:.1f}mm (평균 대비 +{row['Precipitation_mm'] - df['Precipitation_mm'].mean():.1f}mm)")
-                else:
-                    st.info(f"☀️ {row['Year']}-{row['Month']:02d}: {row['Precipitation_mm']:.1f}mm (평균 대비 {row['Precipitation_mm'] - df['Precipitation_mm'].mean():.1f}mm)")
+            st.dataframe(format_anomaly_table(precip_outliers, 'mm', '🌧️', '☀️'),
+                         hide_index=True, use_container_width=True)
         else:
             st.success("✅ 이상 강수량 기록 없음")
 
+def format_anomaly_table(table, unit, high_icon, low_icon):
+    """이상치 표를 화면 표시용 컬럼으로 변환"""
+    return pd.DataFrame({
+        '구분': np.where(table['Direction'] == 'high', high_icon, low_icon),
+        '날짜': pd.to_datetime(table['Date']).dt.strftime('%Y-%m-%d'),
+        f'값 ({unit})': table['Value'].round(1),
+        f'기준 대비 ({unit})': table['Deviation'].round(1),
+        '점수': table['Score'].round(2)
+    })
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+여러 지점 예보 조회 처리량 벤치마크: WeatherAPI(순차) vs AsyncWeatherAPI(동시)
+
+사용법: python benchmarks/bench_async_forecast.py --locations 40 --latency 0.05
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.mock_nws_server import start_mock_server
+from src.api_client import WeatherAPI, ForecastCache, PointsCache
+from src.async_api_client import AsyncWeatherAPI
+
+def make_locations(count):
+    """괌 주변 가상의 지점 좌표 생성"""
+    return {f"site-{i:03d}": (round(13.0 + i * 0.01, 4), round(144.5 + i * 0.01, 4)) for i in range(count)}
+
+def bench_sequential(base_url, locations):
+    api_client = WeatherAPI(base_url=base_url, cache=ForecastCache(), points_cache=PointsCache(path=None))
+    start = time.perf_counter()
+    for latitude, longitude in locations.values():
+        api_client.process_forecast_data(api_client.get_forecast_data(latitude, longitude))
+    return time.perf_counter() - start
+
+def bench_async(base_url, locations, concurrency):
+    api_client = AsyncWeatherAPI(base_url=base_url, max_concurrency=concurrency,
+                                 limit_per_host=concurrency, points_cache=PointsCache(path=None))
+    start = time.perf_counter()
+    df = api_client.get_forecasts(locations)
+    elapsed = time.perf_counter() - start
+    assert df is not None and df["Location"].nunique() == len(locations)
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--locations", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.05, help="모의 서버 응답 지연(초)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    
+    server, base_url = start_mock_server(latency=args.latency)
+    locations = make_locations(args.locations)
+    
+    try:
+        sequential = bench_sequential(base_url, locations)
+        concurrent = bench_async(base_url, locations, args.concurrency)
+    finally:
+        server.shutdown()
+    
+    print(f"지점 수: {args.locations}, 응답 지연: {args.latency * 1000:.0f}ms, 동시 실행: {args.concurrency}")
+    print(f"순차 (WeatherAPI):      {sequential:.2f}s  ({args.locations / sequential:.1f} 지점/초)")
+    print(f"동시 (AsyncWeatherAPI): {concurrent:.2f}s  ({args.locations / concurrent:.1f} 지점/초)")
+    print(f"속도 향상: {sequential / concurrent:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+데이터 파이프라인 벤치마크: CSV 읽기 → 전처리 → 요약 → 그래프 → 예보 처리
+
+가상 데이터(N년 × M개 관측소, benchmarks/synthetic_data.py)를 만들어 단계별 실행 시간
+(반복 실행의 중앙값/최소값)과 최대 메모리(tracemalloc 최고치)를 측정하고 JSON으로 저장한다.
+예보 단계는 로컬 모의 NWS 서버(benchmarks/mock_nws_server.py)를 사용한다.
+기준 결과 파일이 있으면 단계별로 비교해서 허용 범위를 넘은 단계가 있을 때 종료 코드 1을 반환한다.
+
+사용법:
+    python benchmarks/bench_pipeline.py --years 10 --stations 3
+    python benchmarks/bench_pipeline.py --update-baseline       # 현재 결과를 기준으로 저장
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime, timezone
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.mock_nws_server import start_mock_server
+from benchmarks.synthetic_data import generate_synthetic_data
+from src.aggregates import set_data_version
+from src.api_client import WeatherAPI, ForecastCache, PointsCache
+from src.data_processing import load_all_csv_files, preprocess_weather_data, get_yearly_summary, get_monthly_summary
+from src.sql_store import WeatherSQLStore
+from src.visualization import (
+    plot_monthly_temperature_by_year, plot_monthly_precipitation_by_year, plot_yearly_summary,
+    plot_temperature_departure, plot_forecast_comparison, create_comprehensive_dashboard
+)
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baseline_pipeline.json")
+DEFAULT_OUTPUT_PATH = os.path.join(".cache", "benchmarks", "pipeline.json")
+
+# 결과 파일 형식이 바뀌면 올림 (형식이 다른 기준 결과와는 비교하지 않음)
+RESULT_FORMAT_VERSION = 1
+
+# 기준 대비 이 비율 이상 느려지거나 메모리를 더 쓰면 회귀
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.20
+
+# 이보다 작은 시간 차이는 측정 잡음으로 보고 회귀로 판정하지 않음
+DEFAULT_MIN_SECONDS = 0.005
+
+GUAM_LOCATION = (13.4443, 144.7937)
+
+def build_stages(data_dir, work_dir, base_url):
+    """(단계 이름, 실행 함수) 목록 (각 단계의 입력은 미리 만들어 두고 해당 단계만 측정)"""
+    raw_df, _ = load_all_csv_files(data_dir)
+    df = preprocess_weather_data(raw_df)
+    
+    # SQLite 저장소는 미리 적재하고 집계 쿼리만 측정 (데이터 버전이 같으면 다시 적재하지 않음)
+    sql_df = df.copy(deep=False)
+    set_data_version(sql_df, "benchmark")
+    sql_store = WeatherSQLStore(os.path.join(work_dir, "weather.sqlite")).sync(sql_df)
+    
+    def fetch_forecast():
+        # 매번 빈 캐시로 위치 조회 + 예보 조회 전체를 측정
+        api_client = WeatherAPI(base_url=base_url, cache=ForecastCache(), points_cache=PointsCache(path=None))
+        return api_client.get_forecast_data(*GUAM_LOCATION)
+    
+    api_client = WeatherAPI(base_url=base_url, cache=ForecastCache(), points_cache=PointsCache(path=None))
+    forecast_data = fetch_forecast()
+    forecast_df = api_client.process_forecast_data(forecast_data)
+    
+    def plot(function, frame, name):
+        # 그래프는 results/와 같은 방식(dpi=300 PNG 저장)으로 그린 뒤 닫음
+        function(frame, save_path=os.path.join(work_dir, f"{name}.png"))
+        plt.close("all")
+    
+    return [
+        ("load_all_csv_files", lambda: load_all_csv_files(data_dir)),
+        ("preprocess_weather_data", lambda: preprocess_weather_data(raw_df)),
+        ("get_yearly_summary", lambda: get_yearly_summary(df)),
+        ("get_monthly_summary", lambda: get_monthly_summary(df)),
+        ("get_yearly_summary[sqlite]", lambda: get_yearly_summary(sql_df, store=sql_store)),
+        ("get_monthly_summary[sqlite]", lambda: get_monthly_summary(sql_df, store=sql_store)),
+        ("plot_monthly_temperature_by_year", lambda: plot(plot_monthly_temperature_by_year, df, "monthly_temperature")),
+        ("plot_monthly_precipitation_by_year",
+         lambda: plot(plot_monthly_precipitation_by_year, df, "monthly_precipitation")),
+        ("plot_yearly_summary", lambda: plot(plot_yearly_summary, df, "yearly_summary")),
+        ("plot_temperature_departure", lambda: plot(plot_temperature_departure, df, "temperature_departure")),
+        ("create_comprehensive_dashboard", lambda: plot(create_comprehensive_dashboard, df, "dashboard")),
+        ("plot_forecast_comparison", lambda: plot(plot_forecast_comparison, forecast_df, "forecast")),
+        ("get_forecast_data[mock]", fetch_forecast),
+        ("process_forecast_data", lambda: api_client.process_forecast_data(forecast_data))
+    ], len(df)
+
+def measure(function, repeat):
+    """repeat번 실행 시간(초)과, 별도 1회 실행의 tracemalloc 최대 메모리(바이트)
+    
+    tracemalloc은 실행을 느리게 하므로 시간 측정과 따로 실행한다.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    return {
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "max_s": max(timings),
+        "repeat": repeat,
+        "peak_bytes": peak
+    }
+
+def _max_rss_bytes():
+    """프로세스 최대 RSS (resource 모듈이 없는 환경에서는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return rss if sys.platform == "darwin" else rss * 1024
+
+def run_benchmark(years=10, stations=3, repeat=3, seed=0, data_dir=None, forecast_periods=14, stage_filter=None):
+    """전체 단계를 측정한 결과 dict (JSON으로 저장하는 형식)"""
+    with tempfile.TemporaryDirectory(prefix="guam-bench-") as work_dir:
+        source_dir = data_dir
+        if source_dir is None:
+            source_dir = os.path.join(work_dir, "data")
+            generate_synthetic_data(source_dir, years=years, stations=stations, seed=seed)
+        
+        server, base_url = start_mock_server(period_count=forecast_periods)
+        try:
+            stages, rows = build_stages(source_dir, work_dir, base_url)
+            results = {}
+            for name, function in stages:
+                if stage_filter and not any(pattern in name for pattern in stage_filter):
+                    continue
+                results[name] = measure(function, repeat)
+                print(f"  {name:<38} {results[name]['median_s'] * 1000:10.2f}ms"
+                      f"  최대 메모리 {results[name]['peak_bytes'] / 1024 ** 2:8.2f}MB")
+        finally:
+            server.shutdown()
+    
+    return {
+        "format": RESULT_FORMAT_VERSION,
+        "params": {"years": years, "stations": stations, "seed": seed, "rows": rows,
+                   "forecast_periods": forecast_periods, "data_dir": data_dir},
+        "environment": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "matplotlib": matplotlib.__version__,
+            "max_rss_bytes": _max_rss_bytes()
+        },
+        "stages": results
+    }
+
+def compare_results(current, baseline, time_threshold=DEFAULT_TIME_THRESHOLD,
+                    memory_threshold=DEFAULT_MEMORY_THRESHOLD, min_seconds=DEFAULT_MIN_SECONDS):
+    """단계별 기준 대비 비율 표와 회귀 단계 이름 목록
+    
+    시간은 중앙값 비율이 1 + time_threshold를 넘고 차이가 min_seconds 이상일 때,
+    메모리는 최고치 비율이 1 + memory_threshold를 넘을 때 회귀로 판정한다.
+    """
+    rows = []
+    regressions = []
+    for name, result in current["stages"].items():
+        base = baseline["stages"].get(name)
+        if base is None:
+            continue
+        
+        time_ratio = result["median_s"] / base["median_s"] if base["median_s"] else np.nan
+        memory_ratio = result["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] else np.nan
+        slower = time_ratio > 1 + time_threshold and result["median_s"] - base["median_s"] >= min_seconds
+        heavier = memory_ratio > 1 + memory_threshold
+        
+        rows.append({"stage": name, "baseline_ms": base["median_s"] * 1000, "current_ms": result["median_s"] * 1000,
+                     "time_ratio": time_ratio, "memory_ratio": memory_ratio,
+                     "regression": "시간" if slower and not heavier else "메모리" if heavier and not slower
+                     else "시간+메모리" if slower else ""})
+        if slower or heavier:
+            regressions.append(name)
+    
+    return pd.DataFrame(rows), regressions
+
+def _same_params(current, baseline):
+    keys = ("years", "stations", "seed", "forecast_periods")
+    return all(current["params"].get(key) == baseline["params"].get(key) for key in keys)
+
+def write_json(result, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--stations", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir", help="가상 데이터 대신 사용할 CSV 디렉토리 (예: data)")
+    parser.add_argument("--forecast-periods", type=int, default=14, help="모의 서버 예보 period 개수")
+    parser.add_argument("--stage", action="append", help="이름에 이 문자열이 들어간 단계만 실행 (여러 번 지정 가능)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH, help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 결과를 기준 결과로 저장")
+    parser.add_argument("--time-threshold", type=float, default=DEFAULT_TIME_THRESHOLD)
+    parser.add_argument("--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD)
+    parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS)
+    args = parser.parse_args()
+    
+    # 그래프 저장 시 한글 폰트 경고와 Agg 화면 표시 경고는 측정과 무관하므로 숨김
+    logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+    warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+    warnings.filterwarnings("ignore", message=".*non-interactive, and thus cannot be shown")
+    
+    print(f"파이프라인 벤치마크: {args.years}년 × {args.stations}개 관측소, 반복 {args.repeat}회")
+    result = run_benchmark(args.years, args.stations, args.repeat, args.seed, args.data_dir,
+                           args.forecast_periods, args.stage)
+    write_json(result, args.output)
+    print(f"결과 저장: {args.output} ({result['params']['rows']:,}행)")
+    
+    if args.update_baseline:
+        write_json(result, args.baseline)
+        print(f"기준 결과 갱신: {args.baseline}")
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        print("기준 결과가 없어 비교를 건너뜁니다 (--update-baseline으로 생성)")
+        return 0
+    
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("format") != RESULT_FORMAT_VERSION or not _same_params(result, baseline):
+        print("기준 결과와 측정 조건(연도/관측소 수/seed/형식)이 달라 비교를 건너뜁니다")
+        return 0
+    
+    table, regressions = compare_results(result, baseline, args.time_threshold,
+                                         args.memory_threshold, args.min_seconds)
+    print(f"\n기준 결과 대비 ({baseline['environment']['created']}, "
+          f"허용: 시간 +{args.time_threshold:.0%}, 메모리 +{args.memory_threshold:.0%})")
+    print(table.to_string(index=False, float_format=lambda value: f"{value:.2f}"))
+    if regressions:
+        print(f"\n성능 회귀: {', '.join(regressions)}")
+        return 1
+    print("\n성능 회귀 없음")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+시작 시간 벤치마크: 대시보드(app)와 CLI(src.report)의 콜드 스타트 import 시간
+
+새 파이썬 프로세스에서 `python -X importtime -c "import <모듈>"`을 반복 실행해
+대상 모듈의 누적 import 시간(중앙값)과 프로세스 전체 실행 시간을 측정하고,
+패키지별로 가장 오래 걸린 import를 보여준다. 대상마다 시간 예산과 시작 시 불러오면 안 되는
+모듈(그래프/네트워크 라이브러리 등) 목록이 있어서, 예산을 넘거나 금지 모듈이 로드되면 종료 코드 1을 반환한다.
+
+사용법:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --target dashboard --repeat 10
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT_PATH = os.path.join(".cache", "benchmarks", "startup.json")
+
+# 대상 이름 → import할 모듈, 누적 import 시간 예산(ms), 시작 시 로드되면 안 되는 모듈
+# (streamlit 자체가 plotly.graph_objects를 불러오므로 대시보드에서는 plotly.express만 금지)
+TARGETS = {
+    "dashboard": {
+        "module": "app",
+        "budget_ms": 2000,
+        "forbidden": ["plotly.express", "matplotlib", "seaborn", "sklearn", "scipy", "requests", "pyarrow.dataset"]
+    },
+    "cli": {
+        "module": "src.report",
+        "budget_ms": 900,
+        "forbidden": ["matplotlib.pyplot", "seaborn", "plotly", "streamlit", "requests"]
+    },
+    "data": {
+        "module": "src.data_processing",
+        "budget_ms": 800,
+        "forbidden": ["matplotlib", "plotly", "streamlit", "requests", "sklearn", "scipy"]
+    }
+}
+
+TOP_IMPORT_COUNT = 8
+
+def run_importtime(module):
+    """새 프로세스에서 module을 import하고 (전체 실행 시간 초, -X importtime 출력) 반환"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    # 계측이 켜져 있으면 측정값이 달라지므로 끔
+    env.pop("GUAM_WEATHER_PROFILE", None)
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True
+    )
+    seconds = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{completed.stderr[-2000:]}")
+    return seconds, completed.stderr
+
+def parse_importtime(output):
+    """-X importtime 출력 → [(모듈 이름, 자체 시간 µs, 누적 시간 µs), ...] (import 순서)"""
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        entries.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return entries
+
+def summarize_imports(entries, module):
+    """대상 모듈 누적 시간(ms), 로드된 모듈 집합, 최상위 패키지별 자체 시간 합계(ms)"""
+    cumulative = {name: total for name, _, total in entries}
+    packages = defaultdict(int)
+    for name, self_time, _ in entries:
+        packages[name.split(".")[0]] += self_time
+    return (
+        cumulative.get(module, 0) / 1000,
+        {name for name, _, _ in entries},
+        {package: total / 1000 for package, total in packages.items()}
+    )
+
+def _is_loaded(name, modules):
+    """name 또는 그 하위 모듈이 로드되었는지"""
+    return any(loaded == name or loaded.startswith(name + ".") for loaded in modules)
+
+def measure_target(name, spec, repeat):
+    """대상 하나를 워밍업(.pyc 생성) 1회 후 repeat회 측정"""
+    run_importtime(spec["module"])
+    import_times = []
+    wall_times = []
+    packages = defaultdict(list)
+    modules = set()
+    for _ in range(repeat):
+        seconds, output = run_importtime(spec["module"])
+        import_ms, loaded, package_times = summarize_imports(parse_importtime(output), spec["module"])
+        import_times.append(import_ms)
+        wall_times.append(seconds * 1000)
+        modules |= loaded
+        for package, value in package_times.items():
+            packages[package].append(value)
+    
+    heaviest = sorted(((statistics.median(values), package) for package, values in packages.items()), reverse=True)
+    import_ms = statistics.median(import_times)
+    forbidden = [module for module in spec["forbidden"] if _is_loaded(module, modules)]
+    return {
+        "target": name,
+        "module": spec["module"],
+        "import_ms_median": import_ms,
+        "import_ms_min": min(import_times),
+        "wall_ms_median": statistics.median(wall_times),
+        "budget_ms": spec["budget_ms"],
+        "over_budget": import_ms > spec["budget_ms"],
+        "forbidden_loaded": forbidden,
+        "module_count": len(modules),
+        "heaviest": [
+            {"package": package, "self_ms": value}
+            for value, package in heaviest[:TOP_IMPORT_COUNT]
+        ]
+    }
+
+def run_benchmark(targets, repeat=5, budgets=None):
+    results = []
+    for name in targets:
+        spec = dict(TARGETS[name])
+        if budgets and name in budgets:
+            spec["budget_ms"] = budgets[name]
+        results.append(measure_target(name, spec, repeat))
+    return {
+        "params": {"targets": list(targets), "repeat": repeat},
+        "environment": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform()
+        },
+        "targets": results
+    }
+
+def write_json(result, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+def _parse_budget(value):
+    name, _, milliseconds = value.partition("=")
+    if name not in TARGETS or not milliseconds:
+        raise argparse.ArgumentTypeError(f"형식: <{'|'.join(TARGETS)}>=<ms>")
+    return name, float(milliseconds)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", action="append", choices=list(TARGETS), help="측정할 대상 (여러 번 지정 가능, 기본값: 전부)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", action="append", type=_parse_budget, default=[],
+                        help="대상별 예산 변경 (예: dashboard=2500)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH, help="결과 JSON 경로")
+    args = parser.parse_args()
+    
+    targets = args.target or list(TARGETS)
+    print(f"시작 시간 벤치마크: {', '.join(targets)}, 반복 {args.repeat}회")
+    result = run_benchmark(targets, args.repeat, dict(args.budget))
+    write_json(result, args.output)
+    print(f"결과 저장: {args.output}")
+    
+    failures = []
+    for target in result["targets"]:
+        status = "초과" if target["over_budget"] else "통과"
+        print(f"\n[{target['target']}] import {target['module']}: {target['import_ms_median']:.0f}ms "
+              f"(최소 {target['import_ms_min']:.0f}ms, 프로세스 {target['wall_ms_median']:.0f}ms, "
+              f"모듈 {target['module_count']}개) / 예산 {target['budget_ms']:.0f}ms {status}")
+        for item in target["heaviest"]:
+            print(f"    {item['package']:<24} {item['self_ms']:8.1f}ms")
+        if target["over_budget"]:
+            failures.append(f"{target['target']} 예산 초과")
+        if target["forbidden_loaded"]:
+            print(f"    시작 시 로드되면 안 되는 모듈: {', '.join(target['forbidden_loaded'])}")
+            failures.append(f"{target['target']} 금지 모듈 로드")
+    
+    if failures:
+        print(f"\n시작 시간 회귀: {', '.join(failures)}")
+        return 1
+    print("\n시작 시간 회귀 없음")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
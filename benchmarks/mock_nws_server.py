@@ -0,0 +1,149 @@
+"""
+벤치마크/검증용 로컬 National Weather Service API 모의 서버
+
+/points/{lat},{lon}, /gridpoints/{office}/{x},{y}/forecast(/hourly), /gridpoints/{office}/{x},{y} 를 흉내 내며,
+응답 지연(latency)과 ETag 기반 304 응답을 지원하고, /malformed 는 JSON이 아닌 응답을 돌려준다.
+"""
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+def make_periods(count=14, start=None):
+    """낮/밤이 번갈아 나오는 12시간 단위 예보 period 목록 생성"""
+    start = start or datetime.now(timezone.utc).replace(hour=6, minute=0, second=0, microsecond=0)
+    periods = []
+    for i in range(count):
+        is_daytime = i % 2 == 0
+        start_time = start + timedelta(hours=12 * i)
+        periods.append({
+            "number": i + 1,
+            "name": "Day" if is_daytime else "Night",
+            "startTime": start_time.isoformat(),
+            "endTime": (start_time + timedelta(hours=12)).isoformat(),
+            "isDaytime": is_daytime,
+            "temperature": 87 + i % 3 if is_daytime else 77 + i % 2,
+            "temperatureUnit": "F",
+            "probabilityOfPrecipitation": {"unitCode": "wmoUnit:percent", "value": 20 + i % 5 * 10},
+            "windSpeed": "10 to 15 mph",
+            "windDirection": "E",
+            "shortForecast": "Scattered Showers",
+            "detailedForecast": "Scattered showers. Partly cloudy."
+        })
+    return periods
+
+def make_hourly_periods(count=156, start=None):
+    """1시간 단위 예보 period 목록 생성 (괌 현지 시각 +10:00 표기)"""
+    local = timezone(timedelta(hours=10))
+    start = start or datetime.now(local).replace(minute=0, second=0, microsecond=0)
+    periods = []
+    for i in range(count):
+        start_time = start + timedelta(hours=i)
+        hour = start_time.astimezone(local).hour
+        periods.append({
+            "number": i + 1,
+            "startTime": start_time.isoformat(),
+            "endTime": (start_time + timedelta(hours=1)).isoformat(),
+            "isDaytime": 6 <= hour < 18,
+            "temperature": 78 + (9 if 10 <= hour < 16 else 4 if 6 <= hour < 20 else 0),
+            "temperatureUnit": "F",
+            "windSpeed": "10 mph",
+            "windDirection": "E",
+            "shortForecast": "Partly Cloudy"
+        })
+    return periods
+
+def make_grid_values(hours=156, step=3, start=None):
+    """step시간 단위 validTime("시작/PTnH")을 가진 격자점 기온 값 목록 생성 (섭씨)"""
+    start = start or datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    return [
+        {
+            "validTime": f"{(start + timedelta(hours=i)).isoformat()}/PT{step}H",
+            "value": 26.0 + (i % 24) / 6
+        }
+        for i in range(0, hours, step)
+    ]
+
+class MockNWSHandler(BaseHTTPRequestHandler):
+    """NWS API 응답을 흉내 내는 요청 처리기"""
+    
+    def log_message(self, *args):
+        pass
+    
+    def _send_json(self, body, etag=None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/geo+json")
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def do_GET(self):
+        server = self.server
+        server.request_count += 1
+        if server.latency:
+            time.sleep(server.latency)
+        
+        host = f"http://{self.headers['Host']}"
+        if self.path.startswith("/points/"):
+            latitude, longitude = self.path.rsplit("/", 1)[-1].split(",")
+            grid_x, grid_y = int(float(latitude) * 10000), int(float(longitude) * 10000)
+            grid_url = f"{host}/gridpoints/MOCK/{grid_x},{grid_y}"
+            self._send_json({"properties": {
+                "gridId": "MOCK", "gridX": grid_x, "gridY": grid_y,
+                "forecast": grid_url + "/forecast",
+                "forecastHourly": grid_url + "/forecast/hourly",
+                "forecastGridData": grid_url,
+                "timeZone": "Pacific/Guam",
+                "relativeLocation": {"properties": {"city": "Hagatna", "state": "GU"}}
+            }})
+        elif self.path.endswith("/forecast"):
+            etag = '"mock-forecast-v1"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._send_json({"properties": {
+                "updateTime": datetime.now(timezone.utc).isoformat(),
+                "periods": make_periods(server.period_count)
+            }}, etag=etag)
+        elif self.path.endswith("/forecast/hourly"):
+            self._send_json({"properties": {
+                "updateTime": datetime.now(timezone.utc).isoformat(),
+                "periods": make_hourly_periods(server.hourly_count)
+            }})
+        elif self.path.startswith("/gridpoints/"):
+            self._send_json({"properties": {
+                "updateTime": datetime.now(timezone.utc).isoformat(),
+                "temperature": {"uom": "wmoUnit:degC", "values": make_grid_values(server.hourly_count)}
+            }})
+        elif self.path == "/malformed":
+            # 프록시 오류 페이지처럼 JSON이 아닌 200 응답
+            data = b"<html><body>Bad Gateway</body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+class MockNWSServer(ThreadingHTTPServer):
+    """동시 접속 벤치마크를 위해 listen 대기열을 늘린 서버 (기본값 5는 SYN 재전송 지연을 일으킴)"""
+    request_queue_size = 128
+
+def start_mock_server(latency=0.0, period_count=14, hourly_count=156):
+    """백그라운드 스레드에서 모의 서버 시작, (server, base_url) 반환 (종료: server.shutdown())"""
+    server = MockNWSServer(("127.0.0.1", 0), MockNWSHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.period_count = period_count
+    server.hourly_count = hourly_count
+    server.request_count = 0
+    
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
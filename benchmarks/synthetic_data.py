@@ -0,0 +1,101 @@
+"""
+벤치마크용 가상 날씨 데이터 생성기
+
+data/의 NOAA 형식 월별 CSV와 같은 컬럼/기호('T' 강수 흔적, 'M' 적설 결측)를 가진 파일을
+N년 × M개 관측소만큼 관측소 분할 구조(station=<관측소>/year=<YYYY>/YYYY_MM.csv)로 만든다.
+같은 seed면 같은 파일이 만들어진다.
+
+사용법: python benchmarks/synthetic_data.py /tmp/guam-bench --years 30 --stations 5
+"""
+import argparse
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.stations import partition_path
+
+CSV_COLUMNS = ["Date", "Maximum", "Minimum", "Average", "Departure", "HDD", "CDD",
+               "Precipitation", "New Snow", "Snow Depth"]
+
+# 괌 일평균 기온(°F)의 계절 변화와 평년값
+BASE_TEMPERATURE_F = 82.0
+SEASONAL_AMPLITUDE_F = 1.5
+DEGREE_DAY_BASE_F = 65
+
+# 우기(7~10월)에 강수 확률과 강수량이 커짐
+RAIN_PROBABILITY = np.array([0.55, 0.5, 0.45, 0.45, 0.55, 0.65, 0.75, 0.8, 0.8, 0.75, 0.7, 0.6])
+TRACE_PROBABILITY = 0.1
+MISSING_SNOW_DEPTH_PROBABILITY = 0.02
+
+def station_names(count):
+    """가상 관측소 이름 (PGUM, PGUA 다음부터는 S002, S003 ...)"""
+    names = ["PGUM", "PGUA"]
+    return [names[i] if i < len(names) else f"S{i:03d}" for i in range(count)]
+
+def make_month_frame(year, month, rng, offset=0.0):
+    """한 달치 NOAA 형식 일별 데이터 (값은 CSV에 쓰는 문자열/숫자 그대로)"""
+    dates = pd.date_range(f"{year}-{month:02d}-01", periods=pd.Period(f"{year}-{month:02d}").days_in_month, freq="D")
+    days = len(dates)
+    
+    # 1. 기온: 관측소 평년값(계절 변화 포함) + 일별 잡음 (최고/최저는 정수 °F)
+    season = SEASONAL_AMPLITUDE_F * np.sin(2 * np.pi * (dates.dayofyear.to_numpy() - 120) / 365.25)
+    normal = BASE_TEMPERATURE_F + offset + season
+    average = normal + rng.normal(0, 1.0, days)
+    spread = rng.uniform(8, 12, days)
+    maximum = np.round(average + spread / 2)
+    minimum = np.round(average - spread / 2)
+    average = (maximum + minimum) / 2
+    
+    # 2. 강수량(인치): 강수일은 지수분포, 일부는 흔적('T')
+    rainy = rng.random(days) < RAIN_PROBABILITY[month - 1]
+    amounts = np.round(rng.exponential(0.3, days), 2)
+    precipitation = np.where(rainy & (amounts > 0), amounts.astype(str), "0")
+    precipitation = np.where(rng.random(days) < TRACE_PROBABILITY, "T", precipitation)
+    
+    snow_depth = np.where(rng.random(days) < MISSING_SNOW_DEPTH_PROBABILITY, "M", "0")
+    
+    return pd.DataFrame({
+        "Date": dates.strftime("%Y-%m-%d"),
+        "Maximum": maximum.astype(int),
+        "Minimum": minimum.astype(int),
+        "Average": average,
+        "Departure": np.round(average - normal, 1),
+        "HDD": np.maximum(DEGREE_DAY_BASE_F - average, 0).astype(int),
+        "CDD": np.maximum(average - DEGREE_DAY_BASE_F, 0).astype(int),
+        "Precipitation": precipitation,
+        "New Snow": 0,
+        "Snow Depth": snow_depth
+    }, columns=CSV_COLUMNS)
+
+def generate_synthetic_data(output_dir, years=10, stations=1, start_year=2000, seed=0):
+    """output_dir에 years년 × stations개 관측소 월별 CSV 생성, 생성한 파일 경로 목록 반환"""
+    rng = np.random.default_rng(seed)
+    paths = []
+    for index, station in enumerate(station_names(stations)):
+        # 관측소마다 평균 기온을 조금씩 다르게
+        offset = -0.8 * index
+        for year in range(start_year, start_year + years):
+            for month in range(1, 13):
+                path = partition_path(output_dir, station, year, month)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                make_month_frame(year, month, rng, offset).to_csv(path, index=False)
+                paths.append(path)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output_dir")
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--stations", type=int, default=1)
+    parser.add_argument("--start-year", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    paths = generate_synthetic_data(args.output_dir, args.years, args.stations, args.start_year, args.seed)
+    print(f"{len(paths)}개 파일 생성: {args.output_dir} ({args.years}년 × {args.stations}개 관측소)")
+
+if __name__ == "__main__":
+    main()
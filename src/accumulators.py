@@ -0,0 +1,299 @@
+"""
+괌 날씨 온라인(누적) 통계 모듈
+
+측정값마다 개수, 평균, 편차 제곱합(Welford), 최소/최대, 고정 구간 히스토그램을 들고 있어서
+새 날짜가 들어오면 전체를 다시 읽지 않고 O(1)로 갱신하고,
+파일/작업자별로 따로 만든 누적값은 merge로 합칠 수 있다 (Chan 병렬 분산 공식).
+(Year, Month)별로 따로 누적하므로 연도/월 필터는 해당 셀만 합치면 된다.
+"""
+from bisect import bisect_right
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+try:
+    from .aggregates import frame_cache_key
+except ImportError:
+    from aggregates import frame_cache_key
+
+ACCUMULATOR_KEYS = ["Year", "Month"]
+
+# 히스토그램 구간 경계 (양 끝 밖의 값은 첫/마지막 칸에 모음)
+TEMPERATURE_EDGES = tuple(np.arange(15.0, 40.5, 0.5).tolist())
+PRECIPITATION_EDGES = (0.0, 0.1, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 200.0, 400.0)
+
+# 데이터 버전별 누적값 캐시 (최근 사용 순)
+_ACCUMULATOR_CACHE = OrderedDict()
+_ACCUMULATOR_CACHE_SIZE = 8
+
+def default_edges(column):
+    """컬럼 이름으로 고른 히스토그램 구간 경계 (강수량은 로그 간격, 나머지는 0.5°C 간격)"""
+    return PRECIPITATION_EDGES if "precip" in str(column).lower() else TEMPERATURE_EDGES
+
+class RunningStats:
+    """측정값 하나의 누적 통계 (NaN은 건너뜀)"""
+    
+    __slots__ = ("count", "mean", "m2", "min", "max", "edges", "hist")
+    
+    def __init__(self, edges=TEMPERATURE_EDGES):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        self.edges = tuple(edges)
+        self.hist = np.zeros(len(self.edges) + 1, dtype=np.int64)
+    
+    @classmethod
+    def from_values(cls, values, edges=TEMPERATURE_EDGES):
+        """배열 전체로 한 번에 만든 누적 통계"""
+        stats = cls(edges)
+        stats.update_many(values)
+        return stats
+    
+    def update(self, value):
+        """값 하나 추가 (Welford, O(1))"""
+        value = float(value)
+        if np.isnan(value):
+            return self
+        
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if np.isnan(self.min) else min(self.min, value)
+        self.max = value if np.isnan(self.max) else max(self.max, value)
+        self.hist[bisect_right(self.edges, value)] += 1
+        return self
+    
+    def update_many(self, values):
+        """배열의 통계를 한 번에 계산한 뒤 병합"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        
+        batch = RunningStats(self.edges)
+        batch.count = len(values)
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        batch.min = float(values.min())
+        batch.max = float(values.max())
+        batch.hist = np.bincount(np.searchsorted(self.edges, values, side="right"),
+                                 minlength=len(self.hist))
+        return self.merge(batch)
+    
+    def merge(self, other):
+        """다른 누적값을 합침 (self를 갱신해서 반환, 구간 경계가 같아야 함)"""
+        if other.count == 0:
+            return self
+        if other.edges != self.edges:
+            raise ValueError("히스토그램 구간 경계가 다른 누적값은 합칠 수 없습니다")
+        
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        self.hist = self.hist + other.hist
+        return self
+    
+    def copy(self):
+        stats = RunningStats(self.edges)
+        stats.count, stats.mean, stats.m2 = self.count, self.mean, self.m2
+        stats.min, stats.max = self.min, self.max
+        stats.hist = self.hist.copy()
+        return stats
+    
+    def __add__(self, other):
+        return self.copy().merge(other)
+    
+    @property
+    def sum(self):
+        return self.mean * self.count
+    
+    def var(self, ddof=1):
+        """분산 (pandas 기본값과 같은 ddof=1, 개수가 부족하면 NaN)"""
+        if self.count - ddof <= 0:
+            return np.nan
+        return self.m2 / (self.count - ddof)
+    
+    def std(self, ddof=1):
+        return np.sqrt(self.var(ddof))
+    
+    def quantile(self, q):
+        """히스토그램으로 추정한 분위수 (구간 안은 선형 보간, 양 끝 칸은 최소/최대까지)"""
+        if self.count == 0:
+            return np.nan
+        bounds = np.concatenate([[self.min], self.edges, [self.max]])
+        bounds = np.clip(bounds, self.min, self.max)
+        cumulative = np.concatenate([[0], np.cumsum(self.hist)]) / self.count
+        return float(np.interp(q, cumulative, bounds))
+    
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean": self.mean if self.count else np.nan,
+            "std": self.std(),
+            "min": self.min,
+            "max": self.max,
+            "sum": self.sum
+        }
+    
+    def __repr__(self):
+        return (f"RunningStats(count={self.count}, mean={self.mean:.3f}, std={self.std():.3f}, "
+                f"min={self.min}, max={self.max})")
+
+class WeatherAccumulator:
+    """(Year, Month)별 × 측정값별 RunningStats 모음"""
+    
+    def __init__(self, columns, edges=None):
+        self.columns = list(columns)
+        self.edges = {column: tuple((edges or {}).get(column, default_edges(column))) for column in self.columns}
+        self.cells = {}   # (year, month) → {컬럼: RunningStats}
+    
+    def __len__(self):
+        return len(self.cells)
+    
+    def _cell(self, key):
+        cell = self.cells.get(key)
+        if cell is None:
+            cell = {column: RunningStats(self.edges[column]) for column in self.columns}
+            self.cells[key] = cell
+        return cell
+    
+    def update_day(self, date, values):
+        """하루치 값({컬럼: 값}) 추가, 해당 (Year, Month) 셀만 O(1)로 갱신"""
+        date = pd.Timestamp(date)
+        cell = self._cell((date.year, date.month))
+        for column in self.columns:
+            if column in values:
+                cell[column].update(values[column])
+        return self
+    
+    def update_frame(self, df):
+        """일별 DataFrame(Year, Month 컬럼 포함)을 셀별로 한 번에 집계해서 병합"""
+        if df.empty:
+            return self
+        
+        # 1. (Year, Month) 그룹 번호
+        codes, keys = pd.MultiIndex.from_arrays([df[key] for key in ACCUMULATOR_KEYS]).factorize()
+        groups = len(keys)
+        
+        # 2. 컬럼별로 그룹 개수/평균/편차 제곱합/최소/최대/히스토그램을 벡터 연산으로 계산
+        batches = {}
+        for column in self.columns:
+            values = df[column].to_numpy(dtype=float)
+            valid = ~np.isnan(values)
+            group, values = codes[valid], values[valid]
+            
+            count = np.bincount(group, minlength=groups)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = np.bincount(group, weights=values, minlength=groups) / count
+            m2 = np.bincount(group, weights=(values - mean[group]) ** 2, minlength=groups)
+            low = np.full(groups, np.nan)
+            high = np.full(groups, np.nan)
+            np.fmin.at(low, group, values)
+            np.fmax.at(high, group, values)
+            
+            bins = len(self.edges[column]) + 1
+            positions = np.searchsorted(self.edges[column], values, side="right")
+            hist = np.bincount(group * bins + positions, minlength=groups * bins).reshape(groups, bins)
+            batches[column] = (count, mean, m2, low, high, hist)
+        
+        # 3. 셀 단위로 병합 (셀 수 = 연×월 수이므로 반복 횟수가 작음)
+        for index, key in enumerate(keys):
+            cell = self._cell((int(key[0]), int(key[1])))
+            for column, (count, mean, m2, low, high, hist) in batches.items():
+                if count[index] == 0:
+                    continue
+                batch = RunningStats(self.edges[column])
+                batch.count = int(count[index])
+                batch.mean = float(mean[index])
+                batch.m2 = float(m2[index])
+                batch.min = float(low[index])
+                batch.max = float(high[index])
+                batch.hist = hist[index]
+                cell[column].merge(batch)
+        return self
+    
+    def merge(self, other):
+        """다른 파일/작업자의 누적값을 합침 (같은 (Year, Month) 셀은 통계를 병합)"""
+        for key, other_cell in other.cells.items():
+            cell = self._cell(key)
+            for column in self.columns:
+                if column in other_cell:
+                    cell[column].merge(other_cell[column])
+        return self
+    
+    def select(self, year=None, month=None):
+        """연도/월 조건에 맞는 셀만 담은 누적값 (None이면 전체, 통계 객체는 공유)"""
+        selected = WeatherAccumulator(self.columns, self.edges)
+        selected.cells = {
+            key: cell for key, cell in self.cells.items()
+            if (year is None or key[0] == year) and (month is None or key[1] == month)
+        }
+        return selected
+    
+    def total(self, column):
+        """모든 셀을 합친 컬럼 하나의 RunningStats"""
+        stats = RunningStats(self.edges[column])
+        for cell in self.cells.values():
+            stats.merge(cell[column])
+        return stats
+    
+    def group_stats(self, column, by=("Year", "Month")):
+        """by(Year/Month 또는 둘 다)별 count, mean, std, min, max, sum 표"""
+        by = list(by)
+        positions = [ACCUMULATOR_KEYS.index(key) for key in by]
+        groups = {}
+        for key in sorted(self.cells):
+            group = tuple(key[position] for position in positions)
+            if group not in groups:
+                groups[group] = RunningStats(self.edges[column])
+            groups[group].merge(self.cells[key][column])
+        
+        rows = [dict(zip(by, group), **stats.to_dict()) for group, stats in groups.items()]
+        return pd.DataFrame(rows, columns=by + ["count", "mean", "std", "min", "max", "sum"])
+
+def _numeric_columns(df):
+    return [
+        column for column in df.columns
+        if column not in ("Year", "Month", "Day") and pd.api.types.is_numeric_dtype(df[column])
+    ]
+
+def build_weather_accumulator(df, columns=None):
+    """일별 DataFrame으로 (Year, Month)별 누적 통계 생성"""
+    columns = _numeric_columns(df) if columns is None else list(columns)
+    return WeatherAccumulator(columns).update_frame(df)
+
+def accumulate_chunks(chunks, columns=None):
+    """전처리된 청크들(예: iter_processed_chunks)을 차례로 누적 (청크는 집계 후 바로 버려짐)"""
+    accumulator = None
+    for chunk in chunks:
+        if accumulator is None:
+            accumulator = WeatherAccumulator(_numeric_columns(chunk) if columns is None else columns)
+        accumulator.update_frame(chunk)
+    
+    return accumulator
+
+def get_weather_accumulator(df, columns=None):
+    """데이터 버전별로 캐시된 누적 통계 반환 (get_aggregate_cube와 같은 키 규칙)"""
+    columns = _numeric_columns(df) if columns is None else list(columns)
+    frame_key = frame_cache_key(df)
+    if frame_key is None:
+        return build_weather_accumulator(df, columns)
+    
+    key = (frame_key, tuple(columns))
+    if key in _ACCUMULATOR_CACHE:
+        _ACCUMULATOR_CACHE.move_to_end(key)
+        return _ACCUMULATOR_CACHE[key]
+    
+    accumulator = build_weather_accumulator(df, columns)
+    _ACCUMULATOR_CACHE[key] = accumulator
+    if len(_ACCUMULATOR_CACHE) > _ACCUMULATOR_CACHE_SIZE:
+        _ACCUMULATOR_CACHE.popitem(last=False)
+    
+    return accumulator
@@ -0,0 +1,208 @@
+"""
+괌 날씨 데이터 (Year, Month) 집계 큐브 모듈
+
+일별 데이터를 (Year, Month)별 합계, 개수, 최소, 최대, 제곱합으로 한 번만 집계해 두고
+연도별/월별 평균, 합계, 표준편차 등은 일별 행 대신 큐브에서 계산한다.
+Station 컬럼이 있으면 (Station, Year, Month)별로 한 번의 groupby로 집계한다.
+"""
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+try:
+    from .stations import STATION_COLUMN
+except ImportError:
+    from stations import STATION_COLUMN
+
+CUBE_KEYS = ["Year", "Month"]
+CUBE_STATS = ["sum", "count", "min", "max", "sumsq"]
+
+# 집계 대상에서 제외할 달력 컬럼
+CALENDAR_COLUMNS = ["Year", "Month", "Day"]
+
+# 데이터 버전별 큐브 캐시 (최근 사용 순)
+_CUBE_CACHE = OrderedDict()
+_CUBE_CACHE_SIZE = 8
+
+def set_data_version(df, version):
+    """df.attrs에 데이터 버전과 그 버전의 전체 행 수 기록 (캐시 키 기준, 반환값은 df)"""
+    df.attrs["data_version"] = version
+    df.attrs["data_rows"] = len(df)
+    return df
+
+def frame_cache_key(df):
+    """캐시 키용 (데이터 버전, 행 수): 버전을 기록한 전체 DataFrame일 때만, 아니면 None
+    
+    df.attrs는 필터링한 DataFrame에도 그대로 복사되므로 기록해 둔 전체 행 수(data_rows)와
+    행 수가 다르면 부분 데이터로 보고 캐시하지 않는다 (행을 읽지 않는 O(1) 검사).
+    부분 데이터 집계는 전체 큐브에서 select_cube(year/month/station)로 고른다.
+    값을 직접 바꾼 DataFrame은 데이터 버전이 내용을 대표하지 않으므로 attrs["data_version"]을 지워야 한다.
+    """
+    version = df.attrs.get("data_version")
+    if version is None or df.attrs.get("data_rows") != len(df):
+        return None
+    return version, len(df)
+
+def station_keys(data):
+    """DataFrame 컬럼 또는 큐브 인덱스에 Station이 있으면 ["Station"], 없으면 []"""
+    return [STATION_COLUMN] if STATION_COLUMN in data.index.names or STATION_COLUMN in data.columns else []
+
+def _measure_columns(df, columns=None):
+    """집계할 숫자 컬럼 목록"""
+    if columns is not None:
+        return list(columns)
+    return [
+        column for column in df.columns
+        if column not in CALENDAR_COLUMNS and pd.api.types.is_numeric_dtype(df[column])
+    ]
+
+def build_aggregate_cube(df, columns=None):
+    """일별 데이터로 (Year, Month)별 sum, count, min, max, sumsq 큐브 생성
+    
+    컬럼은 (측정값, 통계) MultiIndex이며 값은 float64(count는 int64)로 저장한다.
+    Station 컬럼이 있으면 인덱스는 (Station, Year, Month)
+    """
+    columns = _measure_columns(df, columns)
+    values = df[columns].astype("float64")
+    names = station_keys(df) + CUBE_KEYS
+    keys = [df[key] for key in names]
+    
+    grouped = values.groupby(keys, observed=True)
+    stats = {
+        "sum": grouped.sum(),
+        "count": grouped.count(),
+        "min": grouped.min(),
+        "max": grouped.max(),
+        "sumsq": (values ** 2).groupby(keys, observed=True).sum()
+    }
+    
+    cube = pd.concat(stats, axis=1).swaplevel(axis=1)
+    cube = cube.reindex(columns=pd.MultiIndex.from_product([columns, CUBE_STATS]))
+    cube.index.names = names
+    
+    return cube
+
+def get_aggregate_cube(df, columns=None):
+    """데이터 버전별로 캐시된 집계 큐브 반환
+    
+    load_processed_data가 붙여 준 데이터 버전이 있는 전체 DataFrame이면
+    (버전, 컬럼)이 같은 동안 큐브를 다시 만들지 않는다. 필터링된 DataFrame은
+    캐시하지 않고 바로 집계한다 (frame_cache_key).
+    """
+    columns = _measure_columns(df, columns)
+    frame_key = frame_cache_key(df)
+    if frame_key is None:
+        return build_aggregate_cube(df, columns)
+    
+    key = (frame_key, tuple(columns))
+    if key in _CUBE_CACHE:
+        _CUBE_CACHE.move_to_end(key)
+        return _CUBE_CACHE[key]
+    
+    cube = build_aggregate_cube(df, columns)
+    _CUBE_CACHE[key] = cube
+    if len(_CUBE_CACHE) > _CUBE_CACHE_SIZE:
+        _CUBE_CACHE.popitem(last=False)
+    
+    return cube
+
+def select_cube(cube, year=None, month=None, station=None):
+    """연도/월/관측소 조건에 맞는 큐브 행만 선택 (None이면 전체)"""
+    mask = np.ones(len(cube), dtype=bool)
+    if station is not None:
+        mask &= cube.index.get_level_values(STATION_COLUMN) == station
+    if year is not None:
+        mask &= cube.index.get_level_values("Year") == year
+    if month is not None:
+        mask &= cube.index.get_level_values("Month") == month
+    return cube[mask]
+
+def _combine(cube, grouper, names):
+    """큐브 행들을 grouper 기준으로 합치기 (sum/count/sumsq는 합, min/max는 최소/최대)"""
+    how = {"sum": "sum", "count": "sum", "min": "min", "max": "max", "sumsq": "sum"}
+    stats = {
+        stat: cube.xs(stat, axis=1, level=1).groupby(grouper).agg(func)
+        for stat, func in how.items()
+    }
+    combined = pd.concat(stats, axis=1).swaplevel(axis=1)
+    combined = combined.reindex(columns=cube.columns)
+    if names:
+        combined.index.names = names
+    
+    return combined
+
+def _rollup(cube, by):
+    """큐브를 by 키(예: ["Year"], ["Month"], ["Station", "Year"], [])로 다시 합산"""
+    by = list(by)
+    if by == list(cube.index.names):
+        return cube
+    
+    if by:
+        grouper = [cube.index.get_level_values(key) for key in by]
+    else:
+        grouper = np.zeros(len(cube), dtype=int)
+    
+    return _combine(cube, grouper, by)
+
+def merge_cubes(cubes):
+    """파일/청크별로 만든 큐브들을 하나로 병합 (같은 (Year, Month)는 통계를 합침)"""
+    cubes = [cube for cube in cubes if cube is not None]
+    combined = pd.concat(cubes)
+    if combined.index.is_unique:
+        return combined.sort_index()
+    
+    names = list(combined.index.names)
+    grouper = [combined.index.get_level_values(key) for key in names]
+    return _combine(combined, grouper, names)
+
+def _cube_stat(rolled, column, stat):
+    """합산된 큐브에서 컬럼 하나의 통계값 계산"""
+    part = rolled[column]
+    if stat in ("sum", "count", "min", "max"):
+        return part[stat]
+    
+    count = part["count"]
+    mean = part["sum"] / count
+    if stat == "mean":
+        return mean
+    
+    # 표본 분산 (pandas 기본값과 같은 ddof=1)
+    var = (part["sumsq"] - part["sum"] * mean) / (count - 1)
+    var = var.where(count > 1).clip(lower=0)
+    if stat == "var":
+        return var
+    if stat == "std":
+        return np.sqrt(var)
+    
+    raise ValueError(f"지원하지 않는 통계: {stat}")
+
+def cube_summary(cube, aggregations, by=("Year", "Month")):
+    """큐브에서 groupby(by).agg(aggregations)와 같은 모양의 요약표 계산
+    
+    aggregations: {컬럼: 통계} 또는 {컬럼: [통계, ...]} 형태
+    (통계: sum, count, min, max, mean, var, std, 목록이면 (컬럼, 통계) 컬럼 생성)
+    by가 비어 있으면 전체 기간에 대한 값 하나씩을 담은 Series 반환
+    """
+    by = list(by)
+    rolled = _rollup(cube, by)
+    
+    summary = {}
+    for column, stat in aggregations.items():
+        if isinstance(stat, (list, tuple)):
+            for name in stat:
+                summary[(column, name)] = _cube_stat(rolled, column, name)
+        else:
+            summary[column] = _cube_stat(rolled, column, stat)
+    summary = pd.DataFrame(summary)
+    
+    if not by:
+        return summary.iloc[0]
+    return summary.reset_index()
+
+def cube_pivot(cube, column, stat="mean"):
+    """월(행) × 연도(열) 표 계산 (groupby(['Year','Month']).mean().unstack(level=0)와 같은 모양)
+    
+    관측소 큐브면 열은 (Station, Year)
+    """
+    values = _cube_stat(cube, column, stat)
+    return values.unstack(level=station_keys(cube) + ["Year"])
@@ -0,0 +1,118 @@
+"""
+괌 날씨 이상치(이상 기온/강수) 탐지 모듈
+
+모든 점수는 컬럼 단위 벡터 연산으로 한 번에 계산하고,
+기준값/편차/점수를 담은 순위 표(|점수| 큰 순)를 반환한다.
+- zscore: 전체 평균/표준편차 기준
+- seasonal: 같은 달(1~12월)끼리의 평균/표준편차 기준 (계절 효과 제거)
+- rolling: 직전 window일의 이동 평균/표준편차 기준
+- mad: 중앙값과 MAD(중앙값 절대 편차) 기준 (극단값에 덜 민감)
+"""
+import numpy as np
+import pandas as pd
+
+# |점수|가 이 값보다 크면 이상치
+ANOMALY_THRESHOLD = 2.0
+
+# MAD를 정규분포 표준편차 척도로 맞추는 상수 (robust z = 0.6745 · (x - median) / MAD)
+MAD_SCALE = 0.6745
+
+ANOMALY_METHODS = {
+    "zscore": "Z-score",
+    "seasonal": "월별(계절) Z-score",
+    "rolling": "이동 Z-score",
+    "mad": "MAD (로버스트)"
+}
+
+def _safe_divide(numerator, denominator):
+    denominator = np.where(denominator == 0, np.nan, denominator)
+    return numerator / denominator
+
+def zscore(values, ddof=0):
+    """전체 평균/표준편차 기준 z-score, (점수, 기준값) 반환"""
+    values = pd.Series(values, dtype=float)
+    baseline = np.full(len(values), values.mean())
+    return _safe_divide(values.to_numpy() - baseline, values.std(ddof=ddof)), baseline
+
+def seasonal_zscore(values, groups, ddof=0):
+    """groups(예: Month)별 평균/표준편차 기준 z-score, (점수, 기준값) 반환"""
+    grouped = pd.Series(values, dtype=float).groupby(np.asarray(groups))
+    baseline = grouped.transform("mean").to_numpy()
+    spread = grouped.transform("std", ddof=ddof).to_numpy()
+    return _safe_divide(np.asarray(values, dtype=float) - baseline, spread), baseline
+
+def rolling_zscore(values, window=30, min_periods=7):
+    """직전 window개(자기 자신 제외) 이동 평균/표준편차 기준 z-score, (점수, 기준값) 반환
+    
+    values는 시간 순으로 정렬되어 있어야 한다.
+    """
+    values = pd.Series(values, dtype=float)
+    rolling = values.rolling(window, min_periods=min_periods)
+    baseline = rolling.mean().shift(1).to_numpy()
+    spread = rolling.std().shift(1).to_numpy()
+    return _safe_divide(values.to_numpy() - baseline, spread), baseline
+
+def mad_score(values, groups=None):
+    """중앙값/MAD 기준 로버스트 점수 (groups를 주면 그룹별), (점수, 기준값) 반환"""
+    values = pd.Series(values, dtype=float)
+    if groups is None:
+        baseline = np.full(len(values), values.median())
+        mad = np.full(len(values), (values - baseline).abs().median())
+    else:
+        groups = np.asarray(groups)
+        baseline = values.groupby(groups).transform("median").to_numpy()
+        mad = (values - baseline).abs().groupby(groups).transform("median").to_numpy()
+    return _safe_divide(MAD_SCALE * (values.to_numpy() - baseline), mad), baseline
+
+def anomaly_scores(df, column, method="zscore", by="Month", window=30):
+    """method에 따른 (점수, 기준값) 배열"""
+    values = df[column].to_numpy()
+    if method == "zscore":
+        return zscore(values)
+    if method == "seasonal":
+        return seasonal_zscore(values, df[by].to_numpy())
+    if method == "rolling":
+        return rolling_zscore(values, window=window)
+    if method == "mad":
+        return mad_score(values)
+    raise ValueError(f"지원하지 않는 이상치 탐지 방법: {method}")
+
+def detect_anomalies(df, column, method="zscore", threshold=ANOMALY_THRESHOLD, by="Month", window=30, top=None):
+    """|점수| > threshold인 행을 |점수| 큰 순으로 정렬한 이상치 표
+    
+    Date(있으면), Year, Month, Value, Baseline, Deviation(값 - 기준값), Score, Direction(high/low) 컬럼.
+    """
+    if df.empty:
+        return pd.DataFrame(columns=["Date", "Year", "Month", "Value", "Baseline", "Deviation", "Score", "Direction"])
+    
+    scores, baseline = anomaly_scores(df, column, method=method, by=by, window=window)
+    mask = np.abs(np.nan_to_num(scores)) > threshold
+    
+    positions = np.flatnonzero(mask)
+    order = positions[np.argsort(-np.abs(scores[positions]), kind="stable")]
+    if top is not None:
+        order = order[:top]
+    
+    values = df[column].to_numpy(dtype=float)
+    table = pd.DataFrame({
+        "Year": df["Year"].to_numpy()[order],
+        "Month": df["Month"].to_numpy()[order],
+        "Value": values[order],
+        "Baseline": baseline[order],
+        "Deviation": values[order] - baseline[order],
+        "Score": scores[order],
+        "Direction": np.where(values[order] > baseline[order], "high", "low")
+    })
+    if "Date" in df:
+        table.insert(0, "Date", df["Date"].to_numpy()[order])
+    return table
+
+def anomaly_table(df, columns, method="zscore", threshold=ANOMALY_THRESHOLD, by="Month", window=30, top=None):
+    """여러 컬럼의 이상치를 Measure 컬럼으로 구분해 하나의 순위 표로 합침"""
+    tables = [
+        detect_anomalies(df, column, method, threshold, by, window).assign(Measure=column)
+        for column in columns
+    ]
+    table = pd.concat(tables, ignore_index=True)
+    table = table.iloc[np.argsort(-table["Score"].abs().to_numpy(), kind="stable")].reset_index(drop=True)
+    return table if top is None else table.head(top)
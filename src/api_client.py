@@ -1,32 +1,235 @@
 """
 National Weather Service API를 활용한 날씨 데이터 수집 모듈
 """
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
 import requests
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+try:
+    from .timeseries import HourlySeries
+    from .climatology import get_climatology
+    from .instrumentation import instrument, current_span
+except ImportError:
+    from timeseries import HourlySeries
+    from climatology import get_climatology
+    from instrumentation import instrument, current_span
+
+DEFAULT_BASE_URL = "https://api.weather.gov"
+DEFAULT_TIMEOUT = 10
+
+# 좌표 → 격자점(gridpoint) 매핑은 바뀌지 않으므로 파일에 영구 저장
+DEFAULT_POINTS_CACHE_PATH = os.path.join(".cache", "nws_points.json")
+
+# points 응답에서 보관할 항목
+POINTS_PROPERTIES = [
+    "gridId", "gridX", "gridY",
+    "forecast", "forecastHourly", "forecastGridData", "timeZone"
+]
+
+class ForecastCache:
+    """예보 응답 LRU 캐시 (TTL 만료 후에는 ETag/Last-Modified로 재검증)
+    
+    TTL은 예보의 updateTime(없으면 generatedAt) + 갱신 주기까지 남은 시간으로 정하고
+    min_ttl ~ max_ttl 범위로 제한한다.
+    """
+    
+    def __init__(self, max_entries=128, refresh_interval=3600, min_ttl=60, max_ttl=3600):
+        self.max_entries = max_entries
+        self.refresh_interval = refresh_interval
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get(self, url):
+        """캐시 항목 조회 (만료 여부와 관계없이 반환, 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+    
+    def is_fresh(self, entry, now=None):
+        """TTL이 남아 있는 항목인지 확인"""
+        now = time.time() if now is None else now
+        return entry is not None and entry["expires_at"] > now
+    
+    def ttl_for(self, data, now=None):
+        """예보의 갱신 시각으로부터 다음 갱신까지 남은 시간(초) 계산"""
+        now = time.time() if now is None else now
+        properties = data.get("properties", {}) if isinstance(data, dict) else {}
+        issued = properties.get("updateTime") or properties.get("generatedAt")
+        
+        if not issued:
+            return self.min_ttl
+        try:
+            issued_at = pd.Timestamp(issued).timestamp()
+        except ValueError:
+            return self.min_ttl
+        
+        ttl = issued_at + self.refresh_interval - now
+        return min(max(ttl, self.min_ttl), self.max_ttl)
+    
+    def put(self, url, data, headers=None):
+        """응답 저장 (재검증용 ETag/Last-Modified 함께 보관)"""
+        headers = headers or {}
+        entry = {
+            "data": data,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "expires_at": time.time() + self.ttl_for(data)
+        }
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+    
+    def refresh(self, url, entry):
+        """304 Not Modified 응답을 받은 항목의 TTL 갱신"""
+        entry["expires_at"] = time.time() + self.ttl_for(entry["data"])
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+        return entry
+    
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+class PointsCache:
+    """좌표 → 격자점/예보 URL 매핑 영구 저장소 (JSON 파일)"""
+    
+    def __init__(self, path=DEFAULT_POINTS_CACHE_PATH):
+        self.path = path
+        self._points = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(latitude, longitude):
+        """캐시 키 (NWS API는 좌표를 소수점 4자리까지 사용)"""
+        return f"{float(latitude):.4f},{float(longitude):.4f}"
+    
+    def _load(self):
+        """저장된 매핑을 처음 한 번만 파일에서 읽기"""
+        if self._points is None:
+            self._points = {}
+            if not self.path:
+                return self._points
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._points = json.load(f)
+            except (OSError, ValueError):
+                self._points = {}
+        return self._points
+    
+    def get(self, latitude, longitude):
+        """좌표의 격자점 정보 조회 (없으면 None)"""
+        with self._lock:
+            return self._load().get(self.key(latitude, longitude))
+    
+    def put(self, latitude, longitude, properties):
+        """좌표의 격자점 정보 저장 (path가 있으면 파일에도 기록)"""
+        self.put_many({(latitude, longitude): properties})
+    
+    def put_many(self, entries):
+        """{(위도, 경도): 격자점 정보} 여러 개를 저장하고 파일은 한 번만 기록"""
+        if not entries:
+            return
+        with self._lock:
+            points = self._load()
+            for (latitude, longitude), properties in entries.items():
+                points[self.key(latitude, longitude)] = properties
+            if not self.path:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(points, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"위치 정보 캐시 저장 실패: {e}")
+
+# 같은 프로세스의 클라이언트들이 함께 쓰는 기본 캐시
+_default_forecast_cache = ForecastCache()
+_default_points_cache = PointsCache()
+
 class WeatherAPI:
     """National Weather Service API 클라이언트"""
     
-    def __init__(self):
-        self.base_url = "https://api.weather.gov"
+    def __init__(self, base_url=DEFAULT_BASE_URL, cache=None, points_cache=None, timeout=DEFAULT_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache if cache is not None else _default_forecast_cache
+        self.points_cache = points_cache if points_cache is not None else _default_points_cache
+        self.timeout = timeout
         self.session = requests.Session()
         # API 요청시 User-Agent 헤더 추가 (API 요구사항)
         self.session.headers.update({
             'User-Agent': 'GuamWeatherAnalysis/1.0 (educational-project)'
         })
     
+    @instrument(rows=None)
+    def _get_json(self, url):
+        """캐시를 거쳐 JSON 조회 (만료된 항목은 조건부 요청으로 재검증)"""
+        entry = self.cache.get(url)
+        if self.cache.is_fresh(entry):
+            return entry["data"]
+        
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and entry is not None:
+            return self.cache.refresh(url, entry)["data"]
+        
+        response.raise_for_status()
+        current_span().add_bytes(len(response.content))
+        data = response.json()
+        self.cache.put(url, data, response.headers)
+        return data
+    
+    @instrument(rows=None)
     def get_location_info(self, latitude, longitude):
-        """위도/경도를 기반으로 위치 정보 조회"""
+        """위도/경도를 기반으로 위치 정보 조회 (격자점 매핑은 영구 캐시)
+        
+        캐시 적중 여부와 관계없이 {"properties": {POINTS_PROPERTIES 항목}} 형태로 반환한다.
+        """
+        cached = self.points_cache.get(latitude, longitude)
+        if cached:
+            return {"properties": cached}
+        
         try:
             points_url = f"{self.base_url}/points/{latitude},{longitude}"
-            response = self.session.get(points_url)
+            response = self.session.get(points_url, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            current_span().add_bytes(len(response.content))
+            location_data = response.json()
         except requests.RequestException as e:
             print(f"위치 정보 조회 실패: {e}")
             return None
+        
+        properties = location_data.get("properties", {})
+        points = {key: properties[key] for key in POINTS_PROPERTIES if key in properties}
+        self.points_cache.put(latitude, longitude, points)
+        return {"properties": points}
     
+    @instrument(rows=None)
     def get_forecast_data(self, latitude, longitude):
         """7일 날씨 예보 데이터 조회"""
         try:
@@ -38,10 +241,8 @@ class WeatherAPI:
             # 2. 예보 URL 추출
             forecast_url = location_data['properties']['forecast']
             
-            # 3. 예보 데이터 조회
-            forecast_response = self.session.get(forecast_url)
-            forecast_response.raise_for_status()
-            forecast_data = forecast_response.json()
+            # 3. 예보 데이터 조회 (TTL 안이면 캐시, 만료되면 조건부 재검증)
+            forecast_data = self._get_json(forecast_url)
             
             return forecast_data
             
@@ -52,56 +253,168 @@ class WeatherAPI:
             print(f"응답 데이터 구조 오류: {e}")
             return None
     
-    def process_forecast_data(self, forecast_data):
-        """예보 데이터를 DataFrame으로 변환"""
-        if not forecast_data:
+    def _get_location_json(self, latitude, longitude, url_key):
+        """위치 정보의 url_key(forecastHourly, forecastGridData 등) URL 응답 조회"""
+        try:
+            location_data = self.get_location_info(latitude, longitude)
+            if not location_data:
+                return None
+            return self._get_json(location_data['properties'][url_key])
+        except requests.RequestException as e:
+            print(f"예보 데이터 조회 실패: {e}")
+            return None
+        except KeyError as e:
+            print(f"응답 데이터 구조 오류: {e}")
+            return None
+    
+    def get_hourly_forecast_data(self, latitude, longitude):
+        """시간별 예보 데이터(forecastHourly) 조회"""
+        return self._get_location_json(latitude, longitude, 'forecastHourly')
+    
+    def get_gridpoint_data(self, latitude, longitude):
+        """격자점 원시 예보 데이터(forecastGridData) 조회"""
+        return self._get_location_json(latitude, longitude, 'forecastGridData')
+    
+    def _time_zone(self, latitude, longitude):
+        """지점의 현지 시간대 (위치 정보에 없으면 None)"""
+        location_data = self.get_location_info(latitude, longitude)
+        if not location_data:
+            return None
+        return location_data['properties'].get('timeZone')
+    
+    def get_hourly_series(self, latitude, longitude, field="temperature"):
+        """시간별 예보의 field 값을 고정 간격 HourlySeries로 반환 (기온은 섭씨)"""
+        hourly_data = self.get_hourly_forecast_data(latitude, longitude)
+        if not hourly_data:
             return None
         
         try:
-            periods = forecast_data['properties']['periods']
-            
-            # 낮과 밤 데이터 분리
-            day_periods = [p for p in periods if p['isDaytime']]
-            night_periods = [p for p in periods if not p['isDaytime']]
-            
-            # 날짜별 최고/최저 기온 데이터 생성
-            dates = []
-            highs_f = []
-            lows_f = []
-            
-            # 데이터 길이 맞추기
-            min_length = min(len(day_periods), len(night_periods))
-            
-            for i in range(min_length):
-                date_str = day_periods[i]['startTime'][:10]
-                dates.append(date_str)
-                highs_f.append(day_periods[i]['temperature'])
-                lows_f.append(night_periods[i]['temperature'])
-            
-            # 화씨를 섭씨로 변환
-            highs_c = [(temp - 32) * 5/9 for temp in highs_f]
-            lows_c = [(temp - 32) * 5/9 for temp in lows_f]
-            
-            # DataFrame 생성
-            df = pd.DataFrame({
-                'Date': dates,
-                'High (°C)': highs_c,
-                'Low (°C)': lows_c,
-                'High (°F)': highs_f,
-                'Low (°F)': lows_f
-            })
-            
-            # Date 컬럼을 datetime으로 변환
-            df['Date'] = pd.to_datetime(df['Date'])
-            
-            return df
-            
-        except Exception as e:
-            print(f"데이터 처리 중 오류 발생: {e}")
+            periods = hourly_data['properties']['periods']
+            return HourlySeries.from_periods(periods, field=field, tz=self._time_zone(latitude, longitude))
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"시간별 예보 처리 중 오류 발생: {e}")
             return None
+    
+    def get_gridpoint_series(self, latitude, longitude, field="temperature"):
+        """격자점 데이터의 field(temperature, dewpoint 등) 값을 HourlySeries로 반환"""
+        grid_data = self.get_gridpoint_data(latitude, longitude)
+        if not grid_data:
+            return None
+        
+        try:
+            layer = grid_data['properties'][field]
+            return HourlySeries.from_grid_values(
+                layer['values'], unit=layer.get('uom'), name=field,
+                tz=self._time_zone(latitude, longitude)
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"격자점 데이터 처리 중 오류 발생: {e}")
+            return None
+    
+    @instrument()
+    def process_forecast_data(self, forecast_data):
+        """예보 데이터를 DataFrame으로 변환"""
+        return forecast_to_dataframe(forecast_data)
+
+def periods_to_columns(periods):
+    """예보 period 목록(JSON)을 한 번의 순회로 numpy 컬럼 배열(dict)로 변환
+    
+    startTime, Date(YYYY-MM-DD), isDaytime, temperature_f, windSpeed, windDirection,
+    shortForecast, precip_prob 배열을 만든다. 섭씨로 온 기온은 화씨로 맞춘다.
+    """
+    rows = [
+        (
+            p.get('startTime') or '',
+            bool(p.get('isDaytime')),
+            p.get('temperature'),
+            p.get('temperatureUnit'),
+            p.get('windSpeed'),
+            p.get('windDirection'),
+            p.get('shortForecast'),
+            (p.get('probabilityOfPrecipitation') or {}).get('value')
+        )
+        for p in periods
+    ]
+    start_times, is_daytime, temperature, unit, wind_speed, wind_direction, short_forecast, precip_prob = (
+        zip(*rows) if rows else [()] * 8
+    )
+    
+    temperature = np.array(temperature, dtype=float)
+    is_celsius = np.array(unit, dtype=object) == 'C'
+    temperature = np.where(is_celsius, temperature * 9 / 5 + 32, temperature)
+    start_times = np.array(start_times, dtype=object)
+    
+    return {
+        'startTime': start_times,
+        'Date': np.array([start_time[:10] for start_time in start_times], dtype=object),
+        'isDaytime': np.array(is_daytime, dtype=bool),
+        'temperature_f': temperature,
+        'windSpeed': np.array(wind_speed, dtype=object),
+        'windDirection': np.array(wind_direction, dtype=object),
+        'shortForecast': np.array(short_forecast, dtype=object),
+        'precip_prob': np.array(precip_prob, dtype=float)
+    }
+
+def forecast_to_dataframe(forecast_data):
+    """예보 응답(JSON)을 날짜별 최고/최저 기온 DataFrame으로 변환
+    
+    낮 period의 최고 기온과 밤 period의 최저 기온을 순서가 아닌 날짜로 짝지으므로
+    "Tonight"으로 시작하는 응답이나 시간별(hourly) 예보도 같은 방식으로 처리된다.
+    풍속/풍향/요약 예보는 그날 첫 낮 period 기준, 강수 확률은 그날의 최댓값을 함께 반환한다.
+    """
+    if not forecast_data:
+        return None
+    
+    try:
+        columns = periods_to_columns(forecast_data['properties']['periods'])
+        temperature = columns['temperature_f']
+        is_day = columns['isDaytime']
+        
+        # 날짜별로 묶기 (unique_dates는 정렬된 날짜, date_index는 period별 날짜 번호)
+        unique_dates, date_index = np.unique(columns['Date'].astype(str), return_inverse=True)
+        date_count = len(unique_dates)
+        
+        # 날짜별 낮 최고 / 밤 최저 기온
+        highs_f = np.full(date_count, np.nan)
+        lows_f = np.full(date_count, np.nan)
+        np.fmax.at(highs_f, date_index[is_day], temperature[is_day])
+        np.fmin.at(lows_f, date_index[~is_day], temperature[~is_day])
+        
+        precip_prob = np.full(date_count, np.nan)
+        np.fmax.at(precip_prob, date_index, columns['precip_prob'])
+        
+        # 날짜별 첫 낮 period 위치 (풍속/풍향/요약 예보용)
+        day_positions = np.flatnonzero(is_day)
+        day_dates, first_day = np.unique(date_index[day_positions], return_index=True)
+        first_day_position = np.full(date_count, -1)
+        first_day_position[day_dates] = day_positions[first_day]
+        
+        # 낮/밤 기온이 모두 있는 날짜만 사용
+        keep = ~np.isnan(highs_f) & ~np.isnan(lows_f)
+        detail_position = first_day_position[keep]
+        
+        # 화씨를 섭씨로 변환 (배열 연산)
+        df = pd.DataFrame({
+            'Date': pd.to_datetime(unique_dates[keep], format="%Y-%m-%d"),
+            'High (°C)': (highs_f[keep] - 32) * 5 / 9,
+            'Low (°C)': (lows_f[keep] - 32) * 5 / 9,
+            'High (°F)': highs_f[keep],
+            'Low (°F)': lows_f[keep],
+            'Wind Speed': columns['windSpeed'][detail_position],
+            'Wind Direction': columns['windDirection'][detail_position],
+            'Short Forecast': columns['shortForecast'][detail_position],
+            'Precip Prob (%)': precip_prob[keep]
+        })
+        
+        return df
+    
+    except Exception as e:
+        print(f"데이터 처리 중 오류 발생: {e}")
+        return None
 
-def get_guam_forecast():
-    """괌의 7일 날씨 예보 조회"""
+@instrument()
+def get_guam_forecast(archive=None):
+    """괌의 7일 날씨 예보 조회 (archive(ForecastArchive)를 주면 조회한 예보를 스냅샷으로 누적 저장)"""
     # 괌의 좌표
     GUAM_LAT = 13.4443
     GUAM_LON = 144.7937
@@ -113,25 +426,68 @@ def get_guam_forecast():
     
     if forecast_data:
         print("예보 데이터 조회 성공!")
+        if archive is not None:
+            # 아카이브 저장 실패(디스크/parquet 오류)가 예보 조회 자체를 막지 않도록 경고만 출력
+            try:
+                archive.append_forecast(forecast_data, "Guam", GUAM_LAT, GUAM_LON)
+            except Exception as e:
+                print(f"예보 아카이브 저장 실패: {e}")
         df = api_client.process_forecast_data(forecast_data)
         return df
     else:
         print("예보 데이터 조회 실패")
         return None
 
-def compare_with_historical(forecast_df, historical_df):
-    """예보 데이터와 과거 데이터 비교"""
+@instrument()
+def get_guam_hourly_forecast(source="hourly"):
+    """괌의 시간별 예보를 현지 날짜별 최고/최저 기온으로 요약 (compare_with_historical 입력 형식)
+    
+    source가 "hourly"면 forecastHourly, "grid"면 forecastGridData를 사용한다.
+    """
+    GUAM_LAT = 13.4443
+    GUAM_LON = 144.7937
+    
+    api_client = WeatherAPI()
+    
+    print("괌 시간별 예보 데이터를 조회 중...")
+    if source == "grid":
+        series = api_client.get_gridpoint_series(GUAM_LAT, GUAM_LON)
+    else:
+        series = api_client.get_hourly_series(GUAM_LAT, GUAM_LON)
+    
+    if series is None or len(series) == 0:
+        print("시간별 예보 데이터 조회 실패")
+        return None
+    
+    print(f"시간별 예보 데이터 조회 성공! ({len(series)}시간)")
+    return series.resample_daily(tz=series.tz or "Pacific/Guam")
+
+@instrument(rows="input")
+def compare_with_historical(forecast_df, historical_df, climatology=None):
+    """예보 데이터와 과거 데이터 비교
+    
+    과거 평균은 예보 날짜들의 평년값(날짜별 기후 평균, climatology 모듈)의 평균이다.
+    예보에 Date 컬럼이 없으면 현재 월의 과거 평균을 사용한다.
+    """
     if forecast_df is None or historical_df is None:
         return None
     
     try:
-        # 현재 날짜 기준으로 과거 같은 시기 데이터 추출
-        current_month = datetime.now().month
-        historical_same_month = historical_df[historical_df['Month'] == current_month]
-        
-        # 과거 같은 달의 평균 기온 계산
-        hist_avg_max = historical_same_month['Maximum'].mean()
-        hist_avg_min = historical_same_month['Minimum'].mean()
+        if 'Date' in forecast_df.columns and 'Date' in historical_df.columns:
+            # 예보 날짜마다 평년값을 O(1)로 조회 (누적합 엔진은 데이터 버전별로 한 번만 생성)
+            if climatology is None:
+                climatology = get_climatology(historical_df, ['Maximum', 'Minimum'])
+            forecast_dates = pd.to_datetime(forecast_df['Date'])
+            hist_avg_max = np.nanmean(climatology.normal('Maximum', forecast_dates))
+            hist_avg_min = np.nanmean(climatology.normal('Minimum', forecast_dates))
+        else:
+            # 현재 날짜 기준으로 과거 같은 시기 데이터 추출
+            current_month = datetime.now().month
+            historical_same_month = historical_df[historical_df['Month'] == current_month]
+            
+            # 과거 같은 달의 평균 기온 계산
+            hist_avg_max = historical_same_month['Maximum'].mean()
+            hist_avg_min = historical_same_month['Minimum'].mean()
         
         # 예보 데이터의 평균 계산
         forecast_avg_max = forecast_df['High (°C)'].mean()
@@ -147,7 +503,7 @@ def compare_with_historical(forecast_df, historical_df):
         }
         
         return comparison
-        
+    
     except Exception as e:
         print(f"비교 분석 중 오류 발생: {e}")
         return None 
\ No newline at end of file
@@ -0,0 +1,169 @@
+"""
+여러 지점의 National Weather Service 예보를 동시에 조회하는 asyncio 클라이언트 모듈
+
+WeatherAPI(api_client.py)와 같은 엔드포인트를 사용하며, 좌표 수십 개의 points/forecast
+요청을 동시 실행 수 제한, 호스트별 연결 풀, 타임아웃, 지수 백오프 재시도와 함께 처리한다.
+"""
+import asyncio
+import random
+import aiohttp
+import pandas as pd
+
+try:
+    from .api_client import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, POINTS_PROPERTIES, PointsCache, forecast_to_dataframe
+except ImportError:
+    from api_client import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, POINTS_PROPERTIES, PointsCache, forecast_to_dataframe
+
+# 재시도할 HTTP 상태 코드 (요청 제한, 일시적 서버 오류)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 미크로네시아 주요 관측 지점 (이름: (위도, 경도))
+MICRONESIA_LOCATIONS = {
+    "Guam": (13.4443, 144.7937),
+    "Saipan": (15.1850, 145.7467),
+    "Tinian": (14.9992, 145.6194),
+    "Rota": (14.1509, 145.2149),
+    "Yap": (9.5144, 138.1292),
+    "Chuuk": (7.4167, 151.7833),
+    "Pohnpei": (6.9248, 158.1610),
+    "Kosrae": (5.3167, 162.9833),
+    "Palau": (7.3419, 134.4792),
+    "Majuro": (7.0897, 171.3803)
+}
+
+class AsyncWeatherAPI:
+    """여러 좌표의 예보를 동시에 조회하는 NWS API 클라이언트"""
+    
+    def __init__(self, base_url=DEFAULT_BASE_URL, max_concurrency=10, limit_per_host=8,
+                 timeout=DEFAULT_TIMEOUT, retries=3, backoff=0.5, points_cache=None):
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.points_cache = points_cache if points_cache is not None else PointsCache()
+        self.headers = {
+            'User-Agent': 'GuamWeatherAnalysis/1.0 (educational-project)'
+        }
+    
+    async def _get_json(self, session, semaphore, url):
+        """동시 실행 수 제한 안에서 JSON 조회 (일시적 오류는 지수 백오프로 재시도)"""
+        for attempt in range(self.retries + 1):
+            try:
+                async with semaphore:
+                    async with session.get(url) as response:
+                        if response.status not in RETRY_STATUS_CODES:
+                            response.raise_for_status()
+                            return await response.json(content_type=None)
+                        error = aiohttp.ClientResponseError(
+                            response.request_info, response.history,
+                            status=response.status, message=response.reason
+                        )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = e
+            
+            if attempt == self.retries:
+                raise error
+            # 0.5초, 1초, 2초 ... (+ 동시 재시도가 몰리지 않도록 약간의 무작위 지연)
+            await asyncio.sleep(self.backoff * (2 ** attempt) * (1 + random.random() * 0.1))
+    
+    async def _get_forecast_url(self, session, semaphore, latitude, longitude, new_points):
+        """좌표의 예보 URL 조회 (격자점 매핑은 영구 캐시 사용)
+        
+        새로 받은 격자점 정보는 new_points에 모아 두고 조회가 모두 끝난 뒤 한 번에 저장한다.
+        """
+        cached = self.points_cache.get(latitude, longitude)
+        if cached and cached.get("forecast"):
+            return cached["forecast"]
+        
+        points_url = f"{self.base_url}/points/{latitude},{longitude}"
+        location_data = await self._get_json(session, semaphore, points_url)
+        properties = location_data.get("properties", {})
+        points = {key: properties[key] for key in POINTS_PROPERTIES if key in properties}
+        forecast_url = points["forecast"]
+        new_points[(latitude, longitude)] = points
+        return forecast_url
+    
+    async def _fetch_location(self, session, semaphore, name, latitude, longitude, new_points):
+        """한 지점의 예보 조회, 실패하면 None"""
+        try:
+            forecast_url = await self._get_forecast_url(session, semaphore, latitude, longitude, new_points)
+            return await self._get_json(session, semaphore, forecast_url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"{name} 예보 데이터 조회 실패: {e}")
+            return None
+        except ValueError as e:
+            print(f"{name} 응답 JSON 해석 실패: {e}")
+            return None
+        except (KeyError, AttributeError) as e:
+            print(f"{name} 응답 데이터 구조 오류: {e}")
+            return None
+    
+    async def fetch_forecasts(self, locations):
+        """여러 지점의 예보 응답(JSON)을 동시에 조회
+        
+        locations: {이름: (위도, 경도)} 형태, 반환값은 {이름: 예보 JSON 또는 None}
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.limit_per_host)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        new_points = {}
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.headers) as session:
+            results = await asyncio.gather(*[
+                self._fetch_location(session, semaphore, name, latitude, longitude, new_points)
+                for name, (latitude, longitude) in locations.items()
+            ], return_exceptions=True)
+        
+        # 격자점 캐시 파일은 이벤트 루프를 막지 않도록 별도 스레드에서 한 번만 기록
+        await asyncio.to_thread(self.points_cache.put_many, new_points)
+        
+        responses = {}
+        for name, result in zip(locations, results):
+            # 예상하지 못한 오류도 해당 지점만 실패로 처리
+            if isinstance(result, Exception):
+                print(f"{name} 예보 데이터 조회 실패: {result}")
+                result = None
+            responses[name] = result
+        return responses
+    
+    async def fetch_forecast_dataframe(self, locations):
+        """여러 지점의 예보를 process_forecast_data와 같은 모양으로 변환해 하나로 결합
+        
+        지점 구분을 위해 Location, Latitude, Longitude 컬럼을 앞에 추가한다.
+        """
+        responses = await self.fetch_forecasts(locations)
+        
+        all_dataframes = []
+        for name, forecast_data in responses.items():
+            df = forecast_to_dataframe(forecast_data)
+            if df is None or df.empty:
+                continue
+            latitude, longitude = locations[name]
+            df.insert(0, "Longitude", longitude)
+            df.insert(0, "Latitude", latitude)
+            df.insert(0, "Location", name)
+            all_dataframes.append(df)
+        
+        if not all_dataframes:
+            return None
+        return pd.concat(all_dataframes, ignore_index=True)
+    
+    def get_forecasts(self, locations):
+        """fetch_forecast_dataframe의 동기 실행 버전 (실행 중인 이벤트 루프가 없을 때 사용)"""
+        return asyncio.run(self.fetch_forecast_dataframe(locations))
+
+def get_micronesia_forecasts(locations=None, **client_options):
+    """미크로네시아 여러 지점의 7일 예보를 동시에 조회해서 하나의 DataFrame으로 반환"""
+    locations = locations or MICRONESIA_LOCATIONS
+    api_client = AsyncWeatherAPI(**client_options)
+    
+    print(f"{len(locations)}개 지점의 예보 데이터를 동시에 조회 중...")
+    df = api_client.get_forecasts(locations)
+    
+    if df is not None:
+        print(f"예보 데이터 조회 성공! ({df['Location'].nunique()}개 지점)")
+    else:
+        print("예보 데이터 조회 실패")
+    return df
@@ -0,0 +1,195 @@
+"""
+괌 날씨 일별 이동 구간(rolling) / 평년값(climatology) 계산 모듈
+
+일별 값을 빠짐없는 달력 위에 올려 놓고 컬럼마다 누적합(prefix sum)과 유효 개수 누적합을
+한 번(O(n)) 만들어 두면, 임의 기간의 합계/평균은 누적합 두 개의 차이로 O(1)에 계산된다.
+- 이동 구간: 7/30/90일 등 직전 N일(당일 포함) 평균/합계
+- 평년값: 날짜(1~366번째 날)별 과거 평균을 앞뒤 며칠로 부드럽게 한 값
+"""
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+try:
+    from .aggregates import frame_cache_key
+except ImportError:
+    from aggregates import frame_cache_key
+
+ROLLING_WINDOWS = (7, 30, 90)
+
+# 평년값을 부드럽게 할 때 쓰는 날짜 창 크기 (가운데 정렬, 연말/연초는 이어서 계산)
+NORMAL_SMOOTH_DAYS = 15
+
+# 2월 29일도 자기 자리를 갖도록 윤년 기준 날짜 순번(1~366) 사용
+DAYS_IN_LEAP_YEAR = 366
+FEB_29 = 60
+
+# 데이터 버전별 엔진 캐시 (최근 사용 순)
+_CLIMATOLOGY_CACHE = OrderedDict()
+_CLIMATOLOGY_CACHE_SIZE = 4
+
+def day_of_year(dates):
+    """윤년 기준 날짜 순번 (1월 1일 = 1, 2월 29일 = 60, 12월 31일 = 366)"""
+    dates = pd.DatetimeIndex(pd.to_datetime(dates))
+    ordinal = dates.dayofyear.to_numpy()
+    # 평년의 3월 1일 이후는 2월 29일 자리를 건너뜀
+    return ordinal + ((~dates.is_leap_year) & (dates.month > 2)).astype(int)
+
+def _to_day(date):
+    return np.datetime64(pd.Timestamp(date).date(), "D")
+
+def _circular_window_sum(values, half):
+    """연말과 연초를 이어 붙인 원형 배열에서 앞뒤 half칸을 포함한 구간 합"""
+    wrapped = np.concatenate([values[-half:], values, values[:half]])
+    return np.convolve(wrapped, np.ones(2 * half + 1), mode="valid")
+
+class Climatology:
+    """일별 데이터의 누적합 배열과 날짜별 평년값"""
+    
+    def __init__(self, df, columns=None, smooth_days=NORMAL_SMOOTH_DAYS):
+        if columns is None:
+            columns = [
+                column for column in df.columns
+                if column not in ("Year", "Month", "Day") and pd.api.types.is_numeric_dtype(df[column])
+            ]
+        self.columns = list(columns)
+        self.smooth_days = smooth_days
+        
+        # 1. 첫 날부터 마지막 날까지 빠짐없는 달력 위치 (빠진 날은 NaN)
+        days = pd.to_datetime(df["Date"]).to_numpy().astype("datetime64[D]")
+        self.start = days.min() if len(days) else np.datetime64("1970-01-01", "D")
+        self.days = int((days.max() - self.start).astype(int)) + 1 if len(days) else 0
+        positions = (days - self.start).astype(np.int64)
+        self.dates = pd.date_range(pd.Timestamp(self.start), periods=self.days, freq="D")
+        doy = day_of_year(self.dates)
+        
+        self._values = {}
+        self._sums = {}
+        self._counts = {}
+        self._normals = {}
+        self._normal_sums = {}
+        for column in self.columns:
+            values = np.full(self.days, np.nan)
+            values[positions] = df[column].to_numpy(dtype=float)
+            valid = ~np.isnan(values)
+            
+            # 2. 누적합 (앞에 0을 붙여서 [i, j) 구간 합 = sums[j] - sums[i])
+            self._values[column] = values
+            self._sums[column] = np.concatenate([[0.0], np.cumsum(np.where(valid, values, 0.0))])
+            self._counts[column] = np.concatenate([[0], np.cumsum(valid)])
+            
+            # 3. 날짜 순번별 합계/개수 → 원형으로 이어 붙여 가운데 창 평균 (창 안의 모든 관측값 평균)
+            doy_sums = np.bincount(doy[valid], weights=values[valid], minlength=DAYS_IN_LEAP_YEAR + 1)[1:]
+            doy_counts = np.bincount(doy[valid], minlength=DAYS_IN_LEAP_YEAR + 1)[1:].astype(float)
+            if smooth_days > 1:
+                doy_sums = _circular_window_sum(doy_sums, smooth_days // 2)
+                doy_counts = _circular_window_sum(doy_counts, smooth_days // 2)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                normals = doy_sums / doy_counts
+            
+            # 4. 평년값 누적합 (기간 평년값 합계를 O(1)로 계산)
+            self._normals[column] = normals
+            self._normal_sums[column] = np.concatenate([[0.0], np.cumsum(np.nan_to_num(normals))])
+    
+    def __len__(self):
+        return self.days
+    
+    def _position(self, date):
+        """date의 달력 위치 (범위 밖이면 0 또는 days로 잘림)"""
+        position = int((_to_day(date) - self.start).astype(int))
+        return min(max(position, 0), self.days)
+    
+    def range_stats(self, column, start, end):
+        """start~end(양끝 포함) 기간의 합계, 개수, 평균 (O(1))"""
+        first = self._position(start)
+        last = self._position(pd.Timestamp(end) + pd.Timedelta(days=1))
+        total = self._sums[column][last] - self._sums[column][first]
+        count = int(self._counts[column][last] - self._counts[column][first])
+        return {"sum": total, "count": count, "mean": total / count if count else np.nan}
+    
+    def window(self, column, end, days, stat="mean"):
+        """end까지(당일 포함) 직전 days일의 평균 또는 합계 (O(1))"""
+        start = pd.Timestamp(end) - pd.Timedelta(days=days - 1)
+        return self.range_stats(column, start, end)[stat]
+    
+    def rolling(self, column, days, stat="mean", start=None, end=None, min_periods=None):
+        """날짜별 직전 days일 이동 평균/합계 Series (start~end 구간만, 날짜당 O(1))
+        
+        유효한 날이 min_periods(기본값 days)보다 적으면 NaN (pandas rolling과 같은 규칙).
+        구간 앞쪽도 start 이전 데이터를 포함해서 계산한다.
+        """
+        first = self._position(start) if start is not None else 0
+        last = self._position(pd.Timestamp(end) + pd.Timedelta(days=1)) if end is not None else self.days
+        
+        ends = np.arange(first, last) + 1
+        starts = np.maximum(ends - days, 0)
+        sums = self._sums[column][ends] - self._sums[column][starts]
+        counts = self._counts[column][ends] - self._counts[column][starts]
+        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = sums / counts if stat == "mean" else sums.astype(float)
+        # 창이 데이터 시작 전으로 넘어가면 빠진 날로 취급
+        values = np.where(counts >= (days if min_periods is None else min_periods), values, np.nan)
+        return pd.Series(values, index=self.dates[first:last], name=f"{column}_{days}d_{stat}")
+    
+    def rolling_frame(self, column, windows=ROLLING_WINDOWS, stat="mean", start=None, end=None):
+        """여러 창 크기의 이동 평균/합계를 컬럼으로 모은 DataFrame (Date 컬럼 포함)"""
+        frame = pd.concat([self.rolling(column, days, stat, start, end) for days in windows], axis=1)
+        frame.columns = [f"{days}일" for days in windows]
+        return frame.rename_axis("Date").reset_index()
+    
+    def normals(self, column):
+        """날짜 순번(1~366)별 평년값 Series"""
+        return pd.Series(self._normals[column], index=pd.RangeIndex(1, DAYS_IN_LEAP_YEAR + 1, name="DayOfYear"),
+                         name=column)
+    
+    def normal(self, column, dates):
+        """주어진 날짜(들)의 평년값 (날짜당 O(1) 조회)"""
+        values = self._normals[column][day_of_year(np.atleast_1d(dates)) - 1]
+        return values if np.ndim(dates) else float(values[0])
+    
+    def _normal_sum(self, column, first_doy, last_doy, leap):
+        total = self._normal_sums[column][last_doy] - self._normal_sums[column][first_doy - 1]
+        if not leap and first_doy <= FEB_29 <= last_doy:
+            total -= np.nan_to_num(self._normals[column][FEB_29 - 1])
+        return total
+    
+    def normal_range(self, column, start, end):
+        """start~end(양끝 포함) 기간 평년값의 평균 (연도 경계마다 누적합 차이 한 번씩)"""
+        start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+        if end < start:
+            return np.nan
+        
+        total = 0.0
+        for year in range(start.year, end.year + 1):
+            first = max(start, pd.Timestamp(year, 1, 1))
+            last = min(end, pd.Timestamp(year, 12, 31))
+            first_doy, last_doy = day_of_year([first, last])
+            total += self._normal_sum(column, first_doy, last_doy, first.is_leap_year)
+        return total / ((end - start).days + 1)
+    
+    def anomalies(self, column, start=None, end=None):
+        """날짜별 (관측값 - 평년값) Series"""
+        first = self._position(start) if start is not None else 0
+        last = self._position(pd.Timestamp(end) + pd.Timedelta(days=1)) if end is not None else self.days
+        dates = self.dates[first:last]
+        values = self._values[column][first:last] - self.normal(column, dates)
+        return pd.Series(values, index=dates, name=f"{column}_anomaly")
+
+def get_climatology(df, columns=None):
+    """데이터 버전별로 캐시된 Climatology 반환 (get_aggregate_cube와 같은 키 규칙)"""
+    frame_key = frame_cache_key(df)
+    if frame_key is None:
+        return Climatology(df, columns)
+    
+    key = (frame_key, tuple(columns) if columns is not None else None)
+    if key in _CLIMATOLOGY_CACHE:
+        _CLIMATOLOGY_CACHE.move_to_end(key)
+        return _CLIMATOLOGY_CACHE[key]
+    
+    climatology = Climatology(df, columns)
+    _CLIMATOLOGY_CACHE[key] = climatology
+    if len(_CLIMATOLOGY_CACHE) > _CLIMATOLOGY_CACHE_SIZE:
+        _CLIMATOLOGY_CACHE.popitem(last=False)
+    
+    return climatology
@@ -3,7 +3,63 @@
 """
 import pandas as pd
 import os
+import json
+import hashlib
+import shutil
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+# 패키지(src.data_processing)와 단독 모듈(notebooks에서 src를 경로에 추가) 양쪽에서 import 가능하도록
+try:
+    from .aggregates import (
+        build_aggregate_cube, get_aggregate_cube, merge_cubes, cube_summary, station_keys, select_cube, set_data_version,
+        frame_cache_key
+    )
+    from .stations import STATION_COLUMN, DEFAULT_STATION, iter_partitions, station_from_path
+    from .instrumentation import instrument, span, file_size
+except ImportError:
+    from aggregates import (
+        build_aggregate_cube, get_aggregate_cube, merge_cubes, cube_summary, station_keys, select_cube, set_data_version,
+        frame_cache_key
+    )
+    from stations import STATION_COLUMN, DEFAULT_STATION, iter_partitions, station_from_path
+    from instrumentation import instrument, span, file_size
+
+# 전처리 결과 캐시 기본 위치
+DEFAULT_CACHE_DIR = ".cache"
+PROCESSED_CACHE_FILE = "processed_weather.parquet"
+PROCESSED_CACHE_META = "processed_weather.json"
+STORE_MANIFEST = "manifest.json"
+
+# 전처리 방식이 바뀌면 올려서 기존 캐시/저장소를 무효화
+PROCESSING_VERSION = 2
+
+# NOAA 형식 일별 CSV 컬럼 스키마 (Date는 전처리에서 datetime으로 변환)
+WEATHER_CSV_DTYPES = {
+    "Date": "str",
+    "Maximum": "float32",
+    "Minimum": "float32",
+    "Average": "float32",
+    "Departure": "float32",
+    "HDD": "int16",
+    "CDD": "int16",
+    "Precipitation": "float32",
+    "New Snow": "float32",
+    "Snow Depth": "float32"
+}
+
+# 압축 모드에서 사용하는 달력 컬럼 dtype
+CALENDAR_DTYPES = {
+    "Year": "int16",
+    "Month": "int8",
+    "Day": "int8"
+}
+
+# 컬럼별 특수 기호와 대체값 ('T': Trace, 'M': Missing)
+WEATHER_CSV_SENTINELS = {
+    "Precipitation": ("T", 0.0),
+    "Snow Depth": ("M", 0.0)
+}
 
 def fahrenheit_to_celsius(fahrenheit):
     """화씨를 섭씨로 변환"""
@@ -13,23 +69,132 @@ def inches_to_mm(inches):
     """인치를 밀리미터로 변환"""
     return inches * 25.4
 
-def load_all_csv_files(data_dir="data"):
-    """data 디렉토리의 모든 CSV 파일을 읽어서 하나의 DataFrame으로 결합"""
-    csv_files = sorted([f for f in os.listdir(data_dir) if f.endswith(".csv")])
-    all_dataframes = []
+def _map_files(func, file_paths, workers=1):
+    """파일별 작업을 순서대로 실행 (workers > 1이면 프로세스 풀에서 병렬 실행)
     
-    for filename in csv_files:
-        file_path = os.path.join(data_dir, filename)
+    결과는 항상 file_paths 순서를 따르므로 병렬 여부와 관계없이 결합 결과가 같다.
+    workers=None이면 CPU 코어 수만큼 사용
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(file_paths))
+    
+    if workers <= 1:
+        return [func(file_path) for file_path in file_paths]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, file_paths))
+
+def _coerce_weather_columns(df):
+    """특수 기호를 대체값으로 바꾸고 스키마 dtype으로 변환 (문자열 컬럼만 처리)
+    
+    숫자로 해석할 수 없는 값은 NaN이 되며, NaN이 있는 정수 컬럼은 float32로 둔다.
+    """
+    for column, dtype in WEATHER_CSV_DTYPES.items():
+        if column == "Date" or column not in df.columns:
+            continue
+        
+        values = df[column]
+        if not pd.api.types.is_numeric_dtype(values):
+            if column in WEATHER_CSV_SENTINELS:
+                sentinel, fill_value = WEATHER_CSV_SENTINELS[column]
+                values = values.replace(sentinel, str(fill_value))
+            values = pd.to_numeric(values, errors='coerce')
+        
+        if values.dtype != dtype:
+            if dtype.startswith("int") and values.isna().any():
+                dtype = "float32"
+            values = values.astype(dtype)
+        df[column] = values
+    
+    return df
+
+@instrument(bytes_read=file_size)
+def read_weather_csv(file_path):
+    """NOAA 형식 월별 CSV를 스키마대로 한 번에 읽기
+    
+    특수 기호는 파싱 단계에서 NaN으로 읽은 뒤 바로 대체값으로 채우므로
+    object 컬럼을 거치지 않는다. 스키마에 맞지 않는 값(빈 칸, 다른 기호)이
+    있으면 일반 파싱 후 변환하는 방식으로 처리한다.
+    """
+    na_values = {column: [sentinel] for column, (sentinel, _) in WEATHER_CSV_SENTINELS.items()}
+    
+    try:
+        df = pd.read_csv(file_path, dtype=WEATHER_CSV_DTYPES,
+                         na_values=na_values, keep_default_na=False)
+    except (ValueError, TypeError):
         df = pd.read_csv(file_path)
-        all_dataframes.append(df)
+        return _coerce_weather_columns(df)
+    
+    # keep_default_na=False이므로 NaN은 특수 기호에서만 나온다
+    for column, (_, fill_value) in WEATHER_CSV_SENTINELS.items():
+        if column in df.columns:
+            df[column] = df[column].fillna(fill_value)
     
+    return df
+
+def _tag_station(df, file_path):
+    """station=<관측소> 디렉토리 아래 파일이면 Station 컬럼 추가 (기존 구조 파일은 그대로)"""
+    station = station_from_path(file_path)
+    if station is not None:
+        df[STATION_COLUMN] = station
+    return df
+
+def _concat_partitions(all_dataframes):
+    """파일별 결과 결합 (관측소 구조와 기존 구조가 섞여 있으면 기존 파일은 기본 관측소)"""
     combined_df = pd.concat(all_dataframes, ignore_index=True)
+    if STATION_COLUMN in combined_df.columns:
+        combined_df[STATION_COLUMN] = combined_df[STATION_COLUMN].fillna(DEFAULT_STATION)
+    return combined_df
+
+def _read_csv_file(file_path):
+    """CSV 파일 하나 읽기 (프로세스 풀 작업 단위)"""
+    return _tag_station(read_weather_csv(file_path), file_path)
+
+def _load_and_preprocess_file(file_path):
+    """월별 CSV 파일 하나를 읽고 전처리 (프로세스 풀 작업 단위)"""
+    return _tag_station(preprocess_weather_data(read_weather_csv(file_path)), file_path)
+
+@instrument()
+def load_all_csv_files(data_dir="data", workers=1):
+    """data 디렉토리의 모든 CSV 파일을 읽어서 하나의 DataFrame으로 결합
+    
+    workers > 1이면 파일들을 프로세스 풀에서 병렬로 읽는다 (None: CPU 코어 수)
+    """
+    csv_files = _list_csv_files(data_dir)
+    file_paths = [os.path.join(data_dir, filename) for filename in csv_files]
+    
+    all_dataframes = _map_files(_read_csv_file, file_paths, workers)
+    
+    combined_df = _concat_partitions(all_dataframes)
+    return combined_df, csv_files
+
+@instrument()
+def load_and_preprocess_csv_files(data_dir="data", workers=1, stations=None, years=None, months=None):
+    """월별 CSV 파일을 파일 단위로 읽고 전처리한 뒤 월 순서대로 결합
+    
+    파싱과 타입 변환이 파일마다 독립적이므로 workers > 1이면 프로세스 풀에서 병렬 처리
+    stations/years/months를 주면 조건에 맞는 파티션 파일만 읽는다.
+    """
+    csv_files = _list_csv_files(data_dir, stations, years, months)
+    file_paths = [os.path.join(data_dir, filename) for filename in csv_files]
+    
+    all_dataframes = _map_files(_load_and_preprocess_file, file_paths, workers)
+    if not all_dataframes:
+        return pd.DataFrame(), csv_files
+    
+    combined_df = _concat_partitions(all_dataframes)
     return combined_df, csv_files
 
+@instrument()
 def preprocess_weather_data(df):
-    """날씨 데이터 전처리 통합 함수"""
-    # DataFrame 복사
-    df = df.copy()
+    """날씨 데이터 전처리 통합 함수
+    
+    read_weather_csv로 읽은 데이터는 이미 스키마 dtype이므로 단위 변환만 하고,
+    일반 pd.read_csv 결과라면 'T'/'M' 기호 처리와 숫자 변환을 먼저 수행한다.
+    """
+    # 얕은 복사 (컬럼을 통째로 교체하므로 원본은 바뀌지 않음)
+    df = df.copy(deep=False)
     
     # Date 컬럼을 datetime으로 변환
     df["Date"] = pd.to_datetime(df["Date"], format="%Y-%m-%d")
@@ -39,13 +204,8 @@ def preprocess_weather_data(df):
     df["Month"] = df["Date"].dt.month
     df["Day"] = df["Date"].dt.day
     
-    # Precipitation의 'T'(Trace)를 0으로 변환
-    df.loc[df["Precipitation"] == "T", "Precipitation"] = 0
-    df["Precipitation"] = pd.to_numeric(df["Precipitation"], errors='coerce')
-    
-    # Snow Depth의 'M'(Missing)을 0으로 변환
-    df.loc[df["Snow Depth"] == "M", "Snow Depth"] = 0
-    df["Snow Depth"] = pd.to_numeric(df["Snow Depth"], errors='coerce')
+    # Precipitation의 'T'(Trace), Snow Depth의 'M'(Missing)을 0으로 변환
+    df = _coerce_weather_columns(df)
     
     # 화씨를 섭씨로 변환
     df["Maximum"] = fahrenheit_to_celsius(df["Maximum"])
@@ -58,26 +218,346 @@ def preprocess_weather_data(df):
     
     return df
 
-def get_yearly_summary(df):
-    """연도별 요약 통계 계산"""
-    yearly_summary = df.groupby("Year").agg({
-        "Average": "mean",
-        "Maximum": "mean", 
-        "Minimum": "mean",
-        "Precipitation": "sum",
-        "Departure": "mean"
-    }).reset_index()
+def add_calendar_columns(df):
+    """Year, Month, Day 컬럼이 없으면 Date에서 계산해서 추가 (압축 모드의 지연 계산용)"""
+    missing = [column for column in CALENDAR_DTYPES if column not in df.columns]
+    if not missing:
+        return df
+    
+    df = df.copy(deep=False)
+    for column in missing:
+        values = getattr(df["Date"].dt, column.lower())
+        df[column] = values.astype(CALENDAR_DTYPES[column])
+    
+    return df
+
+@instrument()
+def compact_weather_frame(df, lazy_calendar=False):
+    """전처리된 일별 데이터를 메모리를 적게 쓰는 형태로 변환
+    
+    - 실수 컬럼은 float32, 달력 컬럼은 int16/int8로 축소
+    - 문자열 컬럼은 Categorical로 저장
+    - lazy_calendar=True면 Year/Month/Day를 제거하고 필요할 때
+      add_calendar_columns로 Date에서 다시 계산
+    """
+    df = df.copy(deep=False)
+    
+    for column in df.columns:
+        values = df[column]
+        if column in CALENDAR_DTYPES:
+            df[column] = values.astype(CALENDAR_DTYPES[column])
+        elif pd.api.types.is_float_dtype(values) and values.dtype != "float32":
+            df[column] = values.astype("float32")
+        elif pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+            df[column] = values.astype("category")
+    
+    if lazy_calendar:
+        df = df.drop(columns=[column for column in CALENDAR_DTYPES if column in df.columns])
+    
+    return df
+
+def memory_footprint_report(df):
+    """현재 형태와 압축 형태의 컬럼별 메모리 사용량(bytes) 비교표"""
+    modes = {
+        "current": df,
+        "compact": compact_weather_frame(df),
+        "compact_lazy": compact_weather_frame(df, lazy_calendar=True)
+    }
+    
+    report = pd.DataFrame({
+        mode: frame.memory_usage(index=False, deep=True)
+        for mode, frame in modes.items()
+    }).reindex(df.columns).fillna(0).astype("int64")
+    report.loc["Total"] = report.sum()
+    report["ratio"] = (report["compact"] / report["current"]).round(3)
+    
+    return report
+
+# 연도별/월별 요약에 사용하는 컬럼별 통계
+SUMMARY_AGGREGATIONS = {
+    "Average": "mean",
+    "Maximum": "mean",
+    "Minimum": "mean",
+    "Precipitation": "sum",
+    "Departure": "mean"
+}
+
+def _store_summary(df, store, by, filters):
+    """SQLite 저장소에서 GROUP BY로 계산한 요약표 (df의 데이터 버전으로 동기화한 뒤, 집계 행만 읽음)
+    
+    버전이 없거나 필터링한 DataFrame은 저장소를 다시 적재하지 않고 큐브로 계산한다 (None 반환).
+    """
+    if frame_cache_key(df) is None:
+        return None
+    return store.sync(df).aggregate(SUMMARY_AGGREGATIONS, by=by, **filters)
+
+@instrument(rows="input")
+def get_yearly_summary(df, store=None, year=None, month=None, station=None):
+    """연도별 요약 통계 계산 (일별 행 대신 (Year, Month) 집계 큐브에서 계산, Station 컬럼이 있으면 관측소별)
+    
+    year/month/station을 주면 캐시된 전체 큐브에서 해당 셀만 골라 요약한다 (필터링한 DataFrame은 매번 새로 집계).
+    store(WeatherSQLStore)를 주면 집계를 SQL로 실행한다 (버전이 없거나 필터링한 DataFrame은 큐브로 계산).
+    """
+    filters = {"year": year, "month": month, "station": station}
+    summary = _store_summary(df, store, station_keys(df) + ["Year"], filters) if store is not None else None
+    if summary is not None:
+        return summary
+    cube = select_cube(get_aggregate_cube(df), **filters)
+    yearly_summary = cube_summary(cube, SUMMARY_AGGREGATIONS, by=station_keys(df) + ["Year"])
     
     return yearly_summary
 
-def get_monthly_summary(df):
-    """월별 요약 통계 계산"""
-    monthly_summary = df.groupby(["Year", "Month"]).agg({
-        "Average": "mean",
-        "Maximum": "mean",
-        "Minimum": "mean", 
-        "Precipitation": "sum",
-        "Departure": "mean"
-    }).reset_index()
-    
-    return monthly_summary 
\ No newline at end of file
+@instrument(rows="input")
+def get_monthly_summary(df, store=None, year=None, month=None, station=None):
+    """월별 요약 통계 계산 (일별 행 대신 (Year, Month) 집계 큐브에서 계산, Station 컬럼이 있으면 관측소별)
+    
+    year/month/station을 주면 캐시된 전체 큐브에서 해당 셀만 골라 요약한다 (필터링한 DataFrame은 매번 새로 집계).
+    store(WeatherSQLStore)를 주면 집계를 SQL로 실행한다 (버전이 없거나 필터링한 DataFrame은 큐브로 계산).
+    """
+    filters = {"year": year, "month": month, "station": station}
+    summary = _store_summary(df, store, station_keys(df) + ["Year", "Month"], filters) if store is not None else None
+    if summary is not None:
+        return summary
+    cube = select_cube(get_aggregate_cube(df), **filters)
+    monthly_summary = cube_summary(cube, SUMMARY_AGGREGATIONS, by=station_keys(df) + ["Year", "Month"])
+    
+    return monthly_summary
+
+def iter_processed_chunks(data_dir="data", chunksize=None, stations=None, years=None):
+    """월별 CSV를 하나씩(또는 chunksize 행씩) 읽어서 전처리한 결과를 차례로 반환하는 제너레이터
+    
+    전체 기간을 하나의 DataFrame으로 합치지 않으므로 메모리 사용량은 청크 크기에 비례한다.
+    stations/years를 주면 해당 파티션 파일만 읽는다.
+    """
+    for filename in _list_csv_files(data_dir, stations, years):
+        file_path = os.path.join(data_dir, filename)
+        
+        if chunksize is None:
+            yield _load_and_preprocess_file(file_path)
+            continue
+        
+        for chunk in pd.read_csv(file_path, chunksize=chunksize):
+            yield _tag_station(preprocess_weather_data(chunk), file_path)
+
+def build_streaming_cube(chunks, columns=None):
+    """전처리된 청크들을 차례로 집계 큐브에 누적 (청크는 집계 후 바로 버려짐)"""
+    cube = None
+    for chunk in chunks:
+        chunk_cube = build_aggregate_cube(chunk, columns)
+        cube = chunk_cube if cube is None else merge_cubes([cube, chunk_cube])
+    
+    return cube
+
+@instrument(rows=None)
+def stream_weather_summaries(data_dir="data", chunksize=None, stations=None, years=None):
+    """전체 데이터를 메모리에 올리지 않고 (연도별 요약, 월별 요약) 계산
+    
+    get_yearly_summary / get_monthly_summary와 같은 모양의 결과를 반환한다.
+    """
+    cube = build_streaming_cube(
+        iter_processed_chunks(data_dir, chunksize, stations, years),
+        columns=list(SUMMARY_AGGREGATIONS)
+    )
+    
+    keys = station_keys(cube)
+    yearly_summary = cube_summary(cube, SUMMARY_AGGREGATIONS, by=keys + ["Year"])
+    monthly_summary = cube_summary(cube, SUMMARY_AGGREGATIONS, by=keys + ["Year", "Month"])
+    return yearly_summary, monthly_summary
+
+def _list_csv_files(data_dir, stations=None, years=None, months=None):
+    """data 디렉토리 기준 CSV 상대 경로 목록 (기존 구조 파일 이름 + 관측소 파티션 경로, 조건에 맞는 것만)"""
+    return list(iter_partitions(data_dir, stations, years, months))
+
+def _part_name(filename):
+    """CSV 상대 경로에 대응하는 저장소 조각 파일 이름 (파티션 경로는 한 단계로 펼침)"""
+    return filename[:-4].replace(os.sep, "__") + ".parquet"
+
+def _file_signature(file_path):
+    """파일 변경 여부 판단용 (크기, 수정시각) 정보"""
+    stat = os.stat(file_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def fingerprint_csv_files(data_dir="data", stations=None, years=None, months=None):
+    """CSV 파일 목록(이름, 크기, 수정시각)과 전처리 버전으로 데이터 버전 지문 생성"""
+    hasher = hashlib.sha256()
+    hasher.update(f"v{PROCESSING_VERSION}\n".encode("utf-8"))
+    
+    for filename in _list_csv_files(data_dir, stations, years, months):
+        sig = _file_signature(os.path.join(data_dir, filename))
+        hasher.update(f"{filename}|{sig['size']}|{sig['mtime_ns']}\n".encode("utf-8"))
+    
+    return hasher.hexdigest()
+
+def _read_cache_meta(meta_path):
+    """캐시 메타데이터(JSON) 읽기, 없거나 손상된 경우 None"""
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_cache_meta(meta_path, meta):
+    """캐시 메타데이터(JSON) 저장 (임시 파일에 쓴 뒤 교체)"""
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, meta_path)
+
+def data_cache_dir(data_dir="data", cache_dir=DEFAULT_CACHE_DIR):
+    """data_dir별 캐시 디렉토리 (<cache_dir>/<이름>-<절대 경로 해시>)
+    
+    전처리 캐시와 증분 저장소를 data_dir마다 따로 두어서, 다른 디렉토리를 읽을 때
+    기존 디렉토리의 캐시를 덮어쓰거나 조각을 삭제하지 않도록 한다.
+    """
+    data_path = os.path.abspath(data_dir)
+    digest = hashlib.sha256(data_path.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{os.path.basename(data_path) or 'data'}-{digest}")
+
+@instrument(rows=None)
+def update_processed_store(data_dir="data", store_dir=None, workers=1):
+    """새로 추가되거나 변경된 월별 CSV만 전처리해서 저장소에 반영
+    
+    저장소는 파일별 Parquet 조각(parts/)과 적재 이력(manifest.json)으로 구성되며,
+    변경되지 않은 월은 다시 읽지 않는다. (변경된 파일 목록, 삭제된 파일 목록) 반환
+    store_dir를 주지 않으면 data_dir별 캐시 디렉토리(data_cache_dir)의 store/를 사용한다.
+    workers > 1이면 변경된 파일들을 프로세스 풀에서 병렬로 전처리
+    """
+    if store_dir is None:
+        store_dir = os.path.join(data_cache_dir(data_dir), "store")
+    parts_dir = os.path.join(store_dir, "parts")
+    manifest_path = os.path.join(store_dir, STORE_MANIFEST)
+    data_path = os.path.abspath(data_dir)
+    
+    manifest = _read_cache_meta(manifest_path)
+    rebuilt = not manifest or manifest.get("version") != PROCESSING_VERSION or manifest.get("data_dir") != data_path
+    if rebuilt:
+        # 전처리 방식이 바뀌었거나 다른 data_dir의 저장소면 조각을 섞지 않고 모두 다시 만든다
+        if manifest and manifest.get("data_dir") not in (None, data_path):
+            print(f"다른 데이터 디렉토리({manifest['data_dir']})의 저장소라 다시 만듭니다: {store_dir}")
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        manifest = {"version": PROCESSING_VERSION, "data_dir": data_path, "files": {}}
+    os.makedirs(parts_dir, exist_ok=True)
+    ingested = manifest["files"]
+    csv_files = _list_csv_files(data_dir)
+    
+    # 1. 새 파일 또는 크기/수정시각이 바뀐 파일만 골라내기
+    changed_files = []
+    signatures = {}
+    for filename in csv_files:
+        sig = _file_signature(os.path.join(data_dir, filename))
+        part_path = os.path.join(parts_dir, _part_name(filename))
+        
+        if ingested.get(filename) == sig and os.path.exists(part_path):
+            continue
+        
+        changed_files.append(filename)
+        signatures[filename] = sig
+    
+    # 2. 골라낸 파일만 전처리해서 조각으로 저장
+    file_paths = [os.path.join(data_dir, filename) for filename in changed_files]
+    processed = _map_files(_load_and_preprocess_file, file_paths, workers)
+    
+    for filename, df in zip(changed_files, processed):
+        df.to_parquet(os.path.join(parts_dir, _part_name(filename)), index=False)
+        ingested[filename] = signatures[filename]
+    
+    # 3. data 디렉토리에서 사라진 파일은 저장소에서도 제거
+    removed_files = [f for f in ingested if f not in csv_files]
+    for filename in removed_files:
+        part_path = os.path.join(parts_dir, _part_name(filename))
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        del ingested[filename]
+    
+    if changed_files or removed_files or rebuilt:
+        _write_cache_meta(manifest_path, manifest)
+    
+    return changed_files, removed_files
+
+def read_processed_store(store_dir=None, data_dir="data"):
+    """저장소의 파일별 조각을 월 순서대로 읽어서 하나의 DataFrame으로 결합 (store_dir 기본값은 data_dir별 저장소)"""
+    if store_dir is None:
+        store_dir = os.path.join(data_cache_dir(data_dir), "store")
+    manifest = _read_cache_meta(os.path.join(store_dir, STORE_MANIFEST)) or {"files": {}}
+    parts_dir = os.path.join(store_dir, "parts")
+    
+    all_dataframes = [
+        pd.read_parquet(os.path.join(parts_dir, _part_name(filename)))
+        for filename in sorted(manifest["files"])
+    ]
+    if not all_dataframes:
+        return pd.DataFrame()
+    
+    return _concat_partitions(all_dataframes)
+
+@instrument()
+def load_processed_data(data_dir="data", cache_dir=DEFAULT_CACHE_DIR, use_cache=True, workers=1,
+                        compact=False, stations=None, years=None, months=None):
+    """전처리된 날씨 데이터 로딩 (CSV가 바뀌지 않았으면 Parquet 캐시 재사용)
+    
+    CSV가 바뀐 경우에도 변경된 월만 다시 전처리하고(update_processed_store)
+    나머지는 저장소의 기존 결과를 재사용한다. workers는 전처리 병렬 프로세스 수,
+    compact=True면 compact_weather_frame으로 변환한 결과를 반환
+    stations/years/months를 주면 조건에 맞는 파티션 파일만 읽는다 (전체 캐시는 사용하지 않음).
+    """
+    if stations is not None or years is not None or months is not None:
+        return load_partitions(data_dir, stations, years, months, workers=workers, compact=compact)
+    
+    fingerprint = fingerprint_csv_files(data_dir)
+    cache_dir = data_cache_dir(data_dir, cache_dir)
+    cache_path = os.path.join(cache_dir, PROCESSED_CACHE_FILE)
+    meta_path = os.path.join(cache_dir, PROCESSED_CACHE_META)
+    
+    # 1. 지문이 같으면 캐시에서 바로 읽기
+    if use_cache:
+        meta = _read_cache_meta(meta_path)
+        if meta and meta.get("fingerprint") == fingerprint and os.path.exists(cache_path):
+            try:
+                with span("data_processing.read_parquet_cache") as active:
+                    df = pd.read_parquet(cache_path)
+                    active.add_rows(len(df))
+                    active.add_bytes(os.path.getsize(cache_path))
+                if compact:
+                    df = compact_weather_frame(df)
+                set_data_version(df, fingerprint)
+                return df
+            except (ImportError, OSError, ValueError) as e:
+                print(f"캐시 읽기 실패, CSV에서 다시 생성합니다: {e}")
+    
+    df = None
+    csv_files = _list_csv_files(data_dir)
+    
+    # 2. 변경된 월만 저장소에 반영한 뒤 결합 (Parquet 엔진이 없으면 전체 재생성)
+    if use_cache:
+        try:
+            store_dir = os.path.join(cache_dir, "store")
+            update_processed_store(data_dir, store_dir, workers=workers)
+            df = read_processed_store(store_dir)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"증분 저장소 갱신 실패, CSV 전체를 다시 읽습니다: {e}")
+    
+    if df is None:
+        df, csv_files = load_and_preprocess_csv_files(data_dir, workers=workers)
+    
+    # 3. 캐시 저장
+    if use_cache:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            df.to_parquet(cache_path, index=False)
+            _write_cache_meta(meta_path, {"fingerprint": fingerprint, "files": csv_files})
+        except (ImportError, OSError, ValueError) as e:
+            print(f"캐시 저장 실패: {e}")
+    
+    if compact:
+        df = compact_weather_frame(df)
+    set_data_version(df, fingerprint)
+    return df
+
+@instrument()
+def load_partitions(data_dir="data", stations=None, years=None, months=None, workers=1, compact=False):
+    """조건에 맞는 관측소/연도/월 파티션 파일만 읽어서 전처리 (다른 파티션은 목록 조회도 하지 않음)"""
+    df, _ = load_and_preprocess_csv_files(data_dir, workers, stations, years, months)
+    if compact and not df.empty:
+        df = compact_weather_frame(df)
+    set_data_version(df, fingerprint_csv_files(data_dir, stations, years, months))
+    return df
\ No newline at end of file
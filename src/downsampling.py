@@ -0,0 +1,116 @@
+"""
+대시보드 그래프용 서버 측 다운샘플링 모듈
+
+점이 많은 그래프를 브라우저로 보내기 전에 줄인다.
+- 선 그래프: LTTB(Largest-Triangle-Three-Buckets)로 모양을 유지하며 점 개수 축소
+- 히스토그램: 구간별 개수를 미리 계산해서 막대만 전송
+- 박스플롯: 사분위수/울타리/평균을 미리 계산하고 이상치만 전송
+"""
+import numpy as np
+
+# 이보다 점이 많으면 다운샘플링
+DOWNSAMPLE_THRESHOLD = 5000
+
+# LTTB 결과 점 개수
+LTTB_POINTS = 2000
+
+def lttb_indices(x, y, n_out=LTTB_POINTS):
+    """LTTB로 고른 점의 위치(인덱스) 배열 (x는 정렬되어 있어야 함, 처음/마지막 점은 항상 포함)"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # 처음/마지막 점을 뺀 나머지를 n_out - 2개 구간으로 나눔
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # 각 구간의 평균점 (다음 구간 평균을 세 번째 꼭짓점으로 사용)
+    counts = np.diff(edges)
+    x_means = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    y_means = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    x_means = np.append(x_means, x[-1])
+    y_means = np.append(y_means, y[-1])
+    
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # 이전 선택점, 구간 안의 후보, 다음 구간 평균점이 이루는 삼각형 넓이(x2)가 가장 큰 점 선택
+        areas = np.abs(
+            (x[previous] - x_means[bucket + 1]) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (y_means[bucket + 1] - y[previous])
+        )
+        previous = start + int(np.nanargmax(areas)) if not np.all(np.isnan(areas)) else start
+        selected[bucket + 1] = previous
+    return selected
+
+def downsample_line(x, y, threshold=DOWNSAMPLE_THRESHOLD, n_out=LTTB_POINTS):
+    """점이 threshold보다 많으면 LTTB로 줄인 (x, y), 아니면 그대로 반환
+    
+    x가 날짜(datetime64)면 정수 시각으로 계산한 뒤 원래 값을 그대로 돌려준다.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) <= threshold:
+        return x, y
+    
+    x_numeric = x.astype("datetime64[ns]").astype("int64") if np.issubdtype(x.dtype, np.datetime64) else x
+    indices = lttb_indices(x_numeric, y, n_out)
+    return x[indices], y[indices]
+
+def histogram_bins(values, nbins=30):
+    """히스토그램 구간별 개수 (counts, 구간 경계 edges), NaN은 제외"""
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    return np.histogram(values, bins=nbins)
+
+def box_statistics(values, whisker=1.5):
+    """박스플롯 요약값 (q1, median, q3, mean, lowerfence, upperfence, outliers)
+    
+    울타리는 Plotly 기본값과 같이 [q1 - 1.5·IQR, q3 + 1.5·IQR] 안의 가장 바깥 값이다.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return None
+    
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - whisker * iqr) & (values <= q3 + whisker * iqr)]
+    outliers = values[(values < q1 - whisker * iqr) | (values > q3 + whisker * iqr)]
+    return {
+        "q1": q1,
+        "median": median,
+        "q3": q3,
+        "mean": values.mean(),
+        "lowerfence": inside.min(),
+        "upperfence": inside.max(),
+        "outliers": np.sort(outliers)
+    }
+
+def estimate_payload_bytes(data):
+    """data의 값 배열을 Plotly JSON으로 보낼 때의 대략적인 크기(bytes) (직렬화하지 않고 계산)
+    
+    숫자 배열은 Plotly처럼 base64(원래 크기의 4/3), 날짜는 "YYYY-MM-DDTHH:MM:SS" 문자열로 계산한다.
+    """
+    if hasattr(data, "columns"):
+        return sum(estimate_payload_bytes(data[column]) for column in data.columns)
+    if isinstance(data, (list, tuple)) and not all(np.isscalar(item) for item in data):
+        return sum(estimate_payload_bytes(item) for item in data)
+    
+    values = np.asarray(data)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.size * len('"2000-01-01T00:00:00",')
+    if np.issubdtype(values.dtype, np.number) or values.dtype == bool:
+        return -(-values.nbytes // 3) * 4 + len('{"dtype":"f8","bdata":""}')
+    return sum(len(str(value)) + 3 for value in values.ravel())
+
+def payload_bytes(figure_or_data):
+    """Plotly JSON으로 직렬화했을 때의 크기(bytes) (그래프 Figure 또는 원본 배열 dict)"""
+    import plotly.io as pio
+    
+    if isinstance(figure_or_data, str):
+        return len(figure_or_data.encode("utf-8"))
+    return len(pio.to_json(figure_or_data).encode("utf-8"))
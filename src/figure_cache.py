@@ -0,0 +1,255 @@
+"""
+그래프 결과물(PNG bytes, Plotly JSON) 내용 주소 기반 캐시 모듈
+
+그래프 입력 집계값과 그리기 옵션(크기, dpi, 스타일 등)의 해시를 키로 결과 bytes를 저장하고,
+같은 키로 다시 요청하면 그리지 않고 저장된 bytes를 돌려준다.
+전체 크기/개수 한도를 넘으면 가장 오래 쓰지 않은 항목부터 지운다(LRU).
+"""
+import os
+import io
+import json
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+DEFAULT_FIGURE_CACHE_DIR = os.path.join(".cache", "figures")
+
+# 키 계산 방식이 바뀌면 올려서 기존 항목을 모두 무효화
+FIGURE_KEY_VERSION = 1
+
+def _update_digest(digest, value):
+    """DataFrame/Series/배열/기본 자료형을 해시에 추가"""
+    if isinstance(value, pd.DataFrame):
+        digest.update(json.dumps([str(column) for column in value.columns]).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(str(value.name).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(str(value.dtype).encode("utf-8"))
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _update_digest(digest, item)
+    else:
+        digest.update(json.dumps(value, sort_keys=True, default=str).encode("utf-8"))
+
+def figure_key(name, data, **params):
+    """그래프 이름, 입력 데이터(집계표 등), 그리기 옵션으로 만든 캐시 키(sha256)"""
+    digest = hashlib.sha256(json.dumps([FIGURE_KEY_VERSION, name]).encode("utf-8"))
+    _update_digest(digest, data)
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+class FigureCache:
+    """그래프 bytes LRU 캐시 (cache_dir가 None이면 메모리에만 저장)"""
+    
+    def __init__(self, cache_dir=DEFAULT_FIGURE_CACHE_DIR, max_bytes=64 * 1024 * 1024, max_entries=512):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # key → bytes(메모리) 또는 크기(디스크)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        
+        if cache_dir:
+            self._load_index()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+    
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".bin")
+    
+    def _load_index(self):
+        """디스크에 남아 있는 항목을 마지막 사용 시각(mtime) 순으로 등록"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        files = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".bin"):
+                stat = entry.stat()
+                files.append((stat.st_mtime_ns, entry.name[:-4], stat.st_size))
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+        self._evict()
+    
+    def _size(self, value):
+        return len(value) if isinstance(value, bytes) else value
+    
+    def get(self, key):
+        """저장된 bytes (없으면 None)"""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            value = self._entries[key]
+            if isinstance(value, bytes):
+                self.hits += 1
+                return value
+        
+        try:
+            path = self._path(key)
+            with open(path, "rb") as f:
+                payload = f.read()
+            # 다음 실행에서도 LRU 순서가 유지되도록 사용 시각 갱신
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._discard(key)
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+        return payload
+    
+    def put(self, key, payload):
+        """bytes 저장 후 한도를 넘으면 오래된 항목부터 제거"""
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            value = len(payload)
+        else:
+            value = payload
+        
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = value
+            self._total_bytes += len(payload)
+            self._evict()
+    
+    def get_or_create(self, key, create):
+        """캐시에 있으면 저장된 bytes, 없으면 create()로 만들어 저장 후 반환"""
+        payload = self.get(key)
+        if payload is None:
+            payload = create()
+            self.put(key, payload)
+        return payload
+    
+    def _discard(self, key):
+        value = self._entries.pop(key, None)
+        if value is not None:
+            self._total_bytes -= self._size(value)
+    
+    def _evict(self):
+        while self._entries and (self._total_bytes > self.max_bytes or len(self._entries) > self.max_entries):
+            key, value = self._entries.popitem(last=False)
+            self._total_bytes -= self._size(value)
+            if self.cache_dir:
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+    
+    def clear(self):
+        with self._lock:
+            while self._entries:
+                key, _ = self._entries.popitem()
+                if self.cache_dir:
+                    try:
+                        os.remove(self._path(key))
+                    except OSError:
+                        pass
+            self._total_bytes = 0
+
+def _code_digest(code, digest=None):
+    """함수 바이트코드/상수 해시 (중첩 함수·lambda 포함, 메모리 주소는 제외)"""
+    digest = digest or hashlib.sha256()
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _code_digest(const, digest)
+        else:
+            digest.update(repr(const).encode("utf-8"))
+    return digest
+
+# (경로, 수정 시각, 크기) → 소스 파일 내용 해시
+_source_digests = {}
+
+def _source_digest(path):
+    """소스 파일 내용 해시 (파일이 바뀌지 않았으면 이전 값 재사용)"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return ""
+    cache_key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _source_digests.get(cache_key)
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        _source_digests[cache_key] = digest
+    return digest
+
+def _code_names(code):
+    """함수(중첩 함수 포함)가 참조하는 전역/속성 이름"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            names |= _code_names(const)
+    return names
+
+def code_version(func):
+    """func 바이트코드 + func와 func가 참조하는 전역 함수/모듈이 정의된 소스 파일 해시
+    
+    같은 파일의 보조 함수나 모듈 상수, 다른 모듈에서 가져온 함수가 바뀌어도 값이 바뀐다.
+    """
+    digest = _code_digest(func.__code__)
+    paths = {func.__code__.co_filename}
+    for name in _code_names(func.__code__):
+        value = func.__globals__.get(name)
+        if inspect.ismodule(value):
+            path = getattr(value, "__file__", None)
+        else:
+            code = getattr(value, "__code__", None)
+            path = code.co_filename if code is not None else None
+        if path:
+            paths.add(path)
+    for path in sorted(paths):
+        digest.update(_source_digest(path).encode("utf-8"))
+    return digest.hexdigest()
+
+def render_png(draw, data, figsize, dpi=100, style=None):
+    """draw(fig, *data)로 Agg 캔버스 Figure에 그려 PNG bytes 반환 (pyplot 미사용)"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    import matplotlib.style
+    
+    with matplotlib.style.context(style or {}):
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        draw(fig, *(data if isinstance(data, tuple) else (data,)))
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+def cached_png(cache, name, draw, data, figsize, dpi=100, style=None, version=None):
+    """입력 데이터 + 크기/dpi/스타일 + draw 코드 버전(code_version, version) 해시로 캐시된 matplotlib 그래프 PNG bytes"""
+    key = figure_key(name, data, figsize=list(figsize), dpi=dpi, style=style,
+                     code=code_version(draw), version=version)
+    return cache.get_or_create(key, lambda: render_png(draw, data, figsize, dpi, style))
+
+def cached_plotly_json(cache, name, data, build, **params):
+    """입력 데이터 + 옵션 + build 함수 코드 해시로 캐시된 Plotly 그림 JSON 문자열
+    
+    build()는 plotly Figure를 반환하는 함수. build나 build가 쓰는 함수/모듈의 소스가 바뀌면
+    키도 바뀌도록 code_version을 키에 포함한다. 클로저로 잡은 값은 키에 들어가지 않으므로 data나 params로 넘긴다.
+    """
+    params["code"] = code_version(build)
+    key = figure_key(name, data, **params)
+    return cache.get_or_create(key, lambda: build().to_json().encode("utf-8")).decode("utf-8")
@@ -0,0 +1,333 @@
+"""
+예보 스냅샷 누적 보관(append-only) 아카이브 모듈
+
+예보를 조회할 때마다 (발표 시각, 예보 대상 날짜, 지점) 단위의 행을
+location=<지점>/issue_month=<YYYY-MM>/ 파티션 아래 새 parquet 파일로만 추가한다.
+조회는 pyarrow dataset으로 파티션/행 그룹 통계를 이용해 필요한 파일과 구간만 읽는다.
+지난 달 파티션은 스냅샷들을 합친 새 파일(compacted-*)을 만들어 읽기에 사용하고, 원본 스냅샷은 지우지 않는다.
+"""
+import os
+import glob
+import json
+from urllib.parse import quote, unquote
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+try:
+    from .api_client import forecast_to_dataframe
+except ImportError:
+    from api_client import forecast_to_dataframe
+
+DEFAULT_ARCHIVE_DIR = os.path.join("results", "forecast_archive")
+
+# 예보 발표일(리드 타임 계산)을 정하는 지점 현지 시간대
+DEFAULT_TIMEZONE = "Pacific/Guam"
+
+# 파티션에서 합친 파일과 그 파일에 포함된 원본 스냅샷 목록을 기록하는 파일
+COMPACTION_MANIFEST = "_compacted.json"
+
+# 파티션 컬럼 (디렉터리 이름으로만 저장)
+PARTITION_SCHEMA = pa.schema([
+    ("location", pa.string()),
+    ("issue_month", pa.string())
+])
+
+# parquet 파일에 저장하는 컬럼
+ARCHIVE_SCHEMA = pa.schema([
+    ("issue_time", pa.timestamp("us", tz="UTC")),
+    ("valid_date", pa.date32()),
+    ("latitude", pa.float32()),
+    ("longitude", pa.float32()),
+    ("high_c", pa.float32()),
+    ("low_c", pa.float32()),
+    ("precip_prob", pa.float32()),
+    ("short_forecast", pa.string())
+])
+
+# forecast_to_dataframe 컬럼 → 아카이브 컬럼
+FORECAST_COLUMNS = {
+    'High (°C)': 'high_c',
+    'Low (°C)': 'low_c',
+    'Precip Prob (%)': 'precip_prob',
+    'Short Forecast': 'short_forecast'
+}
+
+def _write_atomic(table, path, **options):
+    """숨김 임시 파일에 쓴 뒤 이름을 바꿔서 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 함"""
+    tmp_path = os.path.join(os.path.dirname(path), "." + os.path.basename(path) + ".tmp")
+    pq.write_table(table, tmp_path, **options)
+    os.replace(tmp_path, path)
+
+def _read_manifest(partition_dir):
+    """파티션의 합치기 기록 (없으면 None)"""
+    try:
+        with open(os.path.join(partition_dir, COMPACTION_MANIFEST), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _partition_files(partition_dir):
+    """파티션에서 읽을 parquet 파일 목록 (합친 파일 + 합친 뒤에 추가된 스냅샷)
+    
+    합친 파일에 포함된 원본 스냅샷과 기록에 없는 compacted-* 파일(기록 전에 중단된 합치기)은 제외한다.
+    """
+    manifest = _read_manifest(partition_dir)
+    sources = set(manifest["sources"]) if manifest else set()
+    paths = [os.path.join(partition_dir, manifest["compacted"])] if manifest else []
+    for path in sorted(glob.glob(os.path.join(partition_dir, "*.parquet"))):
+        name = os.path.basename(path)
+        if name not in sources and not name.startswith("compacted-"):
+            paths.append(path)
+    return paths
+
+def _utc_timestamp(value):
+    """문자열/Timestamp를 UTC Timestamp로 변환 (시간대가 없으면 UTC로 간주)"""
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+class ForecastArchive:
+    """예보 스냅샷 누적 저장소 (기존 파일은 수정하지 않고 새 파일만 추가)"""
+    
+    def __init__(self, root=DEFAULT_ARCHIVE_DIR):
+        self.root = root
+    
+    def _partition_dir(self, location, issue_time):
+        return os.path.join(
+            self.root,
+            f"location={quote(location, safe='')}",
+            f"issue_month={issue_time:%Y-%m}"
+        )
+    
+    def append(self, forecast_df, location, issue_time, latitude=None, longitude=None):
+        """forecast_to_dataframe 형식의 예보 한 건을 스냅샷으로 추가
+        
+        같은 (지점, 발표 시각) 스냅샷이 이미 있으면 다시 쓰지 않는다.
+        저장한 파일 경로(이미 있으면 None)를 반환한다.
+        """
+        if forecast_df is None or forecast_df.empty:
+            return None
+        
+        issue_time = _utc_timestamp(issue_time)
+        partition_dir = self._partition_dir(location, issue_time)
+        part_path = os.path.join(partition_dir, f"part-{issue_time:%Y%m%dT%H%M%S}.parquet")
+        if self._has_snapshot(partition_dir, part_path, issue_time):
+            return None
+        
+        rows = len(forecast_df)
+        columns = {
+            "issue_time": np.full(rows, issue_time.to_datetime64()),
+            "valid_date": pd.to_datetime(forecast_df['Date']).dt.date.to_numpy(),
+            "latitude": np.full(rows, np.nan if latitude is None else latitude),
+            "longitude": np.full(rows, np.nan if longitude is None else longitude)
+        }
+        for source, target in FORECAST_COLUMNS.items():
+            if source in forecast_df:
+                columns[target] = forecast_df[source].to_numpy()
+            else:
+                columns[target] = np.full(rows, None)
+        table = pa.Table.from_pydict(
+            {field.name: columns[field.name] for field in ARCHIVE_SCHEMA}, schema=ARCHIVE_SCHEMA
+        )
+        
+        # 새 달의 첫 스냅샷이면 그 지점의 지난 달 파티션들을 합쳐서 파일 수를 일정하게 유지
+        if not os.path.isdir(partition_dir):
+            self.compact(location, before_month=f"{issue_time:%Y-%m}")
+        os.makedirs(partition_dir, exist_ok=True)
+        _write_atomic(table, part_path)
+        return part_path
+    
+    def _has_snapshot(self, partition_dir, part_path, issue_time):
+        """같은 발표 시각의 스냅샷이 이미 저장되어 있는지 (원본을 지우던 이전 방식의 merged 파일 포함)"""
+        if os.path.exists(part_path):
+            return True
+        merged_paths = glob.glob(os.path.join(partition_dir, "merged-*.parquet"))
+        if not merged_paths:
+            return False
+        issue_scalar = pa.scalar(issue_time.to_pydatetime(), ARCHIVE_SCHEMA.field("issue_time").type)
+        return ds.dataset(merged_paths, format="parquet").count_rows(filter=ds.field("issue_time") == issue_scalar) > 0
+    
+    def append_forecast(self, forecast_data, location, latitude=None, longitude=None, issue_time=None):
+        """NWS 예보 응답(JSON)을 스냅샷으로 추가 (발표 시각은 updateTime/generatedAt 사용)"""
+        if not forecast_data:
+            return None
+        
+        if issue_time is None:
+            properties = forecast_data.get('properties', {})
+            issue_time = properties.get('updateTime') or properties.get('generatedAt') or pd.Timestamp.now(tz="UTC")
+        return self.append(forecast_to_dataframe(forecast_data), location, issue_time, latitude, longitude)
+    
+    def _partitions(self, location=None, first_month=None, last_month=None):
+        """조건에 맞는 (지점, 발표 월, 디렉터리) 목록 (디렉터리 이름만 보고 고름)"""
+        if not os.path.isdir(self.root):
+            return []
+        
+        partitions = []
+        for location_entry in os.scandir(self.root):
+            if not location_entry.name.startswith("location="):
+                continue
+            name = unquote(location_entry.name[len("location="):])
+            if location is not None and name != location:
+                continue
+            for month_entry in os.scandir(location_entry.path):
+                if not month_entry.name.startswith("issue_month="):
+                    continue
+                month = month_entry.name[len("issue_month="):]
+                if first_month is not None and month < first_month:
+                    continue
+                if last_month is not None and month > last_month:
+                    continue
+                partitions.append((name, month, month_entry.path))
+        return sorted(partitions)
+    
+    def read(self, location=None, start=None, end=None, as_of=None, issued_after=None, columns=None):
+        """조건에 맞는 스냅샷 행 조회
+        
+        location: 지점 이름, start/end: 예보 대상 날짜 범위,
+        as_of: 이 시각까지 발표된 예보만, issued_after: 이 시각 이후 발표된 예보만
+        """
+        as_of = None if as_of is None else _utc_timestamp(as_of)
+        issued_after = None if issued_after is None else _utc_timestamp(issued_after)
+        
+        # 1. 파티션 가지치기 (해당 디렉터리의 파일만 나열)
+        #    예보는 대상 날짜 이전에 발표되므로 end가 있으면 end가 속한 달 이후 파티션도 제외
+        last_months = [f"{ts:%Y-%m}" for ts in (as_of, None if end is None else pd.Timestamp(end)) if ts is not None]
+        partitions = self._partitions(
+            location,
+            None if issued_after is None else f"{issued_after:%Y-%m}",
+            min(last_months) if last_months else None
+        )
+        paths = [
+            path for _, _, partition_dir in partitions
+            for path in _partition_files(partition_dir)
+        ]
+        if not paths:
+            return pd.DataFrame(columns=["location", "issue_month"] + ARCHIVE_SCHEMA.names)
+        
+        dataset = ds.dataset(
+            paths, schema=pa.unify_schemas([ARCHIVE_SCHEMA, PARTITION_SCHEMA]), format="parquet",
+            partition_base_dir=self.root,
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+        )
+        
+        conditions = []
+        issue_type = ARCHIVE_SCHEMA.field("issue_time").type
+        if as_of is not None:
+            conditions.append(ds.field("issue_time") <= pa.scalar(as_of.to_pydatetime(), issue_type))
+        if issued_after is not None:
+            conditions.append(ds.field("issue_time") >= pa.scalar(issued_after.to_pydatetime(), issue_type))
+        
+        # 2. 예보 대상 날짜 조건 (행 그룹 통계로 건너뜀)
+        if start is not None:
+            conditions.append(ds.field("valid_date") >= pa.scalar(pd.Timestamp(start).date(), pa.date32()))
+        if end is not None:
+            conditions.append(ds.field("valid_date") <= pa.scalar(pd.Timestamp(end).date(), pa.date32()))
+        
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        
+        table = dataset.to_table(columns=columns, filter=expression)
+        df = table.to_pandas()
+        if "valid_date" in df:
+            df["valid_date"] = pd.to_datetime(df["valid_date"])
+        return df
+    
+    def snapshot(self, as_of=None, location=None, start=None, end=None):
+        """as_of 시점 기준으로 (지점, 예보 대상 날짜)마다 가장 최근에 발표된 예보"""
+        df = self.read(location=location, start=start, end=end, as_of=as_of)
+        if df.empty:
+            return df
+        
+        df = df.sort_values(["location", "valid_date", "issue_time"], kind="mergesort")
+        latest = df.drop_duplicates(["location", "valid_date"], keep="last")
+        return latest.reset_index(drop=True)
+    
+    def latest_forecast(self, valid_date, as_of=None, location=None):
+        """valid_date 날짜에 대해 as_of 시점까지 발표된 가장 최근 예보"""
+        return self.snapshot(as_of=as_of, location=location, start=valid_date, end=valid_date)
+    
+    def forecast_error(self, observed_df, location=None, as_of=None, latest_only=False, timezone=DEFAULT_TIMEZONE):
+        """예보와 관측(일별 CSV 처리 데이터, 섭씨)의 오차
+        
+        observed_df는 Date, Maximum, Minimum 컬럼을 가진 처리된 일별 데이터.
+        latest_only가 True면 날짜마다 마지막 발표 예보만, 아니면 모든 스냅샷을 비교한다.
+        lead_days(timezone 현지 발표일로부터 며칠 뒤 예보인지), high_error/low_error(예보 - 관측) 컬럼을 추가한다.
+        """
+        observed = observed_df[['Date', 'Maximum', 'Minimum']]
+        start, end = observed['Date'].min(), observed['Date'].max()
+        
+        if latest_only:
+            forecasts = self.snapshot(as_of=as_of, location=location, start=start, end=end)
+        else:
+            forecasts = self.read(location=location, start=start, end=end, as_of=as_of)
+        if forecasts.empty:
+            return pd.DataFrame()
+        
+        merged = forecasts.merge(observed, left_on='valid_date', right_on='Date', how='inner')
+        # 예보 대상 날짜는 현지 날짜이므로 발표 시각도 현지 시각으로 바꾼 뒤 날짜를 구함
+        issue_dates = merged['issue_time'].dt.tz_convert(timezone).dt.tz_localize(None).dt.normalize()
+        merged['lead_days'] = (merged['valid_date'] - issue_dates).dt.days
+        merged['high_error'] = merged['high_c'] - merged['Maximum']
+        merged['low_error'] = merged['low_c'] - merged['Minimum']
+        return merged.drop(columns='Date')
+    
+    def compact(self, location=None, before_month=None):
+        """파티션마다 작은 스냅샷 파일들을 합친 새 파일을 만듦 (원본 스냅샷은 그대로 보관)
+        
+        before_month(YYYY-MM, 기본값: 이번 달)보다 이전의 닫힌 파티션만 합친다.
+        이후 조회는 합친 파일과 그 뒤에 추가된 스냅샷만 읽는다. 합친 파일 경로 목록을 반환한다.
+        """
+        before_month = before_month or f"{pd.Timestamp.now(tz='UTC'):%Y-%m}"
+        merged_paths = []
+        for _, month, partition_dir in self._partitions(location):
+            if month >= before_month:
+                continue
+            merged_path = self._compact_partition(partition_dir)
+            if merged_path:
+                merged_paths.append(merged_path)
+        return merged_paths
+    
+    def _compact_partition(self, partition_dir):
+        part_paths = _partition_files(partition_dir)
+        if len(part_paths) < 2:
+            return None
+        
+        table = pa.concat_tables([pq.read_table(path, schema=ARCHIVE_SCHEMA) for path in part_paths])
+        table = table.sort_by([("valid_date", "ascending"), ("issue_time", "ascending")])
+        
+        # 1. 합친 파일을 새 이름으로 기록 (다시 합칠 때마다 행 수가 늘어나므로 이름이 겹치지 않음)
+        compacted_path = os.path.join(
+            partition_dir, f"compacted-{table['issue_time'][-1].value}-{table.num_rows}.parquet"
+        )
+        _write_atomic(table, compacted_path, row_group_size=64 * 1024)
+        
+        # 2. 기록 파일을 바꿔서 조회 대상을 전환 (이전에 합친 파일과 원본은 지우지 않음)
+        manifest = _read_manifest(partition_dir) or {"sources": []}
+        sources = set(manifest["sources"]) | {os.path.basename(path) for path in part_paths}
+        manifest_path = os.path.join(partition_dir, COMPACTION_MANIFEST)
+        tmp_path = os.path.join(partition_dir, "." + COMPACTION_MANIFEST + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"compacted": os.path.basename(compacted_path), "sources": sorted(sources)}, f, indent=2)
+        os.replace(tmp_path, manifest_path)
+        return compacted_path
+
+def forecast_skill(errors, by="lead_days"):
+    """forecast_error 결과를 리드 타임별로 요약 (건수, 평균 오차(bias), MAE, RMSE)"""
+    if errors is None or errors.empty:
+        return pd.DataFrame()
+    
+    grouped = errors.assign(
+        high_abs=errors['high_error'].abs(), low_abs=errors['low_error'].abs(),
+        high_sq=errors['high_error'] ** 2, low_sq=errors['low_error'] ** 2
+    ).groupby(by)
+    summary = grouped.agg(
+        count=('high_error', 'count'),
+        high_bias=('high_error', 'mean'), low_bias=('low_error', 'mean'),
+        high_mae=('high_abs', 'mean'), low_mae=('low_abs', 'mean'),
+        high_rmse=('high_sq', 'mean'), low_rmse=('low_sq', 'mean')
+    )
+    summary[['high_rmse', 'low_rmse']] = np.sqrt(summary[['high_rmse', 'low_rmse']])
+    return summary.round(2)
@@ -0,0 +1,295 @@
+"""
+성능 계측(instrumentation) 모듈
+
+데코레이터(@instrument)와 컨텍스트 매니저(span)로 단계별 실행 시간, 행 수, 읽은 바이트,
+메모리 변화량을 모은다. 계측이 꺼져 있으면(기본값) 전역 플래그 하나만 확인하고 원래 함수를
+바로 호출하므로 비용이 거의 없다. 환경 변수 GUAM_WEATHER_PROFILE=1 또는 enable()로 켠다.
+
+모은 값은 단계 이름별 누적 통계(호출 수/합계/최소/최대)와 최근 구간 기록으로 보관하며
+JSON(export_json) 또는 Prometheus 텍스트 형식(export_prometheus)으로 내보낼 수 있다.
+"""
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+PROFILE_ENV = "GUAM_WEATHER_PROFILE"
+
+# 최근 구간 기록 개수 (디버그 패널 표시용)
+RECENT_SPAN_COUNT = 200
+
+PROMETHEUS_PREFIX = "guam_weather_stage"
+
+_ENABLED = os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes")
+
+# enable(trace_memory=True)가 tracemalloc을 직접 시작했는지 (다른 곳에서 시작한 추적은 끄지 않음)
+_STARTED_TRACEMALLOC = False
+
+# 현재 실행 중인 구간 (중첩 구간의 부모, 스레드/비동기 작업별로 분리)
+_CURRENT_SPAN = contextvars.ContextVar("current_span", default=None)
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = None
+
+def _memory_bytes():
+    """현재 메모리 사용량: tracemalloc 추적 중이면 추적 메모리, 아니면 프로세스 RSS (알 수 없으면 None)"""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    if _PAGE_SIZE is None:
+        return None
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+def _count_rows(value):
+    """DataFrame/Series/배열(또는 첫 원소가 그런 튜플)의 행 수, 알 수 없으면 None"""
+    if isinstance(value, tuple) and value:
+        value = value[0]
+    if hasattr(value, "shape") and getattr(value, "shape", None):
+        return int(value.shape[0])
+    return None
+
+class Span:
+    """계측 구간 하나 (with span(...) as s: 안에서 s.add_rows()/s.add_bytes()로 값 추가)"""
+    
+    __slots__ = ("stage", "parent", "rows", "bytes_read", "start", "seconds", "memory_delta", "_memory_start")
+    
+    def __init__(self, stage, parent=None):
+        self.stage = stage
+        self.parent = parent
+        self.rows = None
+        self.bytes_read = None
+        self.seconds = None
+        self.memory_delta = None
+        self._memory_start = _memory_bytes()
+        self.start = time.perf_counter()
+    
+    def add_rows(self, rows):
+        if rows is not None:
+            self.rows = (self.rows or 0) + int(rows)
+    
+    def add_bytes(self, size):
+        if size is not None:
+            self.bytes_read = (self.bytes_read or 0) + int(size)
+    
+    def finish(self):
+        self.seconds = time.perf_counter() - self.start
+        memory_end = _memory_bytes()
+        if memory_end is not None and self._memory_start is not None:
+            self.memory_delta = memory_end - self._memory_start
+    
+    def to_dict(self):
+        return {
+            "stage": self.stage, "parent": self.parent, "seconds": self.seconds,
+            "rows": self.rows, "bytes_read": self.bytes_read, "memory_delta_bytes": self.memory_delta
+        }
+
+class _NullSpan:
+    """계측이 꺼져 있을 때 쓰는 아무것도 하지 않는 구간"""
+    
+    __slots__ = ()
+    
+    def add_rows(self, rows):
+        pass
+    
+    def add_bytes(self, size):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class MetricsRegistry:
+    """단계 이름별 누적 통계와 최근 구간 기록 (여러 스레드에서 기록 가능)"""
+    
+    def __init__(self, recent=RECENT_SPAN_COUNT):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._recent = deque(maxlen=recent)
+    
+    def record(self, span):
+        with self._lock:
+            stats = self._stages.get(span.stage)
+            if stats is None:
+                stats = self._stages[span.stage] = {
+                    "calls": 0, "seconds_total": 0.0, "seconds_min": None, "seconds_max": 0.0, "seconds_last": 0.0,
+                    "rows_total": 0, "bytes_read_total": 0, "memory_delta_max": None
+                }
+            stats["calls"] += 1
+            stats["seconds_total"] += span.seconds
+            stats["seconds_min"] = span.seconds if stats["seconds_min"] is None else min(stats["seconds_min"], span.seconds)
+            stats["seconds_max"] = max(stats["seconds_max"], span.seconds)
+            stats["seconds_last"] = span.seconds
+            stats["rows_total"] += span.rows or 0
+            stats["bytes_read_total"] += span.bytes_read or 0
+            if span.memory_delta is not None:
+                previous = stats["memory_delta_max"]
+                stats["memory_delta_max"] = span.memory_delta if previous is None else max(previous, span.memory_delta)
+            self._recent.append(span.to_dict())
+    
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._recent.clear()
+    
+    def stages(self):
+        """단계 이름 → 누적 통계 dict 복사본"""
+        with self._lock:
+            return {stage: dict(stats) for stage, stats in self._stages.items()}
+    
+    def recent(self):
+        with self._lock:
+            return list(self._recent)
+
+REGISTRY = MetricsRegistry()
+
+def enable(trace_memory=False):
+    """계측 켜기 (trace_memory=True면 RSS 대신 tracemalloc으로 파이썬 할당 메모리 변화량 측정)"""
+    global _ENABLED, _STARTED_TRACEMALLOC
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _STARTED_TRACEMALLOC = True
+    _ENABLED = True
+
+def disable():
+    """계측 끄기 (enable(trace_memory=True)로 시작한 tracemalloc도 중지)"""
+    global _ENABLED, _STARTED_TRACEMALLOC
+    _ENABLED = False
+    if _STARTED_TRACEMALLOC:
+        tracemalloc.stop()
+        _STARTED_TRACEMALLOC = False
+
+def is_enabled():
+    return _ENABLED
+
+def reset():
+    REGISTRY.reset()
+
+class span:
+    """with span("단계 이름") as s: 구간 실행 시간/메모리 변화량 기록 (꺼져 있으면 아무것도 하지 않음)
+    
+    안쪽 구간에서 읽은 바이트는 바깥 구간에도 더한다 (파일별 읽기 → 전체 로딩).
+    """
+    
+    __slots__ = ("stage", "_span", "_parent", "_token")
+    
+    def __init__(self, stage):
+        self.stage = stage
+        self._span = None
+        self._parent = None
+    
+    def __enter__(self):
+        if not _ENABLED:
+            return _NULL_SPAN
+        parent = self._parent = _CURRENT_SPAN.get()
+        self._span = Span(self.stage, parent.stage if parent is not None else None)
+        self._token = _CURRENT_SPAN.set(self._span)
+        return self._span
+    
+    def __exit__(self, *exc_info):
+        if self._span is not None:
+            _CURRENT_SPAN.reset(self._token)
+            self._span.finish()
+            REGISTRY.record(self._span)
+            if self._parent is not None:
+                self._parent.add_bytes(self._span.bytes_read)
+            self._span = self._parent = None
+        return False
+
+def current_span():
+    """실행 중인 구간 (없거나 계측이 꺼져 있으면 값을 버리는 구간)"""
+    active = _CURRENT_SPAN.get() if _ENABLED else None
+    return active if active is not None else _NULL_SPAN
+
+def _stage_name(func):
+    module = func.__module__.rsplit(".", 1)[-1]
+    return f"{module}.{func.__qualname__}"
+
+def instrument(stage=None, rows="output", bytes_read=None):
+    """함수 실행을 계측 구간으로 기록하는 데코레이터
+    
+    rows: "output"(반환값 행 수), "input"(첫 DataFrame 인자 행 수), None 또는 함수(result, *args, **kwargs)
+    bytes_read: 읽은 바이트를 돌려주는 함수(*args, **kwargs) (계측이 켜져 있을 때만 호출)
+    """
+    def decorator(func):
+        name = stage or _stage_name(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            
+            with span(name) as active:
+                result = func(*args, **kwargs)
+                if rows == "output":
+                    active.add_rows(_count_rows(result))
+                elif rows == "input":
+                    frames = [value for value in args if hasattr(value, "columns")]
+                    active.add_rows(_count_rows(frames[0]) if frames else None)
+                elif callable(rows):
+                    active.add_rows(rows(result, *args, **kwargs))
+                if bytes_read is not None:
+                    active.add_bytes(bytes_read(*args, **kwargs))
+            return result
+        return wrapper
+    return decorator
+
+def file_size(file_path, *args, **kwargs):
+    """bytes_read용: 첫 인자 파일의 크기"""
+    try:
+        return os.path.getsize(file_path)
+    except (OSError, TypeError):
+        return None
+
+def export_json(path=None, indent=2):
+    """단계별 누적 통계와 최근 구간 기록 JSON 문자열 (path를 주면 파일로도 저장)"""
+    text = json.dumps({"enabled": _ENABLED, "stages": REGISTRY.stages(), "recent": REGISTRY.recent()},
+                      ensure_ascii=False, indent=indent)
+    if path is not None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return text
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# (메트릭 이름, 통계 키, 형식, 설명)
+PROMETHEUS_METRICS = [
+    ("calls_total", "calls", "counter", "Number of times the stage ran"),
+    ("seconds_total", "seconds_total", "counter", "Total wall time spent in the stage"),
+    ("seconds_max", "seconds_max", "gauge", "Slowest single run of the stage"),
+    ("seconds_last", "seconds_last", "gauge", "Wall time of the most recent run"),
+    ("rows_total", "rows_total", "counter", "Rows produced or processed by the stage"),
+    ("bytes_read_total", "bytes_read_total", "counter", "Bytes read from files or the network"),
+    ("memory_delta_bytes_max", "memory_delta_max", "gauge", "Largest memory increase during one run")
+]
+
+def export_prometheus():
+    """Prometheus 텍스트 노출 형식 (단계 이름은 stage 레이블)"""
+    stages = REGISTRY.stages()
+    lines = []
+    for suffix, key, kind, description in PROMETHEUS_METRICS:
+        metric = f"{PROMETHEUS_PREFIX}_{suffix}"
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for stage, stats in sorted(stages.items()):
+            if stats[key] is not None:
+                lines.append(f'{metric}{{stage="{_label(stage)}"}} {stats[key]}')
+    return "\n".join(lines) + "\n"
+
+def stage_table():
+    """단계별 누적 통계 DataFrame (전체 시간이 긴 순)"""
+    import pandas as pd
+    
+    table = pd.DataFrame.from_dict(REGISTRY.stages(), orient="index")
+    if table.empty:
+        return table
+    table["seconds_mean"] = table["seconds_total"] / table["calls"]
+    return table.rename_axis("stage").sort_values("seconds_total", ascending=False)
@@ -0,0 +1,188 @@
+"""
+괌 날씨 분석 결과 그래프 일괄 생성(배치 리포트) 모듈
+
+pyplot 없이 Agg 캔버스에 연결한 Figure 객체로만 그리므로 화면이 없는 환경에서도 동작하고,
+그래프마다 별도 프로세스에서 병렬로 렌더링한다. 그래프 입력 집계값(+ 크기, dpi)의 해시를
+manifest에 기록해 두고, 지난 실행과 같으면 이미지를 다시 만들지 않는다.
+
+실행 예: python -m src.report --data-dir data --output-dir results
+"""
+import os
+import sys
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+
+try:
+    from .aggregates import get_aggregate_cube
+    from .data_processing import DEFAULT_CACHE_DIR, load_processed_data
+    from .figure_cache import FigureCache, cached_png, code_version, figure_key
+    from . import visualization
+except ImportError:
+    from aggregates import get_aggregate_cube
+    from data_processing import DEFAULT_CACHE_DIR, load_processed_data
+    from figure_cache import FigureCache, cached_png, code_version, figure_key
+    import visualization
+
+REPORT_MANIFEST = ".report_manifest.json"
+REPORT_DPI = 300
+
+# 렌더링 방식(저장 옵션 등)이 바뀌면 올려서 기존 이미지를 모두 다시 생성
+# (그리기 함수와 visualization.py 소스 변경은 code_version으로 자동 반영)
+REPORT_VERSION = 1
+
+# 그래프 이름(= 파일 이름): (그림 크기, 입력 집계 함수, 그리기 함수 이름)
+REPORT_CHARTS = {
+    "monthly_temperature_by_year": ((12, 6), visualization.monthly_temperature_data, "draw_monthly_temperature_by_year"),
+    "monthly_precipitation_by_year": ((12, 6), visualization.monthly_precipitation_data, "draw_monthly_precipitation_by_year"),
+    "yearly_summary": ((15, 5), visualization.yearly_summary_data, "draw_yearly_summary"),
+    "temperature_departure": ((14, 6), visualization.temperature_departure_data, "draw_temperature_departure"),
+    "comprehensive_dashboard": ((16, 12), visualization.dashboard_data, "draw_comprehensive_dashboard")
+}
+
+# 예보 그래프는 집계 큐브가 아닌 예보 DataFrame을 그대로 입력으로 사용
+FORECAST_CHART = ("forecast_visualization", (12, 6), "draw_forecast_comparison")
+
+def _as_frames(data):
+    return data if isinstance(data, tuple) else (data,)
+
+def chart_fingerprint(name, data, figsize, draw_name, dpi=REPORT_DPI):
+    """그래프 입력 집계값, 렌더링 옵션, 그리기 코드 버전의 해시 (그래프 캐시 키로도 사용)"""
+    return figure_key(name, data, figsize=list(figsize), dpi=dpi, report_version=REPORT_VERSION,
+                      code=code_version(getattr(visualization, draw_name)))
+
+def render_chart(name, data, figsize, draw_name, output_path, dpi=REPORT_DPI):
+    """Agg 캔버스 Figure에 그래프 하나를 그려 PNG로 저장 (작업 프로세스에서 실행)
+    
+    matplotlib은 다시 그릴 그래프가 있을 때만 import (모두 최신이면 불러오지 않음)
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    import matplotlib.style
+    
+    with matplotlib.style.context(visualization.FONT_STYLE):
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        getattr(visualization, draw_name)(fig, *_as_frames(data))
+        
+        # 임시 파일에 저장한 뒤 교체해서 중간에 실패해도 이전 이미지가 남도록 함
+        tmp_path = output_path + ".tmp.png"
+        fig.savefig(tmp_path, dpi=dpi, bbox_inches='tight')
+    os.replace(tmp_path, output_path)
+    return name
+
+def _read_manifest(manifest_path):
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _write_manifest(manifest_path, manifest):
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+def chart_png(name, df, dpi=100, cache=None):
+    """REPORT_CHARTS의 그래프 하나를 PNG bytes로 반환 (입력 집계값/크기/dpi가 같으면 캐시 사용)"""
+    figsize, data_func, draw_name = REPORT_CHARTS[name]
+    cache = cache if cache is not None else FigureCache()
+    data = data_func(get_aggregate_cube(df))
+    return cached_png(cache, name, getattr(visualization, draw_name), data, figsize, dpi,
+                      style=visualization.FONT_STYLE)
+
+def render_report(df, output_dir="results", forecast_df=None, workers=None, force=False, dpi=REPORT_DPI,
+                  cache=None):
+    """분석 그래프 전체를 output_dir에 PNG로 생성
+    
+    입력 집계값이 지난 실행과 같은 그래프는 건너뛰고, 나머지는 workers개 프로세스에서
+    병렬로 렌더링한다 (None이면 CPU 수, 1이면 현재 프로세스에서 순서대로).
+    cache(FigureCache)에 같은 입력으로 그린 이미지가 있으면 그리지 않고 복사한다.
+    {그래프 이름: "rendered", "cached" 또는 "skipped"}를 반환한다.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, REPORT_MANIFEST)
+    manifest = _read_manifest(manifest_path)
+    
+    # 1. 집계는 현재 프로세스에서 한 번만 (큐브 공유), 작업 프로세스에는 작은 집계표만 전달
+    cube = get_aggregate_cube(df)
+    charts = [
+        (name, data_func(cube), figsize, draw_name)
+        for name, (figsize, data_func, draw_name) in REPORT_CHARTS.items()
+    ]
+    if forecast_df is not None and not forecast_df.empty:
+        name, figsize, draw_name = FORECAST_CHART
+        charts.append((name, forecast_df[['Date', 'High (°C)', 'Low (°C)']], figsize, draw_name))
+    
+    # 2. 입력 해시가 같고 이미지가 남아 있으면 건너뜀
+    status = {}
+    jobs = []
+    fingerprints = {}
+    for name, data, figsize, draw_name in charts:
+        output_path = os.path.join(output_dir, f"{name}.png")
+        fingerprints[name] = chart_fingerprint(name, data, figsize, draw_name, dpi)
+        if not force and manifest.get(name) == fingerprints[name] and os.path.exists(output_path):
+            status[name] = "skipped"
+            continue
+        
+        payload = None if cache is None or force else cache.get(fingerprints[name])
+        if payload is not None:
+            with open(output_path, "wb") as f:
+                f.write(payload)
+            status[name] = "cached"
+            manifest[name] = fingerprints[name]
+        else:
+            jobs.append((name, data, figsize, draw_name, output_path, dpi))
+    
+    # 3. 바뀐 그래프만 렌더링
+    if workers == 1 or len(jobs) <= 1:
+        rendered = [render_chart(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(jobs))) as executor:
+            futures = [executor.submit(render_chart, *job) for job in jobs]
+            rendered = [future.result() for future in futures]
+    
+    for name in rendered:
+        status[name] = "rendered"
+        manifest[name] = fingerprints[name]
+        if cache is not None:
+            with open(os.path.join(output_dir, f"{name}.png"), "rb") as f:
+                cache.put(fingerprints[name], f.read())
+    _write_manifest(manifest_path, manifest)
+    return status
+
+def main():
+    parser = argparse.ArgumentParser(description="괌 날씨 분석 그래프 일괄 생성")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="전처리 결과 캐시 디렉토리")
+    parser.add_argument("--output-dir", default="results")
+    parser.add_argument("--forecast-csv", default=None, help="예보 CSV (예: results/forecast_data.csv)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="입력이 같아도 모두 다시 생성")
+    parser.add_argument("--no-cache", action="store_true", help="그래프 캐시(.cache/figures) 사용 안 함")
+    args = parser.parse_args()
+    
+    try:
+        df = load_processed_data(args.data_dir, cache_dir=args.cache_dir)
+    except (OSError, ValueError) as e:
+        print(f"데이터를 불러올 수 없습니다: {e}")
+        return 1
+    if df.empty:
+        print(f"데이터가 없습니다: {args.data_dir}")
+        return 1
+    
+    forecast_df = None
+    if args.forecast_csv and os.path.exists(args.forecast_csv):
+        forecast_df = pd.read_csv(args.forecast_csv, parse_dates=['Date'])
+    
+    cache = None if args.no_cache else FigureCache()
+    status = render_report(df, args.output_dir, forecast_df, workers=args.workers, force=args.force, cache=cache)
+    labels = {"rendered": "생성", "cached": "캐시에서 복사", "skipped": "변경 없음(건너뜀)"}
+    for name, state in status.items():
+        print(f"{name}.png: {labels[state]}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+괌 날씨 일별 데이터 SQLite 저장소 모듈
+
+전처리된 일별 데이터를 파일 기반 SQLite 테이블 하나(daily_weather)에 저장하고
+Date, (Year, Month), (Station, Year, Month) 인덱스를 만든다.
+집계(합계/평균/개수/최소/최대/분산)는 SQL의 GROUP BY로 실행하므로
+파이썬으로는 집계 결과 행만 넘어온다. 추가 의존성 없이 표준 라이브러리 sqlite3만 사용한다.
+"""
+import os
+import sqlite3
+import threading
+from contextlib import closing
+import numpy as np
+import pandas as pd
+
+try:
+    from .aggregates import frame_cache_key
+    from .stations import STATION_COLUMN, DEFAULT_STATION
+except ImportError:
+    from aggregates import frame_cache_key
+    from stations import STATION_COLUMN, DEFAULT_STATION
+
+DEFAULT_SQL_PATH = os.path.join(".cache", "weather.sqlite")
+TABLE_NAME = "daily_weather"
+
+# 저장 방식이 바뀌면 올려서 기존 파일을 다시 생성
+SQL_STORE_VERSION = 1
+
+KEY_COLUMNS = [STATION_COLUMN, "Date", "Year", "Month", "Day"]
+
+# 조건식에 허용하는 비교 연산자
+CONDITION_OPERATORS = ("=", "!=", "<", "<=", ">", ">=")
+
+# 경로별로 공유하는 저장소 객체
+_SQL_STORES = {}
+_SQL_STORES_LOCK = threading.Lock()
+
+def _stored_version(df):
+    """meta에 기록할 버전 (저장 방식 버전 + 데이터 버전), 버전이 없거나 필터링한 DataFrame이면 None"""
+    frame_key = frame_cache_key(df)
+    if frame_key is None:
+        return None
+    return f"v{SQL_STORE_VERSION}:{frame_key[0]}"
+
+def _quote(name):
+    """SQL 식별자 따옴표 처리 (컬럼 이름에 공백이 있어도 사용 가능)"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+class WeatherSQLStore:
+    """daily_weather 테이블 하나를 가진 SQLite 파일 (쿼리마다 새 연결이므로 여러 스레드에서 사용 가능)"""
+    
+    def __init__(self, path=DEFAULT_SQL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+    
+    def _connect(self):
+        return closing(sqlite3.connect(self.path))
+    
+    def _meta(self, connection, key):
+        try:
+            row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+    
+    @property
+    def data_version(self):
+        if not os.path.exists(self.path):
+            return None
+        with self._connect() as connection:
+            return self._meta(connection, "data_version")
+    
+    @property
+    def columns(self):
+        """테이블의 측정값 컬럼 목록"""
+        with self._connect() as connection:
+            rows = connection.execute(f"PRAGMA table_info({TABLE_NAME})").fetchall()
+        return [row[1] for row in rows if row[1] not in KEY_COLUMNS]
+    
+    def load(self, df):
+        """일별 데이터로 테이블을 새로 만들고 인덱스 생성 (한 트랜잭션, 데이터 버전 기록)"""
+        table = df.copy(deep=False)
+        if STATION_COLUMN not in table.columns:
+            table[STATION_COLUMN] = DEFAULT_STATION
+        table[STATION_COLUMN] = table[STATION_COLUMN].astype(str)
+        table["Date"] = pd.to_datetime(table["Date"]).dt.strftime("%Y-%m-%d")
+        for column in ("Year", "Month", "Day"):
+            if column not in table.columns:
+                table[column] = getattr(pd.to_datetime(df["Date"]).dt, column.lower())
+        measures = [
+            column for column in table.columns
+            if column not in KEY_COLUMNS and pd.api.types.is_numeric_dtype(table[column])
+        ]
+        table = table[KEY_COLUMNS + measures]
+        
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock, self._connect() as connection:
+            with connection:
+                connection.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+                definitions = [
+                    f"{_quote(STATION_COLUMN)} TEXT NOT NULL",
+                    '"Date" TEXT NOT NULL',
+                    '"Year" INTEGER NOT NULL',
+                    '"Month" INTEGER NOT NULL',
+                    '"Day" INTEGER NOT NULL'
+                ] + [f"{_quote(column)} REAL" for column in measures]
+                connection.execute(f"CREATE TABLE {TABLE_NAME} ({', '.join(definitions)})")
+                
+                placeholders = ", ".join("?" * len(table.columns))
+                rows = table.astype(object).where(table.notna(), None).itertuples(index=False, name=None)
+                connection.executemany(f"INSERT INTO {TABLE_NAME} VALUES ({placeholders})", rows)
+                
+                connection.execute(f'CREATE INDEX idx_{TABLE_NAME}_date ON {TABLE_NAME} ("Date")')
+                connection.execute(f'CREATE INDEX idx_{TABLE_NAME}_year_month ON {TABLE_NAME} ("Year", "Month")')
+                connection.execute(
+                    f'CREATE INDEX idx_{TABLE_NAME}_station ON {TABLE_NAME} ({_quote(STATION_COLUMN)}, "Year", "Month")'
+                )
+                
+                connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+                connection.execute("INSERT OR REPLACE INTO meta VALUES ('data_version', ?)", (_stored_version(df),))
+                connection.execute("ANALYZE")
+        return self
+    
+    def sync(self, df):
+        """전체 데이터 df의 데이터 버전이 저장된 버전과 다를 때만 다시 적재
+        
+        버전이 없거나 필터링한 DataFrame은 적재하지 않는다 (ValueError).
+        부분 집계는 전체 데이터를 한 번 적재한 뒤 aggregate의 year/month/station/start/end 필터로 한다.
+        """
+        version = _stored_version(df)
+        if version is None:
+            raise ValueError("데이터 버전이 있는 전체 DataFrame만 동기화할 수 있습니다 (부분 집계는 필터 인자 사용)")
+        if self.data_version != version:
+            self.load(df)
+        return self
+    
+    def _where(self, year=None, month=None, station=None, start=None, end=None, conditions=None):
+        """필터 조건 → (WHERE 절, 파라미터), 값은 모두 ? 파라미터로 전달"""
+        clauses = []
+        params = []
+        for column, value in ((STATION_COLUMN, station), ("Year", year), ("Month", month)):
+            if value is not None:
+                clauses.append(f"{_quote(column)} = ?")
+                params.append(str(value) if column == STATION_COLUMN else int(value))
+        if start is not None:
+            clauses.append('"Date" >= ?')
+            params.append(pd.Timestamp(start).strftime("%Y-%m-%d"))
+        if end is not None:
+            clauses.append('"Date" <= ?')
+            params.append(pd.Timestamp(end).strftime("%Y-%m-%d"))
+        for column, operator, value in conditions or []:
+            if operator not in CONDITION_OPERATORS:
+                raise ValueError(f"지원하지 않는 비교 연산자: {operator}")
+            clauses.append(f"{_quote(column)} {operator} ?")
+            params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+    
+    def query(self, sql, params=()):
+        """임의 SQL 실행 결과 DataFrame (집계 쿼리용)"""
+        with self._connect() as connection:
+            return pd.read_sql_query(sql, connection, params=params)
+    
+    def aggregate(self, aggregations, by=("Year", "Month"), **filters):
+        """SQL GROUP BY로 계산한 요약표 (cube_summary와 같은 모양)
+        
+        aggregations: {컬럼: 통계} 또는 {컬럼: [통계, ...]} (sum, count, min, max, mean, var, std)
+        filters: year, month, station, start, end, conditions=[(컬럼, 연산자, 값), ...]
+        by가 비어 있으면 값 하나씩을 담은 Series 반환
+        """
+        by = list(by)
+        stats = {
+            column: list(stat) if isinstance(stat, (list, tuple)) else [stat]
+            for column, stat in aggregations.items()
+        }
+        
+        # 1. 통계마다 필요한 SQL 집계 (분산은 개수/합/제곱합으로 나눠서 가져옴)
+        selects = [_quote(key) for key in by]
+        for index, (column, names) in enumerate(stats.items()):
+            quoted = _quote(column)
+            selects += [
+                f"COUNT({quoted}) AS c{index}", f"SUM({quoted}) AS s{index}",
+                f"MIN({quoted}) AS lo{index}", f"MAX({quoted}) AS hi{index}"
+            ]
+            if {"var", "std"} & set(names):
+                selects.append(f"SUM({quoted} * {quoted}) AS q{index}")
+        
+        where, params = self._where(**filters)
+        sql = f"SELECT {', '.join(selects)} FROM {TABLE_NAME}{where}"
+        if by:
+            keys = ", ".join(_quote(key) for key in by)
+            sql += f" GROUP BY {keys} ORDER BY {keys}"
+        rows = self.query(sql, params)
+        
+        # 2. 집계 행에서 통계 계산 (일별 행은 넘어오지 않음)
+        summary = {}
+        for index, (column, names) in enumerate(stats.items()):
+            count = rows[f"c{index}"].astype("int64")
+            total = rows[f"s{index}"].astype(float)
+            for name in names:
+                if name == "count":
+                    value = count
+                elif name == "sum":
+                    value = total.fillna(0.0)
+                elif name == "min":
+                    value = rows[f"lo{index}"].astype(float)
+                elif name == "max":
+                    value = rows[f"hi{index}"].astype(float)
+                elif name == "mean":
+                    value = total / count.where(count > 0)
+                elif name in ("var", "std"):
+                    # 표본 분산 (pandas 기본값과 같은 ddof=1)
+                    value = ((rows[f"q{index}"] - total * total / count) / (count - 1)).where(count > 1).clip(lower=0)
+                    if name == "std":
+                        value = np.sqrt(value)
+                else:
+                    raise ValueError(f"지원하지 않는 통계: {name}")
+                key = (column, name) if isinstance(aggregations[column], (list, tuple)) else column
+                summary[key] = value
+        
+        summary = pd.DataFrame(summary)
+        if not by:
+            return summary.iloc[0]
+        return pd.concat([rows[by], summary], axis=1)
+    
+    def count(self, **filters):
+        """조건에 맞는 일수"""
+        where, params = self._where(**filters)
+        with self._connect() as connection:
+            return connection.execute(f"SELECT COUNT(*) FROM {TABLE_NAME}{where}", params).fetchone()[0]
+    
+    def bucket_counts(self, column, edges, labels, **filters):
+        """(edges[i], edges[i+1]] 구간별 일수 Series (pd.cut(right=True)과 같은 경계, 구간 밖 값은 제외)"""
+        quoted = _quote(column)
+        cases = []
+        params = []
+        for label, (low, high) in zip(labels, zip(edges[:-1], edges[1:])):
+            cases.append(f"SUM(CASE WHEN {quoted} > ? AND {quoted} <= ? THEN 1 ELSE 0 END)")
+            params += [float(low), float(high)]
+        where, where_params = self._where(**filters)
+        with self._connect() as connection:
+            row = connection.execute(f"SELECT {', '.join(cases)} FROM {TABLE_NAME}{where}",
+                                     params + where_params).fetchone()
+        return pd.Series([value or 0 for value in row], index=list(labels), name="count", dtype="int64")
+
+def get_sql_store(df, path=DEFAULT_SQL_PATH):
+    """경로별로 공유하는 저장소를 df의 데이터 버전에 맞춰 갱신한 뒤 반환"""
+    with _SQL_STORES_LOCK:
+        store = _SQL_STORES.get(path)
+        if store is None:
+            store = _SQL_STORES[path] = WeatherSQLStore(path)
+    return store.sync(df)
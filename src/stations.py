@@ -0,0 +1,119 @@
+"""
+관측소별 분할 저장 구조(파티션) 모듈
+
+여러 관측소의 월별 CSV를 관측소/연도 디렉토리로 나누어 저장한다.
+    data/station=<관측소>/year=<YYYY>/<YYYY_MM>.csv
+관측소/연도/월 조건이 있으면 해당 디렉토리만 열어 보므로(파티션 가지치기)
+조건에 맞지 않는 관측소나 연도의 파일은 목록 조회조차 하지 않는다.
+data/ 바로 아래의 YYYY_MM.csv(기존 단일 관측소 구조)는 DEFAULT_STATION의 데이터로 취급한다.
+"""
+import os
+from urllib.parse import quote, unquote
+
+STATION_COLUMN = "Station"
+
+# 기존 data/ 바로 아래 CSV의 관측소 (괌 국제공항)
+DEFAULT_STATION = "PGUM"
+
+STATION_PREFIX = "station="
+YEAR_PREFIX = "year="
+
+def _as_filter(values):
+    """None(전체) 또는 값 하나/여러 개를 문자열 집합으로"""
+    if values is None:
+        return None
+    if isinstance(values, (str, int)):
+        values = [values]
+    return {str(value) for value in values}
+
+def parse_month_file(filename):
+    """YYYY_MM.csv 파일 이름의 (연도, 월), 형식이 다르면 (None, None)"""
+    name = os.path.basename(filename)[:-4]
+    parts = name.split("_")
+    if len(parts) == 2 and all(part.isdigit() for part in parts):
+        return int(parts[0]), int(parts[1])
+    return None, None
+
+def station_dir(data_dir, station):
+    return os.path.join(data_dir, f"{STATION_PREFIX}{quote(str(station), safe='')}")
+
+def partition_path(data_dir, station, year, month):
+    """관측소/연도/월 CSV 경로"""
+    return os.path.join(station_dir(data_dir, station), f"{YEAR_PREFIX}{year}", f"{year}_{month:02d}.csv")
+
+def station_from_path(file_path):
+    """경로의 station=<관측소> 부분에서 관측소 이름 (없으면 None)"""
+    for part in os.path.normpath(file_path).split(os.sep):
+        if part.startswith(STATION_PREFIX):
+            return unquote(part[len(STATION_PREFIX):])
+    return None
+
+def _month_matches(filename, years, months):
+    if years is None and months is None:
+        return True
+    year, month = parse_month_file(filename)
+    if year is None:
+        return False
+    return (years is None or str(year) in years) and (months is None or str(month) in months)
+
+def iter_partitions(data_dir, stations=None, years=None, months=None):
+    """조건에 맞는 CSV의 data_dir 기준 상대 경로 (관측소, 연도, 파일 이름 순)
+
+    stations/years/months는 None(전체), 값 하나 또는 목록. 조건에 맞지 않는
+    station=/year= 디렉토리는 열지 않는다.
+    """
+    stations, years, months = _as_filter(stations), _as_filter(years), _as_filter(months)
+
+    entries = sorted(os.scandir(data_dir), key=lambda entry: entry.name)
+
+    # 1. 기존 구조: data/ 바로 아래 파일은 기본 관측소
+    if stations is None or DEFAULT_STATION in stations:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(".csv") and _month_matches(entry.name, years, months):
+                yield entry.name
+
+    # 2. 분할 구조: station=<관측소>/year=<YYYY>/YYYY_MM.csv
+    for station_entry in entries:
+        if not (station_entry.is_dir() and station_entry.name.startswith(STATION_PREFIX)):
+            continue
+        if stations is not None and unquote(station_entry.name[len(STATION_PREFIX):]) not in stations:
+            continue
+
+        for year_entry in sorted(os.scandir(station_entry.path), key=lambda entry: entry.name):
+            if not (year_entry.is_dir() and year_entry.name.startswith(YEAR_PREFIX)):
+                continue
+            if years is not None and year_entry.name[len(YEAR_PREFIX):] not in years:
+                continue
+
+            for filename in sorted(os.listdir(year_entry.path)):
+                if filename.endswith(".csv") and _month_matches(filename, None, months):
+                    yield os.path.join(station_entry.name, year_entry.name, filename)
+
+def is_partitioned(data_dir):
+    """station= 디렉토리가 하나라도 있으면 True"""
+    return any(entry.is_dir() and entry.name.startswith(STATION_PREFIX) for entry in os.scandir(data_dir))
+
+def list_stations(data_dir):
+    """data_dir에 있는 관측소 목록 (기존 구조 파일이 있으면 DEFAULT_STATION 포함)"""
+    stations = set()
+    for entry in os.scandir(data_dir):
+        if entry.is_dir() and entry.name.startswith(STATION_PREFIX):
+            stations.add(unquote(entry.name[len(STATION_PREFIX):]))
+        elif entry.is_file() and entry.name.endswith(".csv"):
+            stations.add(DEFAULT_STATION)
+    return sorted(stations)
+
+def migrate_flat_layout(data_dir, station=DEFAULT_STATION):
+    """data/ 바로 아래 YYYY_MM.csv를 station=/year= 구조로 옮김, 옮긴 (원래 경로, 새 경로) 목록 반환"""
+    moved = []
+    for filename in sorted(os.listdir(data_dir)):
+        source = os.path.join(data_dir, filename)
+        year, month = parse_month_file(filename) if filename.endswith(".csv") else (None, None)
+        if year is None or not os.path.isfile(source):
+            continue
+
+        target = partition_path(data_dir, station, year, month)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(source, target)
+        moved.append((source, target))
+    return moved
@@ -0,0 +1,157 @@
+"""
+시간별 예보/격자점 시계열을 위한 고정 간격 float32 버퍼 모듈
+
+시각별 dict 목록이나 지점마다의 DataFrame 대신 (시작 시각, 간격, float32 배열)만 보관하고,
+일별 최고/최저 기온은 현지 날짜 경계에서 reduceat 한 번으로 계산한다.
+"""
+import re
+import numpy as np
+import pandas as pd
+
+# ISO 8601 기간 표기 (예: PT1H, PT3H, P1D, P1DT6H)
+_ISO_DURATION = re.compile(
+    r"^P(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+
+def parse_iso_duration(duration):
+    """ISO 8601 기간 문자열을 pd.Timedelta로 변환"""
+    match = _ISO_DURATION.match(duration)
+    if not match:
+        raise ValueError(f"지원하지 않는 기간 형식: {duration}")
+    parts = {key: int(value) for key, value in match.groupdict().items() if value}
+    return pd.Timedelta(**parts)
+
+def _to_celsius(values, unit):
+    """단위 표기(F, degF, wmoUnit:degF 등)에 따라 섭씨로 변환"""
+    if unit and unit.split(":")[-1] in ("F", "degF"):
+        return (values - 32) * 5 / 9
+    return values
+
+class HourlySeries:
+    """고정 간격 float32 시계열 (start: UTC 시작 시각, freq: 간격, values: 값 배열)
+    
+    비어 있는 시각은 NaN으로 채운다. 기온 계열은 섭씨로 저장한다.
+    """
+    
+    __slots__ = ("start", "freq", "values", "name", "tz")
+    
+    def __init__(self, start, values, freq="1h", name=None, tz=None):
+        start = pd.Timestamp(start)
+        self.start = start.tz_localize("UTC") if start.tzinfo is None else start.tz_convert("UTC")
+        self.freq = pd.Timedelta(freq)
+        self.values = np.asarray(values, dtype=np.float32)
+        self.name = name
+        self.tz = tz
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def __repr__(self):
+        return f"HourlySeries(name={self.name!r}, start={self.start}, freq={self.freq}, length={len(self)})"
+    
+    @property
+    def end(self):
+        """마지막 값의 시각"""
+        return self.start + self.freq * (len(self) - 1)
+    
+    @property
+    def nbytes(self):
+        """값 버퍼 메모리 사용량(bytes)"""
+        return self.values.nbytes
+    
+    @property
+    def times(self):
+        """각 값의 시각 (필요할 때만 생성)"""
+        return pd.date_range(self.start, periods=len(self), freq=self.freq)
+    
+    def to_series(self):
+        """pandas Series로 변환 (분석/시각화용)"""
+        return pd.Series(self.values, index=self.times, name=self.name)
+    
+    @classmethod
+    def from_periods(cls, periods, field="temperature", freq="1h", tz=None):
+        """forecastHourly 응답의 period 목록으로 생성 (기온은 섭씨로 변환)"""
+        rows = [(p["startTime"], p.get(field), p.get(f"{field}Unit")) for p in periods]
+        if not rows:
+            return cls(pd.Timestamp(0, tz="UTC"), [], freq=freq, name=field, tz=tz)
+        
+        start_times, values, units = zip(*rows)
+        times = pd.to_datetime(list(start_times), utc=True)
+        values = np.array(values, dtype=float)
+        is_fahrenheit = np.array([unit in ("F", "degF") for unit in units])
+        values = np.where(is_fahrenheit, (values - 32) * 5 / 9, values)
+        
+        return cls._from_points(times, values, pd.Timedelta(freq), name=field, tz=tz)
+    
+    @classmethod
+    def from_grid_values(cls, values, unit=None, freq="1h", name=None, tz=None):
+        """forecastGridData 응답의 {"validTime": "시작/기간", "value": 값} 목록으로 생성
+        
+        한 값이 여러 시간(예: PT3H)에 걸치면 그 구간의 모든 칸에 같은 값을 채운다.
+        """
+        freq = pd.Timedelta(freq)
+        if not values:
+            return cls(pd.Timestamp(0, tz="UTC"), [], freq=freq, name=name, tz=tz)
+        
+        valid_times = [item["validTime"].split("/") for item in values]
+        starts = pd.to_datetime([valid_time[0] for valid_time in valid_times], utc=True)
+        
+        # 같은 기간 표기가 반복되므로 한 번씩만 해석
+        duration_slots = {}
+        for _, duration in valid_times:
+            if duration not in duration_slots:
+                duration_slots[duration] = max(int(parse_iso_duration(duration) / freq), 1)
+        slots = np.array([duration_slots[duration] for _, duration in valid_times])
+        
+        data = _to_celsius(np.array([item.get("value") for item in values], dtype=float), unit)
+        
+        series_start = starts.min()
+        offsets = ((starts - series_start) // freq).to_numpy()
+        length = int((offsets + slots).max())
+        
+        # 각 값을 자신의 구간 칸 수만큼 펼쳐서 한 번에 채움
+        positions = np.repeat(offsets, slots) + (
+            np.arange(slots.sum()) - np.repeat(np.cumsum(slots) - slots, slots)
+        )
+        buffer = np.full(length, np.nan, dtype=np.float32)
+        buffer[positions] = np.repeat(data, slots)
+        
+        return cls(series_start, buffer, freq=freq, name=name, tz=tz)
+    
+    @classmethod
+    def _from_points(cls, times, values, freq, name=None, tz=None):
+        """(시각, 값) 목록을 고정 간격 버퍼에 배치"""
+        start = times.min()
+        offsets = ((times - start) // freq).to_numpy()
+        buffer = np.full(int(offsets.max()) + 1, np.nan, dtype=np.float32)
+        buffer[offsets] = values
+        return cls(start, buffer, freq=freq, name=name, tz=tz)
+    
+    def resample_daily(self, tz=None, min_count=1):
+        """현지 날짜별 최고/최저값 계산 (compare_with_historical에 넣을 수 있는 모양)
+        
+        tz를 지정하지 않으면 생성 시 받은 tz(없으면 UTC) 기준 날짜를 사용한다.
+        Date, High (°C), Low (°C), High (°F), Low (°F) 컬럼을 반환한다.
+        """
+        columns = ['Date', 'High (°C)', 'Low (°C)', 'High (°F)', 'Low (°F)']
+        if len(self) == 0:
+            return pd.DataFrame(columns=columns)
+        
+        tz = tz or self.tz or "UTC"
+        # 현지 벽시계 날짜로 각 칸의 날짜를 구하고, 날짜가 바뀌는 칸마다 구간을 나눔
+        # (서머타임 전환일은 23/25시간이므로 하루 칸 수를 고정하지 않음)
+        local_dates = self.times.tz_convert(tz).tz_localize(None).normalize()
+        day_starts = np.flatnonzero(np.r_[True, local_dates[1:] != local_dates[:-1]])
+        
+        highs = np.fmax.reduceat(self.values, day_starts).astype(float)
+        lows = np.fmin.reduceat(self.values, day_starts).astype(float)
+        keep = np.add.reduceat(~np.isnan(self.values), day_starts, dtype=np.int64) >= min_count
+        
+        dates = local_dates[day_starts]
+        return pd.DataFrame({
+            'Date': dates[keep],
+            'High (°C)': highs[keep],
+            'Low (°C)': lows[keep],
+            'High (°F)': highs[keep] * 9 / 5 + 32,
+            'Low (°F)': lows[keep] * 9 / 5 + 32
+        })
@@ -0,0 +1,169 @@
+"""
+괌 날씨 연도별 추세(트렌드) 계산 모듈
+
+scikit-learn 없이 NumPy 배열 연산으로 여러 계열의 추세를 한 번에 계산한다.
+- 최소제곱(OLS) 기울기/절편/R²: 닫힌 식 (NaN은 계열별로 제외)
+- Theil–Sen 기울기: 모든 두 점 기울기의 중앙값 (극단값에 덜 민감)
+- Mann–Kendall 검정: 순위 기반 단조 추세 통계량 S, Z, 양측 p-value
+측정값 × (연간 + 1~12월) 계열을 한 행렬로 쌓아 한 번에 계산하고, 결과는 데이터 버전별로 캐시한다.
+"""
+import math
+import warnings
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+try:
+    from .aggregates import frame_cache_key, get_aggregate_cube, cube_summary
+except ImportError:
+    from aggregates import frame_cache_key, get_aggregate_cube, cube_summary
+
+# Mann–Kendall p-value가 이보다 작으면 유의한 추세
+TREND_SIGNIFICANCE = 0.05
+
+# 데이터 버전별 추세표 캐시 (최근 사용 순)
+_TREND_CACHE = OrderedDict()
+_TREND_CACHE_SIZE = 8
+
+def _as_matrix(y):
+    y = np.asarray(y, dtype=float)
+    return y.reshape(len(y), -1)
+
+def ols_trend(x, y):
+    """계열(열)별 최소제곱 (기울기, 절편, R²) 배열, 값이 2개 미만이면 NaN
+    
+    x: (n,) 배열, y: (n,) 또는 (n, k) 배열 (NaN은 해당 계열에서만 제외)
+    """
+    x = np.asarray(x, dtype=float)
+    y = _as_matrix(y)
+    valid = ~np.isnan(y)
+    xs = np.where(valid, x[:, None], 0.0)
+    ys = np.where(valid, y, 0.0)
+    
+    count = valid.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = xs.sum(axis=0) / count
+        y_mean = ys.sum(axis=0) / count
+        dx = np.where(valid, x[:, None] - x_mean, 0.0)
+        dy = np.where(valid, y - y_mean, 0.0)
+        sxx = (dx * dx).sum(axis=0)
+        sxy = (dx * dy).sum(axis=0)
+        syy = (dy * dy).sum(axis=0)
+        
+        slope = np.where((count >= 2) & (sxx > 0), sxy / sxx, np.nan)
+        intercept = y_mean - slope * x_mean
+        r2 = np.where(syy > 0, sxy * sxy / (sxx * syy), np.nan)
+    return slope, intercept, r2
+
+def _pairs(n):
+    """i < j 인 모든 (i, j) 위치 쌍"""
+    return np.triu_indices(n, k=1)
+
+def theil_sen_slope(x, y):
+    """계열(열)별 Theil–Sen 기울기 (모든 두 점 기울기의 중앙값)"""
+    x = np.asarray(x, dtype=float)
+    y = _as_matrix(y)
+    i, j = _pairs(len(x))
+    dx = (x[j] - x[i])[:, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slopes = np.where(dx != 0, (y[j] - y[i]) / dx, np.nan)
+    if len(slopes) == 0:
+        return np.full(y.shape[1], np.nan)
+    # 두 점 기울기가 모두 NaN인 계열은 경고 없이 NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmedian(slopes, axis=0)
+
+def mann_kendall(x, y):
+    """계열(열)별 Mann–Kendall (S, Z, 양측 p-value) 배열 (x 순서로 정렬해서 계산)
+    
+    분산은 같은 값(동점) 묶음을 보정한 식을 쓰고, NaN이 있는 쌍은 제외한다.
+    """
+    x = np.asarray(x, dtype=float)
+    y = _as_matrix(y)
+    order = np.argsort(x, kind="stable")
+    y = y[order]
+    
+    i, j = _pairs(len(x))
+    signs = np.sign(y[j] - y[i])
+    s = np.nansum(signs, axis=0)
+    
+    variances = np.empty(y.shape[1])
+    for column in range(y.shape[1]):
+        values = y[:, column]
+        values = values[~np.isnan(values)]
+        n = len(values)
+        _, ties = np.unique(values, return_counts=True)
+        variances[column] = (n * (n - 1) * (2 * n + 5) - (ties * (ties - 1) * (2 * ties + 5)).sum()) / 18
+    
+    # 연속성 보정한 Z
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = np.where(variances > 0, (s - np.sign(s)) / np.sqrt(variances), np.nan)
+    p_value = np.array([math.erfc(abs(value) / math.sqrt(2)) if not np.isnan(value) else np.nan for value in z])
+    return s, z, p_value
+
+def trend_statistics(x, y, names=None):
+    """여러 계열의 OLS/Theil–Sen/Mann–Kendall 결과를 한 번에 계산한 표 (계열당 한 행)"""
+    y = _as_matrix(y)
+    slope, intercept, r2 = ols_trend(x, y)
+    s, z, p_value = mann_kendall(x, y)
+    table = pd.DataFrame({
+        "n": (~np.isnan(y)).sum(axis=0),
+        "slope": slope,
+        "intercept": intercept,
+        "r2": r2,
+        "theil_sen": theil_sen_slope(x, y),
+        "mk_s": s,
+        "mk_z": z,
+        "p_value": p_value
+    })
+    table["significant"] = table["p_value"] < TREND_SIGNIFICANCE
+    if names is not None:
+        table.index = names
+    return table
+
+def build_trend_table(cube, aggregations):
+    """측정값별 연간 계열과 1~12월 계열의 연도별 추세표
+    
+    aggregations: {컬럼: 통계} (예: 기온은 "mean", 강수량은 "sum")
+    Measure, Month(0 = 연간), n, slope, intercept, r2, theil_sen, mk_s, mk_z, p_value, significant 컬럼.
+    """
+    # 1. 연간/월별 집계 (큐브에서 계산)
+    yearly = cube_summary(cube, aggregations, by=["Year"]).set_index("Year")
+    monthly = cube_summary(cube, aggregations, by=["Year", "Month"]).set_index(["Year", "Month"])
+    years = yearly.index.to_numpy()
+    
+    # 2. (연도 × 계열) 행렬로 쌓기: 측정값마다 연간 1열 + 월별 12열
+    columns = []
+    names = []
+    for measure in aggregations:
+        columns.append(yearly[measure].to_numpy(dtype=float))
+        names.append((measure, 0))
+        by_month = monthly[measure].unstack("Month").reindex(index=years, columns=range(1, 13))
+        columns.extend(by_month.to_numpy(dtype=float).T)
+        names.extend((measure, month) for month in range(1, 13))
+    
+    # 3. 모든 계열을 한 번에 계산
+    table = trend_statistics(years, np.column_stack(columns), pd.MultiIndex.from_tuples(names, names=["Measure", "Month"]))
+    return table.reset_index()
+
+def get_trend_table(df, aggregations):
+    """데이터 버전별로 캐시된 추세표 (get_aggregate_cube와 같은 키 규칙)"""
+    frame_key = frame_cache_key(df)
+    key = (frame_key, tuple(aggregations.items()))
+    if frame_key is not None and key in _TREND_CACHE:
+        _TREND_CACHE.move_to_end(key)
+        return _TREND_CACHE[key]
+    
+    table = build_trend_table(get_aggregate_cube(df), aggregations)
+    if frame_key is not None:
+        _TREND_CACHE[key] = table
+        if len(_TREND_CACHE) > _TREND_CACHE_SIZE:
+            _TREND_CACHE.popitem(last=False)
+    
+    return table
+
+def trend_for(table, measure, month=0):
+    """추세표에서 측정값/월(0 = 연간) 한 행"""
+    rows = table[(table["Measure"] == measure) & (table["Month"] == month)]
+    return rows.iloc[0]
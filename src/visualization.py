@@ -1,152 +1,181 @@
 """
 괌 날씨 데이터 시각화 모듈
+
+matplotlib은 그래프를 그리는 함수에서만 import하고 폰트 설정도 그때 적용하므로
+집계 함수(*_data)만 쓰는 경우에는 matplotlib을 불러오지 않는다.
 """
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import pandas as pd
 
-# 한글 폰트 설정 (macOS용)
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
+try:
+    from .aggregates import get_aggregate_cube, cube_summary, cube_pivot, station_keys
+    from .stations import STATION_COLUMN
+    from .instrumentation import instrument, span
+except ImportError:
+    from aggregates import get_aggregate_cube, cube_summary, cube_pivot, station_keys
+    from stations import STATION_COLUMN
+    from instrumentation import instrument, span
 
-def plot_monthly_temperature_by_year(df, save_path=None):
-    """연도별 월평균 기온 그래프"""
-    monthly_avg_by_year = df.groupby(['Year', 'Month'])['Average'].mean().unstack(level=0)
-    
-    plt.figure(figsize=(12, 6))
-    
-    for year in monthly_avg_by_year.columns:
-        plt.plot(monthly_avg_by_year.index, monthly_avg_by_year[year], 
-                label=str(year), marker='o')
-    
-    plt.title('연도별 월평균 기온', fontsize=16)
-    plt.xlabel('월', fontsize=12)
-    plt.ylabel('기온 (°C)', fontsize=12)
-    plt.xticks(range(1, 13))
-    plt.legend(title='연도')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    
-    plt.show()
+# 한글 폰트 설정 (macOS용), import 시점이 아니라 그래프를 그릴 때 적용
+FONT_STYLE = {
+    'font.family': 'AppleGothic',
+    'axes.unicode_minus': False
+}
 
-def plot_monthly_precipitation_by_year(df, save_path=None):
-    """연도별 월평균 강수량 그래프"""
-    monthly_precip_by_year = df.groupby(['Year', 'Month'])['Precipitation'].mean().unstack(level=0)
-    
-    plt.figure(figsize=(12, 6))
-    
-    for year in monthly_precip_by_year.columns:
-        plt.plot(monthly_precip_by_year.index, monthly_precip_by_year[year], 
-                label=str(year), marker='o')
-    
-    plt.title('연도별 월평균 강수량', fontsize=16)
-    plt.xlabel('월', fontsize=12)
-    plt.ylabel('평균 강수량 (mm)', fontsize=12)
-    plt.xticks(range(1, 13))
-    plt.legend(title='연도')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    
-    plt.show()
+def configure_fonts():
+    """matplotlib 전역 설정에 FONT_STYLE 적용 (pyplot 그래프용)"""
+    import matplotlib
+    matplotlib.rcParams.update(FONT_STYLE)
 
-def plot_yearly_summary(df, save_path=None):
-    """연간 평균 기온과 총 강수량 그래프"""
-    yearly_summary = df.groupby("Year").agg({
+def _new_figure(figsize):
+    """화면 표시용 pyplot Figure (pyplot은 처음 그래프를 그릴 때 import)"""
+    import matplotlib.pyplot as plt
+    configure_fonts()
+    return plt.figure(figsize=figsize)
+
+def _draw_lines_by_year(ax, pivot):
+    """월 × 연도(관측소 큐브면 (관측소, 연도)) 표의 열별 선 그래프"""
+    for year in pivot.columns:
+        label = " ".join(map(str, year)) if isinstance(year, tuple) else str(year)
+        ax.plot(pivot.index, pivot[year], label=label, marker='o')
+
+def _station_pivot(yearly_summary, column):
+    """관측소별 연간 요약을 연도(행) × 관측소(열) 표로 변환"""
+    return yearly_summary.pivot(index="Year", columns=STATION_COLUMN, values=column)
+
+def _draw_yearly_temperature(ax, yearly_summary, **label_options):
+    """연간 평균 기온 선 그래프 (Station 컬럼이 있으면 관측소별 선)"""
+    if STATION_COLUMN in yearly_summary.columns:
+        pivot = _station_pivot(yearly_summary, "Average")
+        lines = ax.plot(pivot.index, pivot.to_numpy(), marker='o', linewidth=2, markersize=8)
+        ax.legend(lines, pivot.columns)
+    else:
+        ax.plot(yearly_summary["Year"], yearly_summary["Average"], 
+                marker='o', linewidth=2, markersize=8, color='red')
+    ax.set_title("연간 평균 기온", **label_options.get("title", {}))
+    ax.set_xlabel("연도", **label_options.get("label", {}))
+    ax.set_ylabel("기온 (°C)", **label_options.get("label", {}))
+    ax.grid(True, alpha=0.3)
+
+def _draw_yearly_precipitation(ax, yearly_summary, **label_options):
+    """연간 총 강수량 막대 그래프 (Station 컬럼이 있으면 관측소별 묶음 막대)"""
+    if STATION_COLUMN in yearly_summary.columns:
+        pivot = _station_pivot(yearly_summary, "Precipitation")
+        width = 0.8 / len(pivot.columns)
+        offsets = (np.arange(len(pivot.columns)) - (len(pivot.columns) - 1) / 2) * width
+        x = pivot.index.to_numpy()[:, None] + offsets
+        for position, station in enumerate(pivot.columns):
+            ax.bar(x[:, position], pivot[station], width=width, alpha=0.7, label=station)
+        ax.set_xticks(pivot.index)
+        ax.legend()
+    else:
+        ax.bar(yearly_summary["Year"], yearly_summary["Precipitation"], 
+               color='skyblue', alpha=0.7)
+    ax.set_title("연간 총 강수량", **label_options.get("title", {}))
+    ax.set_xlabel("연도", **label_options.get("label", {}))
+    ax.set_ylabel("강수량 (mm)", **label_options.get("label", {}))
+    ax.grid(True, alpha=0.3)
+
+def monthly_temperature_data(cube):
+    """연도별 월평균 기온 그래프 입력 (월 × 연도)"""
+    return cube_pivot(cube, 'Average', 'mean')
+
+def monthly_precipitation_data(cube):
+    """연도별 월평균 강수량 그래프 입력 (월 × 연도)"""
+    return cube_pivot(cube, 'Precipitation', 'mean')
+
+def yearly_summary_data(cube):
+    """연간 요약 그래프 입력 (연도별 평균 기온, 총 강수량, 관측소 큐브면 관측소별)"""
+    return cube_summary(cube, {
         "Average": "mean",
         "Precipitation": "sum"
-    }).reset_index()
-    
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 5))
-    
-    # 연간 평균 기온
-    ax1.plot(yearly_summary["Year"], yearly_summary["Average"], 
-             marker='o', linewidth=2, markersize=8, color='red')
-    ax1.set_title("연간 평균 기온", fontsize=14)
-    ax1.set_xlabel("연도", fontsize=12)
-    ax1.set_ylabel("기온 (°C)", fontsize=12)
-    ax1.grid(True, alpha=0.3)
-    
-    # 연간 총 강수량
-    ax2.bar(yearly_summary["Year"], yearly_summary["Precipitation"], 
-            color='skyblue', alpha=0.7)
-    ax2.set_title("연간 총 강수량", fontsize=14)
-    ax2.set_xlabel("연도", fontsize=12)
-    ax2.set_ylabel("강수량 (mm)", fontsize=12)
-    ax2.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    
-    plt.show()
+    }, by=station_keys(cube) + ["Year"])
 
-def plot_temperature_departure(df, save_path=None):
-    """월별 기온 편차 그래프"""
-    pivot_departure = df.groupby(["Year", "Month"])["Departure"].mean().unstack(level=0)
-    
-    plt.figure(figsize=(14, 6))
-    
-    for year in pivot_departure.columns:
-        plt.plot(pivot_departure.index, pivot_departure[year], 
-                label=str(year), marker='o')
-    
-    plt.title("연도별 월별 기온 편차", fontsize=16)
-    plt.xlabel("월", fontsize=12)
-    plt.ylabel("평년 대비 편차 (°C)", fontsize=12)
-    plt.xticks(ticks=range(1, 13))
-    plt.axhline(0, color='gray', linestyle='--', alpha=0.7)
-    plt.grid(True, alpha=0.3)
-    plt.legend(title="연도", bbox_to_anchor=(1.05, 1), loc='upper left')
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    
-    plt.show()
+def temperature_departure_data(cube):
+    """기온 편차 그래프 입력 (월 × 연도)"""
+    return cube_pivot(cube, "Departure", "mean")
 
-def plot_forecast_comparison(forecast_df, save_path=None):
-    """7일 예보 데이터 시각화"""
-    plt.figure(figsize=(12, 6))
-    
-    plt.plot(forecast_df['Date'], forecast_df['High (°C)'], 
-             label='최고 기온 (°C)', marker='o', color='red', linewidth=2)
-    plt.plot(forecast_df['Date'], forecast_df['Low (°C)'], 
-             label='최저 기온 (°C)', marker='o', color='blue', linewidth=2)
-    
-    plt.fill_between(forecast_df['Date'], 
-                     forecast_df['High (°C)'], 
-                     forecast_df['Low (°C)'], 
-                     alpha=0.2, color='gray')
-    
-    plt.xlabel('날짜', fontsize=12)
-    plt.ylabel('기온 (°C)', fontsize=12)
-    plt.title('괌 7일 기온 예보', fontsize=16)
-    plt.xticks(rotation=45)
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    
-    plt.show()
+def dashboard_data(cube):
+    """종합 대시보드 입력 (월평균 기온, 월평균 강수량, 연간 요약)"""
+    return monthly_temperature_data(cube), monthly_precipitation_data(cube), yearly_summary_data(cube)
 
-def create_comprehensive_dashboard(df, save_path=None):
-    """종합 대시보드 생성"""
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+# 아래 draw_* 함수는 pyplot 전역 상태 없이 주어진 Figure에만 그린다 (배치 렌더링/Agg 백엔드용)
+
+def draw_monthly_temperature_by_year(fig, monthly_avg_by_year):
+    """연도별 월평균 기온 그래프를 fig에 그림"""
+    ax = fig.subplots()
+    _draw_lines_by_year(ax, monthly_avg_by_year)
+    
+    ax.set_title('연도별 월평균 기온', fontsize=16)
+    ax.set_xlabel('월', fontsize=12)
+    ax.set_ylabel('기온 (°C)', fontsize=12)
+    ax.set_xticks(range(1, 13))
+    ax.legend(title='연도')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+
+def draw_monthly_precipitation_by_year(fig, monthly_precip_by_year):
+    """연도별 월평균 강수량 그래프를 fig에 그림"""
+    ax = fig.subplots()
+    _draw_lines_by_year(ax, monthly_precip_by_year)
+    
+    ax.set_title('연도별 월평균 강수량', fontsize=16)
+    ax.set_xlabel('월', fontsize=12)
+    ax.set_ylabel('평균 강수량 (mm)', fontsize=12)
+    ax.set_xticks(range(1, 13))
+    ax.legend(title='연도')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+
+def draw_yearly_summary(fig, yearly_summary):
+    """연간 평균 기온과 총 강수량 그래프를 fig에 그림"""
+    ax1, ax2 = fig.subplots(1, 2)
+    label_options = {"title": {"fontsize": 14}, "label": {"fontsize": 12}}
+    _draw_yearly_temperature(ax1, yearly_summary, **label_options)
+    _draw_yearly_precipitation(ax2, yearly_summary, **label_options)
+    fig.tight_layout()
+
+def draw_temperature_departure(fig, pivot_departure):
+    """월별 기온 편차 그래프를 fig에 그림"""
+    ax = fig.subplots()
+    _draw_lines_by_year(ax, pivot_departure)
+    
+    ax.set_title("연도별 월별 기온 편차", fontsize=16)
+    ax.set_xlabel("월", fontsize=12)
+    ax.set_ylabel("평년 대비 편차 (°C)", fontsize=12)
+    ax.set_xticks(range(1, 13))
+    ax.axhline(0, color='gray', linestyle='--', alpha=0.7)
+    ax.grid(True, alpha=0.3)
+    ax.legend(title="연도", bbox_to_anchor=(1.05, 1), loc='upper left')
+    fig.tight_layout()
+
+def draw_forecast_comparison(fig, forecast_df):
+    """7일 예보 그래프를 fig에 그림"""
+    ax = fig.subplots()
+    ax.plot(forecast_df['Date'], forecast_df['High (°C)'], 
+            label='최고 기온 (°C)', marker='o', color='red', linewidth=2)
+    ax.plot(forecast_df['Date'], forecast_df['Low (°C)'], 
+            label='최저 기온 (°C)', marker='o', color='blue', linewidth=2)
+    
+    ax.fill_between(forecast_df['Date'], 
+                    forecast_df['High (°C)'], 
+                    forecast_df['Low (°C)'], 
+                    alpha=0.2, color='gray')
+    
+    ax.set_xlabel('날짜', fontsize=12)
+    ax.set_ylabel('기온 (°C)', fontsize=12)
+    ax.set_title('괌 7일 기온 예보', fontsize=16)
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+
+def draw_comprehensive_dashboard(fig, monthly_avg_by_year, monthly_precip_by_year, yearly_summary):
+    """종합 대시보드를 fig에 그림"""
+    axes = fig.subplots(2, 2)
     
     # 1. 연도별 월평균 기온
-    monthly_avg_by_year = df.groupby(['Year', 'Month'])['Average'].mean().unstack(level=0)
-    for year in monthly_avg_by_year.columns:
-        axes[0,0].plot(monthly_avg_by_year.index, monthly_avg_by_year[year], 
-                      label=str(year), marker='o')
+    _draw_lines_by_year(axes[0,0], monthly_avg_by_year)
     axes[0,0].set_title('연도별 월평균 기온')
     axes[0,0].set_xlabel('월')
     axes[0,0].set_ylabel('기온 (°C)')
@@ -154,10 +183,7 @@ def create_comprehensive_dashboard(df, save_path=None):
     axes[0,0].grid(True, alpha=0.3)
     
     # 2. 연도별 월평균 강수량
-    monthly_precip_by_year = df.groupby(['Year', 'Month'])['Precipitation'].mean().unstack(level=0)
-    for year in monthly_precip_by_year.columns:
-        axes[0,1].plot(monthly_precip_by_year.index, monthly_precip_by_year[year], 
-                      label=str(year), marker='o')
+    _draw_lines_by_year(axes[0,1], monthly_precip_by_year)
     axes[0,1].set_title('연도별 월평균 강수량')
     axes[0,1].set_xlabel('월')
     axes[0,1].set_ylabel('강수량 (mm)')
@@ -165,29 +191,60 @@ def create_comprehensive_dashboard(df, save_path=None):
     axes[0,1].grid(True, alpha=0.3)
     
     # 3. 연간 평균 기온
-    yearly_summary = df.groupby("Year").agg({
-        "Average": "mean",
-        "Precipitation": "sum"
-    }).reset_index()
-    
-    axes[1,0].plot(yearly_summary["Year"], yearly_summary["Average"], 
-                   marker='o', linewidth=2, markersize=8, color='red')
-    axes[1,0].set_title('연간 평균 기온')
-    axes[1,0].set_xlabel('연도')
-    axes[1,0].set_ylabel('기온 (°C)')
-    axes[1,0].grid(True, alpha=0.3)
+    _draw_yearly_temperature(axes[1,0], yearly_summary)
     
     # 4. 연간 총 강수량
-    axes[1,1].bar(yearly_summary["Year"], yearly_summary["Precipitation"], 
-                  color='skyblue', alpha=0.7)
-    axes[1,1].set_title('연간 총 강수량')
-    axes[1,1].set_xlabel('연도')
-    axes[1,1].set_ylabel('강수량 (mm)')
-    axes[1,1].grid(True, alpha=0.3)
-    
-    plt.tight_layout()
+    _draw_yearly_precipitation(axes[1,1], yearly_summary)
     
+    fig.tight_layout()
+
+def _show_figure(fig, save_path=None):
+    """그래프 저장(선택) 후 화면 표시"""
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        with span("visualization.savefig"):
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
     
-    plt.show() 
\ No newline at end of file
+    import matplotlib.pyplot as plt
+    plt.show()
+
+@instrument(rows="input")
+def plot_monthly_temperature_by_year(df, save_path=None):
+    """연도별 월평균 기온 그래프"""
+    fig = _new_figure((12, 6))
+    draw_monthly_temperature_by_year(fig, monthly_temperature_data(get_aggregate_cube(df)))
+    _show_figure(fig, save_path)
+
+@instrument(rows="input")
+def plot_monthly_precipitation_by_year(df, save_path=None):
+    """연도별 월평균 강수량 그래프"""
+    fig = _new_figure((12, 6))
+    draw_monthly_precipitation_by_year(fig, monthly_precipitation_data(get_aggregate_cube(df)))
+    _show_figure(fig, save_path)
+
+@instrument(rows="input")
+def plot_yearly_summary(df, save_path=None):
+    """연간 평균 기온과 총 강수량 그래프"""
+    fig = _new_figure((15, 5))
+    draw_yearly_summary(fig, yearly_summary_data(get_aggregate_cube(df)))
+    _show_figure(fig, save_path)
+
+@instrument(rows="input")
+def plot_temperature_departure(df, save_path=None):
+    """월별 기온 편차 그래프"""
+    fig = _new_figure((14, 6))
+    draw_temperature_departure(fig, temperature_departure_data(get_aggregate_cube(df)))
+    _show_figure(fig, save_path)
+
+@instrument(rows="input")
+def plot_forecast_comparison(forecast_df, save_path=None):
+    """7일 예보 데이터 시각화"""
+    fig = _new_figure((12, 6))
+    draw_forecast_comparison(fig, forecast_df)
+    _show_figure(fig, save_path)
+
+@instrument(rows="input")
+def create_comprehensive_dashboard(df, save_path=None):
+    """종합 대시보드 생성"""
+    fig = _new_figure((16, 12))
+    draw_comprehensive_dashboard(fig, *dashboard_data(get_aggregate_cube(df)))
+    _show_figure(fig, save_path)
\ No newline at end of file
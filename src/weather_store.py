@@ -0,0 +1,95 @@
+"""
+괌 날씨 일별 데이터 날짜 인덱스 저장소 모듈
+
+일별 데이터를 Date 순으로 정렬해 두고 (Year, Month)별 시작/끝 위치를 미리 계산해서
+대시보드 필터(연도, 월, 기간)를 전체 행 스캔이나 복사 없이 구간 슬라이스로 처리한다.
+"""
+import numpy as np
+import pandas as pd
+
+class DailyWeatherStore:
+    """Date 기준으로 정렬된 일별 데이터와 (Year, Month) 구간 오프셋"""
+    
+    def __init__(self, df):
+        # Date 순으로 정렬 (이미 정렬되어 있으면 그대로 사용)
+        if not df["Date"].is_monotonic_increasing:
+            df = df.sort_values("Date", kind="mergesort")
+        self.df = df.reset_index(drop=True)
+        self.df.attrs = dict(df.attrs)
+        
+        self._dates = self.df["Date"].to_numpy()
+        
+        # 1970-01 기준 월 번호가 바뀌는 위치 = 각 (Year, Month) 구간의 시작
+        month_numbers = self._dates.astype("datetime64[M]").astype("int64")
+        starts = np.flatnonzero(np.diff(month_numbers)) + 1
+        if len(self.df):
+            self._month_starts = np.concatenate([[0], starts]).astype("int64")
+            self._month_ends = np.concatenate([starts, [len(self.df)]]).astype("int64")
+        else:
+            self._month_starts = np.empty(0, dtype="int64")
+            self._month_ends = np.empty(0, dtype="int64")
+        
+        month_keys = month_numbers[self._month_starts]
+        self._years = (month_keys // 12 + 1970).astype("int64")
+        self._months = (month_keys % 12 + 1).astype("int64")
+        self._offsets = {
+            (int(year), int(month)): (int(start), int(end))
+            for year, month, start, end in zip(self._years, self._months, self._month_starts, self._month_ends)
+        }
+    
+    def __len__(self):
+        return len(self.df)
+    
+    @property
+    def years(self):
+        """데이터에 있는 연도 목록"""
+        return sorted(set(self._years.tolist()))
+    
+    @property
+    def month_offsets(self):
+        """(Year, Month) → (시작 위치, 끝 위치) 표"""
+        return pd.DataFrame({
+            "Year": self._years,
+            "Month": self._months,
+            "Start": self._month_starts,
+            "End": self._month_ends
+        })
+    
+    def date_range(self, start=None, end=None):
+        """start <= Date <= end 구간을 이진 탐색으로 찾아 슬라이스로 반환"""
+        lo = 0 if start is None else np.searchsorted(self._dates, np.datetime64(pd.Timestamp(start)), side="left")
+        hi = len(self.df) if end is None else np.searchsorted(self._dates, np.datetime64(pd.Timestamp(end)), side="right")
+        return self.df.iloc[lo:hi]
+    
+    def month(self, year, month):
+        """특정 연월 데이터 (슬라이스)"""
+        start, end = self._offsets.get((int(year), int(month)), (0, 0))
+        return self.df.iloc[start:end]
+    
+    def year(self, year):
+        """특정 연도 데이터 (연속 구간이므로 슬라이스)"""
+        matches = np.flatnonzero(self._years == int(year))
+        if len(matches) == 0:
+            return self.df.iloc[0:0]
+        return self.df.iloc[self._month_starts[matches[0]]:self._month_ends[matches[-1]]]
+    
+    def select(self, year=None, month=None):
+        """대시보드 필터 조건(None이면 전체)에 맞는 데이터 반환
+        
+        전체/연도/연월 조건은 복사 없는 슬라이스를, 월만 지정하면
+        해당 월 구간들의 위치만 모아서 가져온다.
+        """
+        if year is None and month is None:
+            return self.df
+        if month is None:
+            return self.year(year)
+        if year is not None:
+            return self.month(year, month)
+        
+        matches = np.flatnonzero(self._months == int(month))
+        if len(matches) == 0:
+            return self.df.iloc[0:0]
+        positions = np.concatenate([
+            np.arange(self._month_starts[i], self._month_ends[i]) for i in matches
+        ])
+        return self.df.take(positions)
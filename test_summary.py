@@ -6,6 +6,7 @@
 import os
 import pandas as pd
 from datetime import datetime
+from src.accumulators import RunningStats, build_weather_accumulator
 
 print("🏆 괌 날씨 데이터 분석 프로젝트 - 최종 테스트 결과")
 print("="*80)
@@ -37,10 +38,14 @@ print("-" * 50)
 
 try:
     processed_df = pd.read_csv("results/processed_weather_data.csv")
+    # (Year, Month)별 누적 통계를 한 번만 만들고 아래 요약은 모두 여기서 계산
+    weather_stats = build_weather_accumulator(processed_df, ['Average', 'Precipitation'])
+    temp_stats = weather_stats.total('Average')
+    precip_stats = weather_stats.total('Precipitation')
     print(f"✅ 전처리된 데이터: {processed_df.shape[0]:,}행 × {processed_df.shape[1]}열")
     print(f"📅 데이터 기간: {processed_df['Date'].min()} ~ {processed_df['Date'].max()}")
-    print(f"🌡️ 기온 범위: {processed_df['Average'].min():.1f}°C ~ {processed_df['Average'].max():.1f}°C")
-    print(f"🌧️ 강수량 범위: {processed_df['Precipitation'].min():.1f}mm ~ {processed_df['Precipitation'].max():.1f}mm")
+    print(f"🌡️ 기온 범위: {temp_stats.min:.1f}°C ~ {temp_stats.max:.1f}°C")
+    print(f"🌧️ 강수량 범위: {precip_stats.min:.1f}mm ~ {precip_stats.max:.1f}mm")
 except FileNotFoundError:
     print("❌ 전처리된 데이터 파일이 없습니다")
 
@@ -50,8 +55,9 @@ print("-" * 50)
 
 try:
     forecast_df = pd.read_csv("results/forecast_data.csv")
+    forecast_high = RunningStats.from_values(forecast_df['High (°C)'])
     print(f"✅ 예보 데이터: {len(forecast_df)}일 예보")
-    print(f"🌡️ 예보 기온 범위: {forecast_df['High (°C)'].min():.1f}°C ~ {forecast_df['High (°C)'].max():.1f}°C")
+    print(f"🌡️ 예보 기온 범위: {forecast_high.min:.1f}°C ~ {forecast_high.max:.1f}°C")
     print(f"📡 National Weather Service API 연동 성공")
 except FileNotFoundError:
     print("❌ 예보 데이터 파일이 없습니다")
@@ -83,14 +89,16 @@ print("-" * 50)
 
 try:
     # CSV 데이터 인사이트
-    processed_df = pd.read_csv("results/processed_weather_data.csv")
+    if not os.path.exists("results/processed_weather_data.csv"):
+        raise FileNotFoundError("results/processed_weather_data.csv")
     
-    yearly_avg = processed_df.groupby('Year')['Average'].mean()
-    temp_stability = processed_df.groupby('Year')['Average'].std().mean()
-    annual_precip = processed_df.groupby('Year')['Precipitation'].sum()
+    yearly_temp = weather_stats.group_stats('Average', by=['Year'])
+    yearly_avg = yearly_temp['mean']
+    temp_stability = yearly_temp['std'].mean()
+    annual_precip = weather_stats.group_stats('Precipitation', by=['Year'])['sum']
     
     print("🌴 괌 기후 특성 (2020-2022):")
-    print(f"   • 평균 기온: {processed_df['Average'].mean():.1f}°C")
+    print(f"   • 평균 기온: {weather_stats.total('Average').mean:.1f}°C")
     print(f"   • 기온 안정성: 표준편차 {temp_stability:.2f}°C (매우 안정적)")
     print(f"   • 연간 강수량: {annual_precip.mean():.0f}mm")
     
@@ -99,9 +107,9 @@ try:
         forecast_df = pd.read_csv("results/forecast_data.csv")
         current_month = datetime.now().month
         
-        historical_current = processed_df[processed_df['Month'] == current_month]
-        hist_avg = historical_current['Average'].mean()
-        forecast_avg = (forecast_df['High (°C)'].mean() + forecast_df['Low (°C)'].mean()) / 2
+        hist_avg = weather_stats.select(month=current_month).total('Average').mean
+        forecast_avg = (RunningStats.from_values(forecast_df['High (°C)']).mean
+                        + RunningStats.from_values(forecast_df['Low (°C)']).mean) / 2
         
         print(f"\n🔍 실시간 비교 ({current_month}월):")
         print(f"   • 과거 평균: {hist_avg:.1f}°C")
@@ -0,0 +1,16 @@
+"""
+테스트 공통 설정: 저장소 루트를 import 경로에 추가하고 data/ 일별 데이터를 한 번만 로딩
+"""
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.data_processing import load_processed_data
+
+@pytest.fixture(scope="session")
+def weather_df(tmp_path_factory):
+    """data/ 전처리 결과 (df.attrs["data_version"] 포함, 캐시는 임시 디렉토리에 저장)"""
+    return load_processed_data(os.path.join(ROOT_DIR, "data"), cache_dir=str(tmp_path_factory.mktemp("cache")))
@@ -0,0 +1,19 @@
+"""
+누적 통계 캐시 테스트
+"""
+import pytest
+
+from src.accumulators import get_weather_accumulator
+
+def test_filtered_frames_with_same_length_use_separate_accumulators(weather_df):
+    """data_version이 복사된 같은 길이의 부분 DataFrame끼리 누적값을 공유하지 않음"""
+    year_2021 = weather_df[weather_df["Year"] == 2021]
+    year_2022 = weather_df[weather_df["Year"] == 2022]
+    assert len(year_2021) == len(year_2022)
+    
+    first = get_weather_accumulator(year_2021)
+    second = get_weather_accumulator(year_2022)
+    assert first is not second
+    assert sorted({year for year, _ in second.cells}) == [2022]
+    assert second.total("Average").mean == pytest.approx(year_2022["Average"].mean())
+    assert get_weather_accumulator(weather_df) is get_weather_accumulator(weather_df)
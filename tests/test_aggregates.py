@@ -0,0 +1,42 @@
+"""
+집계 큐브 캐시 테스트
+"""
+import pandas as pd
+import pytest
+
+from src.aggregates import build_aggregate_cube, frame_cache_key, get_aggregate_cube
+from src.data_processing import get_yearly_summary, get_monthly_summary
+
+def test_filtered_frames_with_same_length_use_separate_cubes(weather_df):
+    """data_version이 복사된 같은 길이의 부분 DataFrame끼리 캐시를 공유하지 않음"""
+    year_2021 = weather_df[weather_df["Year"] == 2021]
+    year_2022 = weather_df[weather_df["Year"] == 2022]
+    assert len(year_2021) == len(year_2022)
+    assert year_2021.attrs["data_version"] == year_2022.attrs["data_version"]
+    
+    assert get_yearly_summary(year_2021)["Year"].tolist() == [2021]
+    assert get_yearly_summary(year_2022)["Year"].tolist() == [2022]
+    pd.testing.assert_frame_equal(get_aggregate_cube(year_2022), build_aggregate_cube(year_2022))
+
+def test_monthly_summary_of_equal_length_months(weather_df):
+    january = weather_df[weather_df["Month"] == 1]
+    march = weather_df[weather_df["Month"] == 3]
+    assert len(january) == len(march)
+    
+    assert get_monthly_summary(january)["Month"].unique().tolist() == [1]
+    summary = get_monthly_summary(march)
+    assert summary["Month"].unique().tolist() == [3]
+    expected = march.groupby("Year")["Average"].mean().to_numpy()
+    assert summary["Average"].to_numpy() == pytest.approx(expected)
+
+def test_full_frame_cube_is_cached_and_slices_use_explicit_filters(weather_df):
+    """전체 DataFrame 큐브는 한 번만 만들고, year/month 필터는 큐브 셀 선택으로 요약"""
+    assert frame_cache_key(weather_df) is not None
+    assert frame_cache_key(weather_df[weather_df["Year"] == 2021]) is None
+    assert get_aggregate_cube(weather_df) is get_aggregate_cube(weather_df)
+    
+    pd.testing.assert_frame_equal(
+        get_monthly_summary(weather_df, month=3).reset_index(drop=True),
+        get_monthly_summary(weather_df[weather_df["Month"] == 3]).reset_index(drop=True)
+    )
+    assert get_yearly_summary(weather_df, year=2022)["Year"].tolist() == [2022]
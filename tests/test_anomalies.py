@@ -0,0 +1,76 @@
+"""
+이상치 탐지 테스트 (벡터 연산 결과를 행 단위 계산과 비교)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.anomalies import anomaly_table, detect_anomalies, mad_score, rolling_zscore
+
+@pytest.fixture
+def monthly_df():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2000-01-01", periods=240, freq="MS")
+    seasonal = 27 + 2 * np.sin(2 * np.pi * (dates.month - 1) / 12)
+    df = pd.DataFrame({
+        "Date": dates,
+        "Year": dates.year,
+        "Month": dates.month,
+        "AvgTemp_C": seasonal + rng.normal(0, 0.3, len(dates)),
+        "Precipitation_mm": rng.gamma(2, 100, len(dates))
+    })
+    df.loc[100, "AvgTemp_C"] += 3
+    df.loc[150, "Precipitation_mm"] = 2000
+    return df
+
+def test_zscore_matches_row_by_row(monthly_df):
+    values = monthly_df["AvgTemp_C"]
+    mean, std = values.mean(), values.std(ddof=0)
+    expected = [i for i, value in values.items() if abs((value - mean) / std) > 2]
+    
+    table = detect_anomalies(monthly_df, "AvgTemp_C")
+    
+    assert sorted(monthly_df.index[monthly_df["Date"].isin(table["Date"])]) == expected
+    assert (table["Score"].abs().diff().dropna() <= 0).all()
+    assert ((table["Direction"] == "high") == (table["Deviation"] > 0)).all()
+
+def test_seasonal_zscore_removes_the_annual_cycle(monthly_df):
+    table = detect_anomalies(monthly_df, "AvgTemp_C", method="seasonal", top=1)
+    row = monthly_df.loc[100]
+    same_month = monthly_df.loc[monthly_df["Month"] == row["Month"], "AvgTemp_C"]
+    
+    assert table["Date"].tolist() == [row["Date"]]
+    assert table["Baseline"].iloc[0] == pytest.approx(same_month.mean())
+    assert table["Score"].iloc[0] == pytest.approx((row["AvgTemp_C"] - same_month.mean()) / same_month.std(ddof=0))
+
+def test_rolling_zscore_excludes_current_value():
+    values = np.r_[np.tile([10.0, 12.0], 20), 30.0]
+    scores, baseline = rolling_zscore(values, window=10, min_periods=5)
+    
+    assert np.isnan(scores[:5]).all()
+    assert baseline[-1] == pytest.approx(11.0)
+    assert scores[-1] == pytest.approx((30.0 - 11.0) / np.std(values[-11:-1], ddof=1))
+
+def test_mad_score_is_robust_to_extremes():
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 1000.0])
+    scores, baseline = mad_score(values)
+    
+    # 중앙값 3.5, MAD 1.5는 극단값 하나에 영향을 받지 않음
+    assert baseline[0] == 3.5
+    assert scores[0] == pytest.approx(0.6745 * (1.0 - 3.5) / 1.5)
+    assert scores[-1] > 100
+
+def test_constant_series_has_no_anomalies():
+    df = pd.DataFrame({"Year": [2021] * 5, "Month": [1] * 5, "AvgTemp_C": [27.0] * 5})
+    
+    for method in ["zscore", "seasonal", "rolling", "mad"]:
+        assert detect_anomalies(df, "AvgTemp_C", method=method).empty
+    with pytest.raises(ValueError):
+        detect_anomalies(df, "AvgTemp_C", method="unknown")
+
+def test_anomaly_table_ranks_all_measures(monthly_df):
+    table = anomaly_table(monthly_df, ["AvgTemp_C", "Precipitation_mm"], method="mad", top=3)
+    
+    assert len(table) == 3
+    assert table["Measure"].iloc[0] == "Precipitation_mm"
+    assert (table["Score"].abs().diff().dropna() <= 0).all()
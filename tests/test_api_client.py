@@ -0,0 +1,93 @@
+"""
+예보 조회 테스트 (benchmarks/mock_nws_server.py의 로컬 모의 NWS 서버 사용)
+"""
+import pandas as pd
+import pytest
+
+from benchmarks.mock_nws_server import start_mock_server
+from src import api_client
+from src.api_client import ForecastCache, PointsCache, WeatherAPI, forecast_to_dataframe, get_guam_forecast
+
+class FailingArchive:
+    """저장할 때마다 디스크 오류를 내는 아카이브"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def append_forecast(self, *args, **kwargs):
+        self.calls += 1
+        raise OSError("No space left on device")
+
+@pytest.fixture
+def mock_weather_api(monkeypatch):
+    server, base_url = start_mock_server()
+    monkeypatch.setattr(api_client, "WeatherAPI",
+                        lambda: WeatherAPI(base_url, cache=ForecastCache(), points_cache=PointsCache(None)))
+    yield
+    server.shutdown()
+
+def test_archive_failure_does_not_abort_forecast(mock_weather_api, capsys):
+    archive = FailingArchive()
+    forecast = get_guam_forecast(archive=archive)
+    
+    assert archive.calls == 1
+    assert forecast is not None and not forecast.empty
+    assert "예보 아카이브 저장 실패" in capsys.readouterr().out
+
+def test_location_info_has_same_shape_on_cache_hit_and_miss():
+    server, base_url = start_mock_server()
+    try:
+        client = WeatherAPI(base_url, cache=ForecastCache(), points_cache=PointsCache(None))
+        miss = client.get_location_info(13.4443, 144.7937)
+        requests_after_miss = server.request_count
+        hit = client.get_location_info(13.4443, 144.7937)
+    finally:
+        server.shutdown()
+    
+    assert server.request_count == requests_after_miss
+    assert miss == hit
+    assert set(miss["properties"]) == set(api_client.POINTS_PROPERTIES)
+
+def period(start, is_daytime, temperature, unit="F", precip=None, short="Showers"):
+    return {
+        "startTime": start, "isDaytime": is_daytime, "temperature": temperature, "temperatureUnit": unit,
+        "windSpeed": "10 mph" if is_daytime else "5 mph", "windDirection": "E",
+        "shortForecast": short, "probabilityOfPrecipitation": {"value": precip}
+    }
+
+def test_forecast_to_dataframe_pairs_day_and_night_by_date():
+    periods = [
+        # "Tonight"으로 시작하는 응답: 첫날은 낮 period가 없으므로 제외
+        period("2021-03-01T18:00:00+10:00", False, 77, precip=20),
+        period("2021-03-02T06:00:00+10:00", True, 86, precip=30, short="Sunny"),
+        period("2021-03-02T18:00:00+10:00", False, 25, unit="C", precip=60),
+        period("2021-03-03T06:00:00+10:00", True, 88, precip=None, short="Cloudy"),
+        period("2021-03-03T18:00:00+10:00", False, 78, precip=10)
+    ]
+    df = forecast_to_dataframe({"properties": {"periods": periods}})
+    
+    assert df['Date'].tolist() == [pd.Timestamp("2021-03-02"), pd.Timestamp("2021-03-03")]
+    assert df['High (°F)'].tolist() == [86.0, 88.0]
+    assert df['Low (°F)'].tolist() == pytest.approx([77.0, 78.0])
+    assert df['High (°C)'].tolist() == pytest.approx([30.0, 31.1111], abs=1e-3)
+    assert df['Precip Prob (%)'].tolist() == [60.0, 10.0]
+    assert df['Short Forecast'].tolist() == ["Sunny", "Cloudy"]
+    assert df['Wind Speed'].tolist() == ["10 mph", "10 mph"]
+
+def test_forecast_to_dataframe_matches_client_on_mock_response():
+    server, base_url = start_mock_server(period_count=14)
+    try:
+        client = WeatherAPI(base_url, cache=ForecastCache(), points_cache=PointsCache(None))
+        forecast_data = client.get_forecast_data(13.4443, 144.7937)
+    finally:
+        server.shutdown()
+    
+    df = client.process_forecast_data(forecast_data)
+    
+    assert len(df) == 7
+    assert (df['High (°C)'] > df['Low (°C)']).all()
+    assert df['Date'].is_monotonic_increasing
+
+@pytest.mark.parametrize("forecast_data", [None, {}, {"properties": {}}])
+def test_forecast_to_dataframe_rejects_missing_periods(forecast_data):
+    assert forecast_to_dataframe(forecast_data) is None
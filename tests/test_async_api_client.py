@@ -0,0 +1,70 @@
+"""
+여러 지점 동시 예보 조회 테스트 (benchmarks/mock_nws_server.py의 로컬 모의 NWS 서버 사용)
+"""
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.mock_nws_server import start_mock_server
+from src.api_client import PointsCache
+from src.async_api_client import AsyncWeatherAPI
+
+LOCATIONS = {
+    "Guam": (13.4443, 144.7937),
+    "Saipan": (15.1850, 145.7467),
+    "Broken": (9.5144, 138.1292)
+}
+
+@pytest.fixture
+def mock_server():
+    server, base_url = start_mock_server()
+    yield server, base_url
+    server.shutdown()
+
+def make_client(base_url, points_cache):
+    # 격자점 캐시에 JSON이 아닌 응답을 주는 예보 URL을 미리 넣어 한 지점만 실패하게 만듦
+    latitude, longitude = LOCATIONS["Broken"]
+    points_cache.put(latitude, longitude, {"forecast": f"{base_url}/malformed"})
+    return AsyncWeatherAPI(base_url, retries=0, points_cache=points_cache)
+
+def test_one_malformed_location_does_not_abort_batch(mock_server, capsys):
+    server, base_url = mock_server
+    client = make_client(base_url, PointsCache(None))
+    
+    responses = asyncio.run(client.fetch_forecasts(LOCATIONS))
+    
+    assert responses["Broken"] is None
+    assert responses["Guam"]["properties"]["periods"]
+    assert responses["Saipan"]["properties"]["periods"]
+    assert "Broken 응답 JSON 해석 실패" in capsys.readouterr().out
+
+def test_forecast_dataframe_skips_failed_location(mock_server):
+    server, base_url = mock_server
+    client = make_client(base_url, PointsCache(None))
+    
+    df = client.get_forecasts(LOCATIONS)
+    
+    assert set(df["Location"]) == {"Guam", "Saipan"}
+    assert df.loc[df["Location"] == "Guam", "Latitude"].eq(LOCATIONS["Guam"][0]).all()
+
+def test_new_points_are_written_once_after_gather(mock_server, tmp_path, monkeypatch):
+    server, base_url = mock_server
+    path = tmp_path / "points.json"
+    points_cache = PointsCache(str(path))
+    client = make_client(base_url, points_cache)
+    
+    writes = []
+    put_many = points_cache.put_many
+    monkeypatch.setattr(points_cache, "put_many", lambda entries: writes.append(dict(entries)) or put_many(entries))
+    asyncio.run(client.fetch_forecasts(LOCATIONS))
+    
+    assert len(writes) == 1
+    assert set(writes[0]) == {LOCATIONS["Guam"], LOCATIONS["Saipan"]}
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved[PointsCache.key(*LOCATIONS["Guam"])]["gridId"] == "MOCK"
+    
+    # 두 번째 조회는 격자점 캐시를 사용하므로 points 요청 없이 예보만 요청
+    requests_before = server.request_count
+    asyncio.run(client.fetch_forecasts(LOCATIONS))
+    assert server.request_count - requests_before == len(LOCATIONS)
@@ -0,0 +1,31 @@
+"""
+평년값 캐시와 예보 비교 테스트
+"""
+import math
+import pandas as pd
+import pytest
+
+from src.api_client import compare_with_historical
+from src.climatology import Climatology, get_climatology
+
+def test_filtered_frames_with_same_length_use_separate_climatologies(weather_df):
+    """data_version이 복사된 같은 길이의 부분 DataFrame끼리 평년값 엔진을 공유하지 않음"""
+    year_2021 = weather_df[weather_df["Year"] == 2021]
+    year_2022 = weather_df[weather_df["Year"] == 2022]
+    assert len(year_2021) == len(year_2022)
+    
+    first = get_climatology(year_2021, ["Average"])
+    second = get_climatology(year_2022, ["Average"])
+    assert first is not second
+    assert second.dates[0] == pd.Timestamp("2022-01-01")
+
+@pytest.mark.filterwarnings("ignore:Mean of empty slice")
+def test_compare_with_historical_uses_given_empty_climatology(weather_df):
+    """길이가 0인 Climatology도 호출자가 준 것을 그대로 사용 (새로 계산하지 않음)"""
+    forecast = pd.DataFrame({"Date": ["2024-01-01", "2024-01-02"], "High (°C)": [30.0, 31.0], "Low (°C)": [24.0, 25.0]})
+    empty = Climatology(weather_df.iloc[:0], ["Maximum", "Minimum"])
+    assert len(empty) == 0
+    
+    comparison = compare_with_historical(forecast, weather_df, climatology=empty)
+    assert math.isnan(comparison["과거 평균 최고기온"])
+    assert not math.isnan(compare_with_historical(forecast, weather_df)["과거 평균 최고기온"])
@@ -0,0 +1,102 @@
+"""
+CSV 적재/전처리, 증분 저장소와 data_dir별 캐시 테스트
+"""
+import os
+import shutil
+
+import pandas as pd
+
+from conftest import ROOT_DIR
+from src.data_processing import (
+    CALENDAR_DTYPES,
+    add_calendar_columns,
+    compact_weather_frame,
+    data_cache_dir,
+    load_all_csv_files,
+    load_and_preprocess_csv_files,
+    load_processed_data,
+    memory_footprint_report,
+    read_processed_store,
+    update_processed_store
+)
+
+def _copy_months(target, names):
+    os.makedirs(target, exist_ok=True)
+    for name in names:
+        shutil.copy(os.path.join(ROOT_DIR, "data", name), target)
+    return str(target)
+
+def test_update_processed_store_reingests_only_changed_files(tmp_path):
+    data_dir = _copy_months(tmp_path / "data", ["2021_01.csv", "2021_02.csv", "2021_03.csv"])
+    store_dir = str(tmp_path / "store")
+    
+    assert update_processed_store(data_dir, store_dir) == (["2021_01.csv", "2021_02.csv", "2021_03.csv"], [])
+    assert update_processed_store(data_dir, store_dir) == ([], [])
+    
+    # 수정시각만 바뀐 파일 하나와 삭제된 파일 하나
+    path = os.path.join(data_dir, "2021_02.csv")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    os.remove(os.path.join(data_dir, "2021_03.csv"))
+    assert update_processed_store(data_dir, store_dir) == (["2021_02.csv"], ["2021_03.csv"])
+    assert sorted(read_processed_store(store_dir)["Month"].unique()) == [1, 2]
+
+def test_other_data_dir_keeps_its_own_cache(tmp_path):
+    first = _copy_months(tmp_path / "first", ["2021_01.csv", "2021_02.csv"])
+    second = _copy_months(tmp_path / "second", ["2022_05.csv"])
+    cache_dir = str(tmp_path / "cache")
+    
+    assert len(load_processed_data(first, cache_dir=cache_dir)) == 59
+    assert len(load_processed_data(second, cache_dir=cache_dir)) == 31
+    assert data_cache_dir(first, cache_dir) != data_cache_dir(second, cache_dir)
+    
+    # second를 읽은 뒤에도 first의 조각은 그대로 (다시 적재할 파일 없음)
+    store_dir = os.path.join(data_cache_dir(first, cache_dir), "store")
+    assert update_processed_store(first, store_dir) == ([], [])
+    assert len(read_processed_store(store_dir)) == 59
+
+def test_shared_store_dir_is_rebuilt_for_another_data_dir(tmp_path):
+    first = _copy_months(tmp_path / "first", ["2021_01.csv"])
+    second = _copy_months(tmp_path / "second", ["2022_05.csv"])
+    store_dir = str(tmp_path / "store")
+    
+    update_processed_store(first, store_dir)
+    assert update_processed_store(second, store_dir) == (["2022_05.csv"], [])
+    assert read_processed_store(store_dir)["Year"].unique().tolist() == [2022]
+
+def test_parallel_parsing_matches_serial(tmp_path):
+    data_dir = _copy_months(tmp_path / "data", ["2020_02.csv", "2021_01.csv", "2021_12.csv", "2022_05.csv"])
+    
+    serial, serial_files = load_and_preprocess_csv_files(data_dir, workers=1)
+    parallel, parallel_files = load_and_preprocess_csv_files(data_dir, workers=2)
+    
+    # 파일 순서(월 순서)와 값이 모두 같아야 함
+    assert parallel_files == serial_files
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert serial["Date"].is_monotonic_increasing and len(serial) == 29 + 31 + 31 + 31
+    
+    raw_serial, _ = load_all_csv_files(data_dir, workers=1)
+    raw_parallel, _ = load_all_csv_files(data_dir, workers=2)
+    pd.testing.assert_frame_equal(raw_parallel, raw_serial)
+
+def test_compact_frame_shrinks_dtypes_and_keeps_values(weather_df):
+    compact = compact_weather_frame(weather_df)
+    
+    for column, dtype in CALENDAR_DTYPES.items():
+        assert compact[column].dtype == dtype
+    assert all(compact[column].dtype == "float32" for column in ["Maximum", "Minimum", "Average", "Precipitation"])
+    pd.testing.assert_frame_equal(compact.astype(weather_df.dtypes.to_dict()), weather_df, check_exact=False, rtol=1e-6)
+    assert compact.memory_usage(deep=True).sum() < weather_df.memory_usage(deep=True).sum()
+    
+    report = memory_footprint_report(weather_df)
+    assert report.loc["Total", "ratio"] < 1
+    assert report.loc["Total", "compact_lazy"] < report.loc["Total", "compact"]
+
+def test_lazy_calendar_columns_are_restored_from_date(weather_df):
+    lazy = compact_weather_frame(weather_df, lazy_calendar=True)
+    assert not set(CALENDAR_DTYPES) & set(lazy.columns)
+    
+    restored = add_calendar_columns(lazy)
+    for column, dtype in CALENDAR_DTYPES.items():
+        assert restored[column].dtype == dtype
+        assert (restored[column].astype("int64") == weather_df[column].astype("int64")).all()
@@ -0,0 +1,78 @@
+"""
+대시보드 그래프 다운샘플링 테스트
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.downsampling import (
+    box_statistics,
+    downsample_line,
+    estimate_payload_bytes,
+    histogram_bins,
+    lttb_indices,
+    payload_bytes
+)
+
+def test_lttb_keeps_endpoints_and_exactly_n_out_points():
+    rng = np.random.default_rng(0)
+    x = np.arange(10_000, dtype=float)
+    y = np.cumsum(rng.normal(size=len(x)))
+    y[4321] = 1_000.0   # 튀는 값은 남아 있어야 함
+    
+    indices = lttb_indices(x, y, n_out=500)
+    
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+    assert (np.diff(indices) > 0).all()
+    assert 4321 in indices
+
+@pytest.mark.parametrize("n_out", [2, 100, 150])
+def test_lttb_returns_everything_when_nothing_to_drop(n_out):
+    assert lttb_indices(np.arange(100), np.zeros(100), n_out=n_out).tolist() == list(range(100))
+
+def test_downsample_line_keeps_dates_and_threshold():
+    dates = pd.date_range("2000-01-01", periods=6000).to_numpy()
+    values = np.sin(np.arange(6000) / 50)
+    
+    short_dates, short_values = downsample_line(dates[:100], values[:100])
+    assert len(short_dates) == 100
+    
+    x, y = downsample_line(dates, values, threshold=5000, n_out=2000)
+    assert len(x) == 2000 and x.dtype == dates.dtype
+    assert x[0] == dates[0] and x[-1] == dates[-1]
+    assert np.isin(y, values).all()
+
+def test_box_statistics_matches_plotly_fences():
+    # Plotly 기본값: 선형 보간 사분위수(quartilemethod="linear"), 울타리는 1.5·IQR 안의 가장 바깥 데이터 값
+    values = np.array([20.0, 24.1, 25.0, 25.5, 26.0, 26.2, 26.9, 27.4, 28.0, 29.9, 33.5, np.nan])
+    box = box_statistics(values)
+    
+    data = values[~np.isnan(values)]
+    q1, median, q3 = np.percentile(data, [25, 50, 75])
+    low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    assert (box['q1'], box['median'], box['q3']) == (q1, median, q3)
+    assert box['lowerfence'] == min(value for value in data if value >= low)
+    assert box['upperfence'] == max(value for value in data if value <= high)
+    assert box['outliers'].tolist() == sorted(value for value in data if value < low or value > high)
+    assert box['outliers'].tolist() == [20.0, 33.5]
+    assert box['mean'] == pytest.approx(data.mean())
+    assert box_statistics([np.nan]) is None
+
+def test_histogram_bins_ignore_nan():
+    counts, edges = histogram_bins([1.0, 2.0, np.nan, 3.0], nbins=2)
+    assert counts.tolist() == [1, 2] and len(edges) == 3
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_estimate_payload_bytes_is_close_to_plotly_json(dtype):
+    import plotly.graph_objects as go
+    
+    n = 7300
+    data = pd.DataFrame({
+        'Date': pd.date_range("2000-01-01", periods=n),
+        'AvgTemp_C': np.random.default_rng(0).normal(27, 1, n).astype(dtype)
+    })
+    empty = payload_bytes(go.Figure(go.Scatter(x=data['Date'][:0], y=data['AvgTemp_C'][:0])))
+    full = payload_bytes(go.Figure(go.Scatter(x=data['Date'], y=data['AvgTemp_C'])))
+    
+    assert estimate_payload_bytes(data) == pytest.approx(full - empty, rel=0.1)
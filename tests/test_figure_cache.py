@@ -0,0 +1,71 @@
+"""
+그래프 캐시 키 테스트 (그리기 코드가 바뀌면 새로 그려야 함)
+"""
+import importlib.util
+
+import pandas as pd
+
+from src import figure_cache, report, visualization
+from src.figure_cache import FigureCache, cached_plotly_json, code_version
+
+CHART_MODULE = '''
+import json
+
+LABEL = "{label}"
+
+def _helper(values):
+    return [value * {scale} for value in values]
+
+def build(values):
+    return json.dumps({{"label": LABEL, "values": _helper(values)}})
+'''
+
+def load_chart_module(tmp_path, name, label="temperature", scale=1):
+    path = tmp_path / f"{name}.py"
+    path.write_text(CHART_MODULE.format(label=label, scale=scale), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+class FakeFigure:
+    """to_json()만 있는 Plotly Figure 대용"""
+    
+    def __init__(self, payload):
+        self.payload = payload
+    
+    def to_json(self):
+        return self.payload
+
+def test_code_version_changes_with_helpers_and_constants(tmp_path):
+    base = code_version(load_chart_module(tmp_path, "chart_a").build)
+    
+    assert code_version(load_chart_module(tmp_path, "chart_b").build) == base
+    # build 자체의 바이트코드는 같고 보조 함수/모듈 상수만 바뀐 경우
+    assert code_version(load_chart_module(tmp_path, "chart_c", scale=2).build) != base
+    assert code_version(load_chart_module(tmp_path, "chart_d", label="rain").build) != base
+
+def test_report_fingerprint_follows_visualization_source(monkeypatch):
+    data = pd.DataFrame({"Year": [2021], "Maximum": [31.0]})
+    before = report.chart_fingerprint("yearly_summary", data, (15, 5), "draw_yearly_summary")
+    
+    # visualization.py 소스가 바뀐 경우 (보조 함수 _draw_yearly_temperature 수정 등)
+    source_digest = figure_cache._source_digest
+    monkeypatch.setattr(figure_cache, "_source_digest",
+                        lambda path: "edited" if path == visualization.__file__ else source_digest(path))
+    
+    assert report.chart_fingerprint("yearly_summary", data, (15, 5), "draw_yearly_summary") != before
+
+def test_cached_plotly_json_rebuilds_when_version_changes(tmp_path):
+    cache = FigureCache(None)
+    values = pd.Series([1.0, 2.0], name="values")
+    
+    def show(module):
+        return cached_plotly_json(cache, "chart", values, lambda: FakeFigure(module.build(values.tolist())),
+                                  version=code_version(module.build))
+    
+    old = load_chart_module(tmp_path, "chart_old")
+    first = show(old)
+    
+    assert show(old) == first and cache.hits == 1
+    assert '"values": [10.0, 20.0]' in show(load_chart_module(tmp_path, "chart_new", scale=10))
@@ -0,0 +1,67 @@
+"""
+예보 스냅샷 아카이브 테스트
+"""
+import os
+
+import pandas as pd
+
+from src.forecast_archive import COMPACTION_MANIFEST, ForecastArchive
+
+def make_forecast(dates, high=30.0, low=25.0):
+    """forecast_to_dataframe 형식의 예보"""
+    return pd.DataFrame({
+        'Date': pd.to_datetime(dates),
+        'High (°C)': high,
+        'Low (°C)': low,
+        'Precip Prob (%)': 40.0,
+        'Short Forecast': "Scattered Showers"
+    })
+
+def test_append_is_idempotent_and_snapshot_is_as_of(tmp_path):
+    archive = ForecastArchive(str(tmp_path))
+    assert archive.append(make_forecast(["2021-03-02"], high=30.0), "Guam", "2021-03-01T00:00:00Z")
+    assert archive.append(make_forecast(["2021-03-02"], high=30.0), "Guam", "2021-03-01T00:00:00Z") is None
+    archive.append(make_forecast(["2021-03-02"], high=31.0), "Guam", "2021-03-01T12:00:00Z")
+    
+    assert len(archive.read(location="Guam")) == 2
+    assert archive.latest_forecast("2021-03-02")["high_c"].tolist() == [31.0]
+    assert archive.latest_forecast("2021-03-02", as_of="2021-03-01T06:00:00Z")["high_c"].tolist() == [30.0]
+
+def test_forecast_error_lead_days_use_local_issue_date(tmp_path):
+    archive = ForecastArchive(str(tmp_path))
+    # UTC로는 3월 1일 22시지만 괌(UTC+10) 현지로는 3월 2일 08시 발표
+    archive.append(make_forecast(["2021-03-02", "2021-03-03"]), "Guam", "2021-03-01T22:00:00Z")
+    observed = pd.DataFrame({
+        'Date': pd.to_datetime(["2021-03-02", "2021-03-03"]),
+        'Maximum': [29.0, 31.0],
+        'Minimum': [24.0, 26.0]
+    })
+    
+    errors = archive.forecast_error(observed).sort_values('valid_date')
+    
+    assert errors['lead_days'].tolist() == [0, 1]
+    assert errors['high_error'].tolist() == [1.0, -1.0]
+    assert archive.forecast_error(observed, timezone="UTC")['lead_days'].sort_values().tolist() == [1, 2]
+
+def test_compact_keeps_original_snapshots(tmp_path):
+    archive = ForecastArchive(str(tmp_path))
+    for hour in (0, 6, 12):
+        archive.append(make_forecast(["2021-03-02", "2021-03-03"], high=30.0 + hour), "Guam", f"2021-03-01T{hour:02d}:00:00Z")
+    partition_dir = os.path.join(str(tmp_path), "location=Guam", "issue_month=2021-03")
+    originals = sorted(os.listdir(partition_dir))
+    before = archive.read(location="Guam").sort_values(["valid_date", "issue_time"]).reset_index(drop=True)
+    
+    # 다음 달 첫 스냅샷을 추가하면 3월 파티션이 합쳐짐
+    archive.append(make_forecast(["2021-04-02"]), "Guam", "2021-04-01T00:00:00Z")
+    
+    assert set(originals) < set(os.listdir(partition_dir))
+    assert COMPACTION_MANIFEST in os.listdir(partition_dir)
+    after = archive.read(location="Guam", end="2021-03-31").sort_values(["valid_date", "issue_time"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(before, after)
+    
+    # 합친 뒤에 추가된 늦은 스냅샷도 읽히고, 다시 합쳐도 행이 중복되지 않음
+    archive.append(make_forecast(["2021-03-04"]), "Guam", "2021-03-02T00:00:00Z")
+    assert len(archive.read(location="Guam", end="2021-03-31")) == 7
+    assert len(archive.compact(before_month="2021-04")) == 1
+    assert len(archive.read(location="Guam", end="2021-03-31")) == 7
+    assert set(originals) < set(os.listdir(partition_dir))
@@ -0,0 +1,94 @@
+"""
+성능 계측 테스트
+"""
+import json
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from conftest import ROOT_DIR
+from src import instrumentation
+from src.data_processing import load_and_preprocess_csv_files
+from src.instrumentation import REGISTRY, export_json, export_prometheus, instrument, span, stage_table
+
+@pytest.fixture
+def profiling():
+    """계측을 켜고 기록을 비운 뒤, 테스트가 끝나면 원래 상태로 되돌림"""
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.reset()
+    instrumentation.enable()
+    yield REGISTRY
+    instrumentation.reset()
+    if not was_enabled:
+        instrumentation.disable()
+
+@instrument(stage="test.make_frame")
+def make_frame(rows):
+    return pd.DataFrame({"value": range(rows)})
+
+@instrument(stage="test.count_input", rows="input")
+def count_input(df):
+    with span("test.inner") as inner:
+        inner.add_bytes(100)
+    return len(df)
+
+def test_disabled_instrumentation_records_nothing():
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.disable()
+    instrumentation.reset()
+    try:
+        assert len(make_frame(3)) == 3
+        with span("test.disabled") as active:
+            active.add_rows(5)
+        assert REGISTRY.stages() == {}
+    finally:
+        if was_enabled:
+            instrumentation.enable()
+
+def test_rows_nesting_and_bytes_propagation(profiling):
+    make_frame(3)
+    make_frame(4)
+    count_input(make_frame(2))
+    
+    stages = profiling.stages()
+    assert stages["test.make_frame"]["calls"] == 3
+    assert stages["test.make_frame"]["rows_total"] == 9
+    assert stages["test.count_input"]["rows_total"] == 2
+    # 안쪽 구간에서 읽은 바이트는 바깥 구간에도 더해짐
+    assert stages["test.inner"]["bytes_read_total"] == 100
+    assert stages["test.count_input"]["bytes_read_total"] == 100
+    assert {item["parent"] for item in profiling.recent() if item["stage"] == "test.inner"} == {"test.count_input"}
+
+def test_file_reads_add_up_to_loading_stage(profiling, tmp_path):
+    names = ["2021_01.csv", "2021_02.csv"]
+    for name in names:
+        shutil.copy(os.path.join(ROOT_DIR, "data", name), tmp_path)
+    
+    df, _ = load_and_preprocess_csv_files(str(tmp_path))
+    
+    stages = profiling.stages()
+    expected_bytes = sum(os.path.getsize(tmp_path / name) for name in names)
+    assert stages["data_processing.read_weather_csv"]["calls"] == 2
+    assert stages["data_processing.load_and_preprocess_csv_files"]["bytes_read_total"] == expected_bytes
+    assert stages["data_processing.load_and_preprocess_csv_files"]["rows_total"] == len(df) == 59
+
+def test_exports(profiling, tmp_path):
+    make_frame(3)
+    with span('test."quoted"'):
+        pass
+    
+    data = json.loads(export_json(str(tmp_path / "metrics.json")))
+    assert data["enabled"] is True
+    assert data["stages"]["test.make_frame"]["rows_total"] == 3
+    assert (tmp_path / "metrics.json").exists()
+    
+    text = export_prometheus()
+    assert 'guam_weather_stage_calls_total{stage="test.make_frame"} 1' in text
+    assert 'stage="test.\\"quoted\\""' in text
+    assert "# TYPE guam_weather_stage_seconds_total counter" in text
+    
+    table = stage_table()
+    assert set(table.index) == {"test.make_frame", 'test."quoted"'}
+    assert table["seconds_total"].is_monotonic_decreasing
@@ -0,0 +1,20 @@
+"""
+그래프 일괄 생성 명령줄 테스트
+"""
+import pytest
+
+from src import report
+
+@pytest.mark.parametrize("subdir", ["missing", "empty"])
+def test_main_exits_with_message_when_data_is_unavailable(subdir, tmp_path, monkeypatch, capsys):
+    data_dir = tmp_path / subdir
+    if subdir == "empty":
+        data_dir.mkdir()
+    # 저장소의 .cache를 건드리지 않도록 작업 디렉토리와 캐시 위치를 모두 임시 디렉토리로
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("sys.argv", ["report", "--data-dir", str(data_dir), "--cache-dir", str(tmp_path / "cache"),
+                                     "--output-dir", str(tmp_path / "out")])
+    
+    assert report.main() == 1
+    assert "데이터" in capsys.readouterr().out
+    assert not (tmp_path / "out").exists()
@@ -0,0 +1,58 @@
+"""
+SQLite 저장소 동기화/집계 테스트
+"""
+import os
+import pandas as pd
+import pytest
+
+from src.data_processing import get_monthly_summary, get_yearly_summary
+from src.sql_store import WeatherSQLStore
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """load 호출 횟수를 세는 저장소"""
+    store = WeatherSQLStore(str(tmp_path / "weather.sqlite"))
+    store.loads = 0
+    original_load = store.load
+    
+    def counting_load(df):
+        store.loads += 1
+        return original_load(df)
+    monkeypatch.setattr(store, "load", counting_load)
+    return store
+
+def test_sync_does_not_reload_for_same_version(weather_df, store):
+    store.sync(weather_df)
+    store.sync(weather_df)
+    get_yearly_summary(weather_df, store)
+    assert store.loads == 1
+
+def test_filtered_or_unversioned_frames_use_cube_without_reloading(weather_df, store):
+    """필터링한 DataFrame이나 버전 없는 DataFrame은 테이블을 바꾸지 않고 큐브로 계산"""
+    store.sync(weather_df)
+    assert get_yearly_summary(weather_df[weather_df["Year"] == 2022], store)["Year"].tolist() == [2022]
+    
+    unversioned = weather_df.copy()
+    unversioned.attrs = {}
+    for _ in range(3):
+        assert get_yearly_summary(unversioned, store)["Year"].tolist() == [2020, 2021, 2022]
+    assert store.loads == 1
+    
+    with pytest.raises(ValueError):
+        store.sync(unversioned)
+
+def test_unversioned_frame_never_creates_store(weather_df, tmp_path):
+    unversioned = weather_df.copy()
+    unversioned.attrs = {}
+    store = WeatherSQLStore(str(tmp_path / "never.sqlite"))
+    get_monthly_summary(unversioned, store)
+    assert not os.path.exists(store.path)
+
+def test_filters_match_cube_summary(weather_df, store):
+    """year/month 필터는 SQL WHERE로 계산해도 큐브 요약과 같음"""
+    sql = get_monthly_summary(weather_df, store, month=3)
+    cube = get_monthly_summary(weather_df, month=3)
+    pd.testing.assert_frame_equal(sql.reset_index(drop=True), cube.reset_index(drop=True),
+                                  check_dtype=False, check_exact=False)
+    assert store.count(year=2021, month=3) == 31
+    assert store.count(year=2021, conditions=[("Precipitation", ">", 0)]) < 365
@@ -0,0 +1,64 @@
+"""
+시간별 시계열(HourlySeries) 테스트
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.timeseries import HourlySeries, parse_iso_duration
+
+def reference_daily(series, tz):
+    """pandas로 계산한 현지 날짜별 최고/최저 (비교 기준)"""
+    local = series.to_series().tz_convert(tz)
+    grouped = local.groupby(local.index.tz_localize(None).normalize())
+    return grouped.max().astype(float), grouped.min().astype(float)
+
+def test_from_periods_converts_fahrenheit_and_fills_gaps():
+    periods = [
+        {"startTime": "2021-03-01T00:00:00+10:00", "temperature": 86, "temperatureUnit": "F"},
+        {"startTime": "2021-03-01T02:00:00+10:00", "temperature": 30, "temperatureUnit": "C"}
+    ]
+    series = HourlySeries.from_periods(periods, tz="Pacific/Guam")
+    
+    assert series.start == pd.Timestamp("2021-02-28T14:00:00Z")
+    np.testing.assert_allclose(series.values, [30.0, np.nan, 30.0])
+
+def test_from_grid_values_spreads_durations():
+    values = [
+        {"validTime": "2021-03-01T00:00:00+00:00/PT3H", "value": 26.0},
+        {"validTime": "2021-03-01T03:00:00+00:00/PT1H", "value": 27.0}
+    ]
+    series = HourlySeries.from_grid_values(values, unit="wmoUnit:degC")
+    
+    assert parse_iso_duration("P1DT6H") == pd.Timedelta(hours=30)
+    np.testing.assert_allclose(series.values, [26.0, 26.0, 26.0, 27.0])
+
+def test_resample_daily_uses_local_dates():
+    # UTC 14시부터 시작하면 괌(UTC+10) 현지로는 자정부터 하루 24칸
+    series = HourlySeries("2021-02-28T14:00:00Z", np.arange(48, dtype=float), tz="Pacific/Guam")
+    daily = series.resample_daily()
+    
+    assert daily['Date'].tolist() == [pd.Timestamp("2021-03-01"), pd.Timestamp("2021-03-02")]
+    assert daily['High (°C)'].tolist() == [23.0, 47.0]
+    assert daily['Low (°C)'].tolist() == [0.0, 24.0]
+
+@pytest.mark.parametrize("start", ["2021-03-13T05:00:00Z", "2021-11-06T04:00:00Z"])
+def test_resample_daily_handles_dst_transition_days(start):
+    # 뉴욕 서머타임 시작일(23시간)과 종료일(25시간)을 포함한 3일
+    rng = np.random.default_rng(0)
+    series = HourlySeries(start, rng.normal(20, 5, 72), tz="America/New_York")
+    daily = series.resample_daily()
+    highs, lows = reference_daily(series, "America/New_York")
+    
+    assert daily['Date'].tolist() == highs.index.tolist()
+    np.testing.assert_allclose(daily['High (°C)'], highs.to_numpy())
+    np.testing.assert_allclose(daily['Low (°C)'], lows.to_numpy())
+
+def test_resample_daily_min_count_drops_sparse_days():
+    values = np.full(48, np.nan)
+    values[:24] = 25.0
+    values[30] = 28.0
+    series = HourlySeries("2021-03-01T00:00:00Z", values)
+    
+    assert series.resample_daily(min_count=2)['High (°C)'].tolist() == [25.0]
+    assert series.resample_daily()['High (°C)'].tolist() == [25.0, 28.0]
@@ -0,0 +1,22 @@
+"""
+추세표 캐시 테스트
+"""
+import pytest
+
+from src.aggregates import build_aggregate_cube
+from src.trends import build_trend_table, get_trend_table, trend_for
+
+AGGREGATIONS = {"Average": "mean", "Precipitation": "sum"}
+
+def test_filtered_frames_with_same_length_use_separate_trend_tables(weather_df):
+    """data_version이 복사된 같은 길이의 부분 DataFrame끼리 추세표(와 그 큐브)를 공유하지 않음"""
+    january = weather_df[weather_df["Month"] == 1]
+    march = weather_df[weather_df["Month"] == 3]
+    assert len(january) == len(march)
+    
+    january_trend = trend_for(get_trend_table(january, AGGREGATIONS), "Average")
+    march_trend = trend_for(get_trend_table(march, AGGREGATIONS), "Average")
+    assert march_trend["slope"] != pytest.approx(january_trend["slope"])
+    
+    expected = trend_for(build_trend_table(build_aggregate_cube(march), AGGREGATIONS), "Average")
+    assert march_trend["slope"] == pytest.approx(expected["slope"])